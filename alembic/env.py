@@ -12,7 +12,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 # Importar Base e modelos
 from app.core.database import Base
-from app.models import User, Membro, Publicacao, Subgrupo
+from app.models import User, Membro, Publicacao, Subgrupo, Tombstone
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
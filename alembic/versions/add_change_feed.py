@@ -0,0 +1,47 @@
+"""Add tombstones table and (updated_at, id) indexes for the change feed
+
+Revision ID: add_change_feed
+Revises: add_new_fields_v2
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_change_feed'
+down_revision: Union[str, None] = 'add_new_fields_v2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Cria a tabela de tombstones e os índices do feed de alterações."""
+
+    op.create_table('tombstones',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('entity_type', sa.String(32), nullable=False),
+    sa.Column('entity_id', sa.Integer(), nullable=False),
+    sa.Column('deleted_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_tombstones_deleted_at_id', 'tombstones', ['deleted_at', 'id'])
+
+    # Leitura do feed em ordem de (updated_at, id) por tabela
+    op.create_index('ix_membros_updated_at_id', 'membros', ['updated_at', 'id'])
+    op.create_index('ix_subgrupo_updated_at_id', 'subgrupo', ['updated_at', 'id'])
+    op.create_index('ix_publicacao_updated_at_id', 'publicacao', ['updated_at', 'id'])
+
+
+def downgrade() -> None:
+    """Remove os índices e a tabela de tombstones."""
+
+    op.drop_index('ix_publicacao_updated_at_id', table_name='publicacao')
+    op.drop_index('ix_subgrupo_updated_at_id', table_name='subgrupo')
+    op.drop_index('ix_membros_updated_at_id', table_name='membros')
+
+    op.drop_index('ix_tombstones_deleted_at_id', table_name='tombstones')
+    op.drop_table('tombstones')
@@ -1,6 +1,8 @@
-from typing import Generator, Optional
-from fastapi import Depends, HTTPException, status, Query
+from typing import Any, AsyncIterable, Callable, Generator, List, Optional, Sequence, Type
+from fastapi import Depends, HTTPException, status, Query, Request
+from fastapi.responses import StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
@@ -8,6 +10,10 @@ from app.core.config import settings
 from app.core.security import verify_token
 from app.crud.user import user as user_crud
 from app.models.user import User
+from app.schemas.fieldsets import Fieldset
+from app.schemas.pagination import decode_cursor
+from app.utils.responses import FastJSONResponse
+from app.utils.streaming import iter_json_array
 
 # Security scheme para JWT
 security = HTTPBearer()
@@ -24,8 +30,17 @@ class PaginationParams:
                 ge=1,
                 le=settings.MAX_PAGE_SIZE,
                 description="Número máximo de registros a retornar"
-            )
+            ),
+            cursor: Optional[str] = Query(
+                None,
+                description="Cursor da próxima página (campo 'cursor' da resposta anterior); substitui skip"
+            ),
     ):
+        if cursor is not None:
+            try:
+                skip = decode_cursor(cursor)
+            except ValueError as e:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
         self.skip = skip
         self.limit = limit
 
@@ -35,9 +50,122 @@ def get_pagination_params() -> PaginationParams:
     return PaginationParams()
 
 
-async def get_db_session() -> AsyncSession:
+def get_batch_ids(
+        ids: Optional[str] = Query(
+            None,
+            description=(
+                f"Busca em lote: até {settings.BATCH_MAX_IDS} IDs separados por vírgula. "
+                "A resposta traz os registros indexados por ID (null = não encontrado)"
+            )
+        ),
+) -> Optional[List[int]]:
+    """Dependency para o parâmetro ``ids`` (sem duplicatas, na ordem pedida)."""
+    if ids is None:
+        return None
+    try:
+        parsed = list(dict.fromkeys(int(value) for value in ids.split(",") if value.strip()))
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="'ids' deve ser uma lista de inteiros separados por vírgula"
+        )
+    if not parsed:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Informe ao menos um ID em 'ids'")
+    if len(parsed) > settings.BATCH_MAX_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"No máximo {settings.BATCH_MAX_IDS} IDs por requisição"
+        )
+    return parsed
+
+
+def sparse_fields(schema: Type[BaseModel], *, expand: bool = True) -> Callable[..., Optional[Fieldset]]:
+    """
+    Dependency factory para os parâmetros ``fields`` (sparse fieldsets) e
+    ``include`` (relações expandidas) de uma rota que responde com ``schema``
+    (ou ``Page[schema]``). ``expand`` define se, sem ``include``, todas as
+    relações são expandidas (True) ou nenhuma (False, listagens).
+    """
+    default = "todas" if expand else "nenhuma"
+
+    def dependency(
+            fields: Optional[str] = Query(
+                None,
+                description="Campos a retornar, separados por vírgula (ex: id,nome). Padrão: todos"
+            ),
+            include: Optional[str] = Query(
+                None,
+                description=f"Relações a expandir, separadas por vírgula. Padrão: {default}"
+            ),
+    ) -> Optional[Fieldset]:
+        try:
+            return Fieldset.from_query(schema, fields, include, expand=expand)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return dependency
+
+
+def list_responses(*, batch: bool = True, stream: bool = False) -> dict:
+    """
+    ``responses`` (OpenAPI) de uma listagem com ``sparse_fields(expand=False)``:
+    o ``response_model`` descreve a página padrão, e a descrição, as formas
+    que a seleção produz (servidas sem passar pelo ``response_model``).
+    """
+    description = (
+        "Página com os campos simples de cada item. Com fields/include, os itens "
+        "trazem só os campos pedidos mais as relações incluídas"
+    )
+    if batch:
+        description += '; com ids, {"items": {"<id>": item | null}, "not_found": [<id>, ...]}'
+    if stream:
+        description += "; com stream=true, um array JSON de itens"
+    return {200: {"description": description}}
+
+
+def fields_load_options(crud_obj: Any, fieldset: Optional[Fieldset]) -> Optional[list]:
+    """Plano de carregamento SQL da seleção (None = carregamento padrão da rota)."""
+    if fieldset is None:
+        return None
+    columns, relations = fieldset.load_plan(crud_obj.model)
+    return crud_obj.load_options(columns=columns, relations=relations)
+
+
+def render_fields(content: Any, fieldset: Optional[Fieldset]) -> Any:
+    """
+    Resposta de uma rota com ``fields``: sem seleção (ou com a seleção padrão
+    da listagem) devolve ``content`` para o ``response_model`` da rota; com
+    seleção serializa só os campos pedidos.
+    """
+    if fieldset is None or fieldset.default:
+        return content
+    return FastJSONResponse(fieldset.dump(content))
+
+
+def render_batch(ids: Sequence[int], items: Sequence[Any], fieldset: Fieldset) -> FastJSONResponse:
+    """
+    Resposta da busca em lote: ``items`` indexado por ID, com ``null`` (e o
+    ID em ``not_found``) para os que não existem.
+    """
+    by_id = {item["id"]: item for item in fieldset.dump({"items": items})["items"]}
+    return FastJSONResponse({
+        "items": {str(id_): by_id.get(id_) for id_ in ids},
+        "not_found": [id_ for id_ in ids if id_ not in by_id],
+    })
+
+
+def stream_fields(items: AsyncIterable[Any], fieldset: Fieldset) -> StreamingResponse:
+    """Array JSON com os campos selecionados, serializado à medida que os itens chegam."""
+    return StreamingResponse(iter_json_array(items, fieldset.encode), media_type="application/json")
+
+
+# Métodos que não alteram dados (não entram na fila de escrita do SQLite)
+READ_ONLY_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+async def get_db_session(request: Request) -> AsyncSession:
     """Dependency para sessão do banco de dados."""
-    async for session in get_db():
+    async for session in get_db(write=request.method not in READ_ONLY_METHODS):
         yield session
 
 
@@ -1,6 +1,6 @@
 from fastapi import APIRouter
 
-from app.api.v1.endpoints import subgrupos, membros, publicacoes, auth, files
+from app.api.v1.endpoints import subgrupos, membros, publicacoes, auth, files, search, autocomplete, changes, coautoria
 
 api_router = APIRouter()
 
@@ -34,4 +34,28 @@ api_router.include_router(
     publicacoes.router,
     prefix="/publicacoes",
     tags=["publicações"]
-)
\ No newline at end of file
+)
+
+api_router.include_router(
+    search.router,
+    prefix="/search",
+    tags=["busca"]
+)
+
+api_router.include_router(
+    autocomplete.router,
+    prefix="/autocomplete",
+    tags=["busca"]
+)
+
+api_router.include_router(
+    coautoria.router,
+    prefix="/coautoria",
+    tags=["coautoria"]
+)
+
+api_router.include_router(
+    changes.router,
+    prefix="/changes",
+    tags=["sincronização"]
+)
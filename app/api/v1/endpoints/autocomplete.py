@@ -0,0 +1,28 @@
+from typing import Any, List
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import schemas
+from app.api import deps
+from app.core.config import settings
+from app.utils.autocomplete import autocomplete_index
+
+router = APIRouter()
+
+
+@router.get("/", response_model=List[schemas.AutocompleteItem])
+async def autocomplete(
+        *,
+        db: AsyncSession = Depends(deps.get_db_session),
+        q: str = Query(..., min_length=1, max_length=100, description="Início do nome/título (sem acentos também)"),
+        type: schemas.TipoAutocomplete = Query("membro", description="Tipo de recurso"),
+        limit: int = Query(10, ge=1, le=settings.AUTOCOMPLETE_MAX_RESULTS),
+) -> Any:
+    """
+    Sugestões para campos de busca (typeahead), por prefixo de palavra.
+
+    Respondida pelo índice em memória do worker, sem consultar o banco
+    (exceto na primeira chamada, se o índice ainda não foi montado).
+    """
+    await autocomplete_index.ensure_loaded(db)
+    return autocomplete_index.search(type, q, limit)
@@ -0,0 +1,40 @@
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud, schemas
+from app.api import deps
+from app.core.config import settings
+from app.schemas.changes import decode_change_cursor, encode_change_cursor
+
+router = APIRouter()
+
+
+@router.get("/", response_model=schemas.ChangeFeed)
+async def read_changes(
+        *,
+        db: AsyncSession = Depends(deps.get_db_session),
+        since: Optional[str] = Query(None, description="Cursor da última consulta (vazio = desde o início)"),
+        limit: int = Query(settings.CHANGES_PAGE_SIZE, ge=1, le=settings.CHANGES_MAX_PAGE_SIZE),
+) -> Any:
+    """
+    Feed de alterações para sincronização incremental.
+
+    Retorna membros, publicações e subgrupos criados ou alterados (inclusive
+    em associações) e as exclusões, em ordem, a partir de ``since``. O
+    cliente guarda o ``cursor`` da resposta e o envia na próxima consulta;
+    com ``has_more``, deve consultar de novo imediatamente.
+    """
+    try:
+        since_key = decode_change_cursor(since) if since else None
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    until = datetime.now(timezone.utc) - timedelta(seconds=settings.CHANGES_SAFETY_WINDOW)
+    changes, last, has_more = await crud.changes.changes(db, since=since_key, until=until, limit=limit)
+    return {
+        "changes": changes,
+        "cursor": encode_change_cursor(last) if last is not None else None,
+        "has_more": has_more,
+    }
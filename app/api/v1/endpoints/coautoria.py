@@ -0,0 +1,60 @@
+from typing import Any, List
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import schemas
+from app.api import deps
+from app.core.config import settings
+from app.utils.coauthorship import coauthorship_graph
+
+router = APIRouter()
+
+
+async def get_graph(db: AsyncSession = Depends(deps.get_db_session)):
+    """Grafo de coautoria do worker, montado na primeira chamada se preciso."""
+    await coauthorship_graph.ensure_loaded(db)
+    return coauthorship_graph
+
+
+def _check_membro(graph, membro_id: int) -> None:
+    if membro_id not in graph:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Membro não encontrado")
+
+
+@router.get("/", response_model=schemas.CoautoriaGraph)
+async def read_coautoria(
+        min_weight: int = Query(1, ge=1, description="Mínimo de publicações em comum por aresta"),
+        graph=Depends(get_graph),
+) -> Any:
+    """
+    Grafo de coautoria completo: membros com ao menos uma coautoria e as
+    arestas entre eles, com o número de publicações em comum.
+
+    Respondido pelo grafo em memória do worker, sem consultar o banco.
+    """
+    return graph.export(min_weight)
+
+
+@router.get("/{membro_id}", response_model=schemas.CoautoriaGraph)
+async def read_ego_network(
+        membro_id: int,
+        limit: int = Query(50, ge=1, le=settings.COAUTHORSHIP_MAX_NEIGHBORS, description="Máximo de coautores"),
+        graph=Depends(get_graph),
+) -> Any:
+    """
+    Ego-network de um membro: ele, seus principais coautores e as
+    coautorias entre todos eles.
+    """
+    _check_membro(graph, membro_id)
+    return graph.ego_network(membro_id, limit)
+
+
+@router.get("/{membro_id}/colaboradores", response_model=List[schemas.Colaborador])
+async def read_top_colaboradores(
+        membro_id: int,
+        limit: int = Query(10, ge=1, le=settings.COAUTHORSHIP_MAX_NEIGHBORS),
+        graph=Depends(get_graph),
+) -> Any:
+    """Coautores com mais publicações em comum com o membro."""
+    _check_membro(graph, membro_id)
+    return graph.top_collaborators(membro_id, limit)
@@ -9,45 +9,51 @@ from app.core.storage import save_file, delete_file
 router = APIRouter()
 
 
-@router.get("/", response_model=dict)
+@router.get("/", response_model=schemas.Page[schemas.Membro], responses=deps.list_responses())
 async def read_membros(
         pagination: deps.PaginationParams = Depends(),
         search: deps.SearchParams = Depends(),
         subgrupo_id: Optional[int] = Query(None, description="Filtrar por subgrupo"),
+        fieldset: Optional[deps.Fieldset] = Depends(deps.sparse_fields(schemas.MembroWithRelations, expand=False)),
+        ids: Optional[List[int]] = Depends(deps.get_batch_ids),
         db: AsyncSession = Depends(deps.get_db_session),
 ) -> Any:
     """
     Recuperar membros com paginação e filtros.
+
+    Com ``ids`` (busca em lote), retorna os membros indexados por ID em uma
+    única consulta, em vez de uma chamada a ``/membros/{id}`` por membro.
     """
+    options = deps.fields_load_options(crud.membro, fieldset)
+    if ids is not None:
+        membros = await crud.membro.get_many(db, ids=ids, options=options)
+        return deps.render_batch(ids, membros, fieldset)
     if subgrupo_id:
         membros, total = await crud.membro.get_by_subgrupo(
             db,
             subgrupo_id=subgrupo_id,
             skip=pagination.skip,
-            limit=pagination.limit
+            limit=pagination.limit,
+            options=options
         )
     elif search.query:
         membros, total = await crud.membro.search(
             db,
             query_text=search.query,
             skip=pagination.skip,
-            limit=pagination.limit
+            limit=pagination.limit,
+            options=options
         )
     else:
         membros, total = await crud.membro.get_multi(
             db,
             skip=pagination.skip,
             limit=pagination.limit,
-            load_relations=["subgrupos", "publicacoes"]
+            options=options
         )
 
-    return {
-        "items": [schemas.MembroWithRelations.model_validate(membro) for membro in membros],
-        "total": total,
-        "skip": pagination.skip,
-        "limit": pagination.limit,
-        "has_next": (pagination.skip + pagination.limit) < total
-    }
+    page = schemas.paginate(membros, total, pagination.skip, pagination.limit)
+    return deps.render_fields(page, fieldset)
 
 
 @router.post("/", response_model=schemas.Membro, status_code=status.HTTP_201_CREATED)
@@ -70,16 +76,24 @@ async def read_membro(
         *,
         db: AsyncSession = Depends(deps.get_db_session),
         id: int,
+        fieldset: Optional[deps.Fieldset] = Depends(deps.sparse_fields(schemas.MembroWithRelations)),
 ) -> Any:
     """
     Obter membro por ID.
     """
-    membro = await crud.membro.get(db, id=id, load_relations=["subgrupos", "publicacoes"])
+    membro = await crud.membro.get(
+        db,
+        id=id,
+        load_relations=["subgrupos", "publicacoes"],
+        options=deps.fields_load_options(crud.membro, fieldset)
+    )
     if not membro:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Membro não encontrado"
         )
+    if fieldset is not None:
+        return deps.render_fields(membro, fieldset)
     return schemas.MembroWithRelations.model_validate(membro)
 
 
@@ -253,12 +267,17 @@ async def upload_background_membro(
     return {"message": "Background atualizado com sucesso", "path": file_path}
 
 
-@router.get("/search/nome", response_model=dict)
+@router.get(
+    "/search/nome",
+    response_model=schemas.Page[schemas.Membro],
+    responses=deps.list_responses(batch=False)
+)
 async def search_membros_by_nome(
         *,
         db: AsyncSession = Depends(deps.get_db_session),
         nome: str = Query(..., min_length=2, description="Nome ou parte do nome para buscar"),
         pagination: deps.PaginationParams = Depends(),
+        fieldset: Optional[deps.Fieldset] = Depends(deps.sparse_fields(schemas.MembroWithRelations, expand=False)),
 ) -> Any:
     """
     Buscar membros por nome.
@@ -267,13 +286,9 @@ async def search_membros_by_nome(
         db,
         nome_partial=nome,
         skip=pagination.skip,
-        limit=pagination.limit
+        limit=pagination.limit,
+        options=deps.fields_load_options(crud.membro, fieldset)
     )
 
-    return {
-        "items": [schemas.MembroWithRelations.model_validate(membro) for membro in membros],
-        "total": total,
-        "skip": pagination.skip,
-        "limit": pagination.limit,
-        "has_next": (pagination.skip + pagination.limit) < total
-    }
\ No newline at end of file
+    page = schemas.paginate(membros, total, pagination.skip, pagination.limit)
+    return deps.render_fields(page, fieldset)
\ No newline at end of file
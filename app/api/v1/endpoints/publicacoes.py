@@ -4,44 +4,95 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import crud, schemas
 from app.api import deps
-from app.models.publicacao import TipoPublicacaoEnum
+from app.models.membro import Membro
+from app.models.publicacao import Publicacao, TipoPublicacaoEnum
+from app.models.subgrupo import Subgrupo
+from app.core.config import settings
 from app.core.storage import save_file, delete_file
+from app.utils.ttl_cache import facet_cache, key_for
 
 router = APIRouter()
 
+# Publicações, autoria e subgrupos (nomes e associações) mudam as facetas
+facet_cache.clear_on_commit(Publicacao, Membro, Subgrupo)
 
-@router.get("/", response_model=dict)
+
+@router.get(
+    "/",
+    response_model=schemas.PublicacaoPage[schemas.Publicacao],
+    responses=deps.list_responses(stream=True)
+)
 async def read_publicacoes(
         pagination: deps.PaginationParams = Depends(),
         search: deps.SearchParams = Depends(),
         tipo: Optional[TipoPublicacaoEnum] = Query(None, description="Filtrar por tipo de publicação"),
         year: Optional[int] = Query(None, description="Filtrar por ano"),
         autor_id: Optional[int] = Query(None, description="Filtrar por autor"),
+        stream: bool = Query(
+            False,
+            description="Envia todos os registros a partir de skip (limit ignorado) como array JSON em partes"
+        ),
+        facets: bool = Query(False, description="Inclui contagens por tipo, ano e subgrupo dentro dos filtros"),
+        fieldset: Optional[deps.Fieldset] = Depends(deps.sparse_fields(schemas.PublicacaoWithRelations, expand=False)),
+        ids: Optional[List[int]] = Depends(deps.get_batch_ids),
         db: AsyncSession = Depends(deps.get_db_session),
 ) -> Any:
     """
     Recuperar publicações com paginação e filtros avançados.
+
+    Com ``stream=true`` (exportações), os filtros informados são combinados e
+    a resposta é um array JSON serializado à medida que as linhas chegam do
+    banco, até ``STREAM_MAX_ITEMS`` registros.
+
+    Com ``ids`` (busca em lote), retorna as publicações indexadas por ID em
+    uma única consulta.
+
+    Com ``facets=true``, a página traz ``facets``: contagens por tipo, ano e
+    subgrupo das publicações que atendem ao mesmo filtro da página, em uma
+    única consulta agregada guardada em cache por ``FACETS_CACHE_TTL`` (esvaziado
+    a cada escrita de publicações, membros ou subgrupos no worker).
     """
+    options = deps.fields_load_options(crud.publicacao, fieldset)
+    if ids is not None:
+        publicacoes = await crud.publicacao.get_many(db, ids=ids, options=options)
+        return deps.render_batch(ids, publicacoes, fieldset)
+    if stream:
+        rows = crud.publicacao.stream_filtered(
+            db,
+            autor_id=autor_id,
+            tipo=tipo,
+            year=year,
+            query_text=search.query,
+            skip=pagination.skip,
+            limit=settings.STREAM_MAX_ITEMS,
+            options=options,
+            batch_size=settings.STREAM_BATCH_SIZE
+        )
+        return deps.stream_fields(rows, fieldset)
+
     if autor_id:
         publicacoes, total = await crud.publicacao.get_by_autor(
             db,
             autor_id=autor_id,
             skip=pagination.skip,
-            limit=pagination.limit
+            limit=pagination.limit,
+            options=options
         )
     elif tipo:
         publicacoes, total = await crud.publicacao.get_by_tipo(
             db,
             tipo=tipo,
             skip=pagination.skip,
-            limit=pagination.limit
+            limit=pagination.limit,
+            options=options
         )
     elif year:
         publicacoes, total = await crud.publicacao.get_by_year(
             db,
             year=year,
             skip=pagination.skip,
-            limit=pagination.limit
+            limit=pagination.limit,
+            options=options
         )
     elif search.query:
         publicacoes, total = await crud.publicacao.search(
@@ -50,23 +101,35 @@ async def read_publicacoes(
             tipo=tipo,
             year=year,
             skip=pagination.skip,
-            limit=pagination.limit
+            limit=pagination.limit,
+            options=options
         )
     else:
         publicacoes, total = await crud.publicacao.get_multi(
             db,
             skip=pagination.skip,
             limit=pagination.limit,
-            load_relations=["autores", "subgrupos"]
+            options=options
         )
 
-    return {
-        "items": [schemas.PublicacaoWithRelations.model_validate(pub) for pub in publicacoes],
-        "total": total,
-        "skip": pagination.skip,
-        "limit": pagination.limit,
-        "has_next": (pagination.skip + pagination.limit) < total
-    }
+    page_facets = None
+    if facets:
+        # Mesmo filtro aplicado à página (a precedência acima usa um por vez)
+        if autor_id:
+            filters = {"autor_id": autor_id}
+        elif tipo:
+            filters = {"tipo": tipo}
+        elif year:
+            filters = {"year": year}
+        else:
+            filters = {"query_text": search.query}
+        page_facets = await facet_cache.get_or_compute(
+            key_for("publicacoes", filters),
+            lambda: crud.publicacao.facet_counts(db, **filters)
+        )
+
+    page = schemas.paginate(publicacoes, total, pagination.skip, pagination.limit, facets=page_facets)
+    return deps.render_fields(page, fieldset)
 
 
 @router.post("/", response_model=schemas.PublicacaoWithRelations, status_code=status.HTTP_201_CREATED)
@@ -110,16 +173,24 @@ async def read_publicacao(
         *,
         db: AsyncSession = Depends(deps.get_db_session),
         id: int,
+        fieldset: Optional[deps.Fieldset] = Depends(deps.sparse_fields(schemas.PublicacaoWithRelations)),
 ) -> Any:
     """
     Obter publicação por ID.
     """
-    publicacao = await crud.publicacao.get(db, id=id, load_relations=["autores", "subgrupos"])
+    publicacao = await crud.publicacao.get(
+        db,
+        id=id,
+        load_relations=["autores", "subgrupos"],
+        options=deps.fields_load_options(crud.publicacao, fieldset)
+    )
     if not publicacao:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Publicação não encontrada"
         )
+    if fieldset is not None:
+        return deps.render_fields(publicacao, fieldset)
     return schemas.PublicacaoWithRelations.model_validate(publicacao)
 
 
@@ -202,7 +273,11 @@ async def get_tipos_publicacao() -> List[str]:
     return [tipo.value for tipo in TipoPublicacaoEnum]
 
 
-@router.get("/search/avancada", response_model=dict)
+@router.get(
+    "/search/avancada",
+    response_model=schemas.PublicacaoSearchPage[schemas.Publicacao],
+    responses=deps.list_responses(batch=False)
+)
 async def search_publicacoes_avancada(
         *,
         db: AsyncSession = Depends(deps.get_db_session),
@@ -210,6 +285,7 @@ async def search_publicacoes_avancada(
         tipo: Optional[TipoPublicacaoEnum] = Query(None, description="Filtrar por tipo"),
         year: Optional[int] = Query(None, description="Filtrar por ano"),
         pagination: deps.PaginationParams = Depends(),
+        fieldset: Optional[deps.Fieldset] = Depends(deps.sparse_fields(schemas.PublicacaoWithRelations, expand=False)),
 ) -> Any:
     """
     Busca avançada em publicações.
@@ -220,21 +296,18 @@ async def search_publicacoes_avancada(
         tipo=tipo,
         year=year,
         skip=pagination.skip,
-        limit=pagination.limit
+        limit=pagination.limit,
+        options=deps.fields_load_options(crud.publicacao, fieldset)
     )
 
-    return {
-        "items": [schemas.PublicacaoWithRelations.model_validate(pub) for pub in publicacoes],
-        "total": total,
-        "skip": pagination.skip,
-        "limit": pagination.limit,
-        "has_next": (pagination.skip + pagination.limit) < total,
-        "filters": {
-            "query": q,
-            "tipo": tipo.value if tipo else None,
-            "year": year
-        }
-    }
+    page = schemas.paginate(
+        publicacoes,
+        total,
+        pagination.skip,
+        pagination.limit,
+        filters={"query": q, "tipo": tipo, "year": year},
+    )
+    return deps.render_fields(page, fieldset)
 
 
 @router.post("/{id}/upload-image")
@@ -0,0 +1,35 @@
+from typing import Any
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud, schemas
+from app.api import deps
+from app.core.config import settings
+
+router = APIRouter()
+
+
+@router.get("/", response_model=schemas.SearchResponse)
+async def global_search(
+        *,
+        db: AsyncSession = Depends(deps.get_db_session),
+        response: Response,
+        q: str = Query(..., min_length=2, max_length=100, description="Termo de busca"),
+        limit: int = Query(
+            settings.SEARCH_RESULTS_PER_TYPE,
+            ge=1,
+            le=settings.SEARCH_MAX_RESULTS_PER_TYPE,
+            description="Máximo de resultados por tipo (membro, subgrupo, publicação)"
+        ),
+) -> Any:
+    """
+    Busca global em membros, subgrupos e publicações.
+
+    Uma única consulta ao banco; os resultados vêm ordenados por relevância
+    (nome/título igual ao termo, começando com o termo, contendo o termo,
+    apenas no texto), com um trecho do texto em torno do termo.
+    """
+    hits, totals = await crud.search.search(db, query_text=q.strip(), per_type=limit)
+    # Resposta pública e igual para a mesma query string: cacheável
+    response.headers["Cache-Control"] = f"public, max-age={settings.SEARCH_CACHE_MAX_AGE}"
+    return {"query": q, "hits": hits, "totals": totals}
@@ -11,10 +11,12 @@ from app.core.storage import save_file, delete_file
 router = APIRouter()
 
 
-@router.get("/", response_model=dict)
+@router.get("/", response_model=schemas.Page[schemas.Subgrupo], responses=deps.list_responses())
 async def read_subgrupos(
         pagination: deps.PaginationParams = Depends(),
         search: deps.SearchParams = Depends(),
+        fieldset: Optional[deps.Fieldset] = Depends(deps.sparse_fields(schemas.SubgrupoWithRelations, expand=False)),
+        ids: Optional[List[int]] = Depends(deps.get_batch_ids),
         db: AsyncSession = Depends(deps.get_db_session),
 ) -> Any:
     """
@@ -23,29 +25,32 @@ async def read_subgrupos(
     - **skip**: número de registros a pular
     - **limit**: número máximo de registros a retornar
     - **q**: termo de busca (opcional)
+    - **fields**: campos a retornar (opcional)
+    - **include**: relações a expandir (opcional; padrão: nenhuma)
+    - **ids**: busca em lote, resposta indexada por ID (opcional)
     """
+    options = deps.fields_load_options(crud.subgrupo, fieldset)
+    if ids is not None:
+        subgrupos = await crud.subgrupo.get_many(db, ids=ids, options=options)
+        return deps.render_batch(ids, subgrupos, fieldset)
     if search.query:
         subgrupos, total = await crud.subgrupo.search(
             db,
             query_text=search.query,
             skip=pagination.skip,
-            limit=pagination.limit
+            limit=pagination.limit,
+            options=options
         )
     else:
         subgrupos, total = await crud.subgrupo.get_multi(
             db,
             skip=pagination.skip,
             limit=pagination.limit,
-            load_relations=["membros", "publicacoes"]
+            options=options
         )
 
-    return {
-        "items": [schemas.SubgrupoWithRelations.model_validate(subgrupo) for subgrupo in subgrupos],
-        "total": total,
-        "skip": pagination.skip,
-        "limit": pagination.limit,
-        "has_next": (pagination.skip + pagination.limit) < total
-    }
+    page = schemas.paginate(subgrupos, total, pagination.skip, pagination.limit)
+    return deps.render_fields(page, fieldset)
 
 
 @router.post("/", response_model=schemas.Subgrupo, status_code=status.HTTP_201_CREATED)
@@ -76,16 +81,24 @@ async def read_subgrupo(
         *,
         db: AsyncSession = Depends(deps.get_db_session),
         id: int,
+        fieldset: Optional[deps.Fieldset] = Depends(deps.sparse_fields(schemas.SubgrupoWithRelations)),
 ) -> Any:
     """
     Obter subgrupo por ID.
     """
-    subgrupo = await crud.subgrupo.get(db, id=id, load_relations=["membros", "publicacoes"])
+    subgrupo = await crud.subgrupo.get(
+        db,
+        id=id,
+        load_relations=["membros", "publicacoes"],
+        options=deps.fields_load_options(crud.subgrupo, fieldset)
+    )
     if not subgrupo:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Subgrupo não encontrado"
         )
+    if fieldset is not None:
+        return deps.render_fields(subgrupo, fieldset)
     return schemas.SubgrupoWithRelations.model_validate(subgrupo)
 
 
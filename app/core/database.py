@@ -1,15 +1,139 @@
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Dict, Optional
+from uuid import uuid4
+import asyncio
 import logging
 
 from .config import settings
+from app.utils.pool_metrics import InstrumentedAsyncQueuePool, InstrumentedNullPool, instrument_pool
 
 logger = logging.getLogger(__name__)
 
 # Detectar se é SQLite ou PostgreSQL e configurar engine apropriadamente
 is_sqlite = settings.DATABASE_URL.startswith("sqlite")
 
+# Perfis de pool (por worker). Com 4 workers do gunicorn, o máximo de conexões
+# no PostgreSQL é 4 × (pool_size + max_overflow).
+POOL_PROFILES: Dict[str, Dict[str, Any]] = {
+    "small": {"pool_size": 5, "max_overflow": 5, "pool_timeout": 10, "pool_recycle": 1800},
+    "default": {"pool_size": 10, "max_overflow": 20, "pool_timeout": 30, "pool_recycle": -1},
+    "large": {"pool_size": 20, "max_overflow": 30, "pool_timeout": 30, "pool_recycle": 1800},
+}
+
+
+def get_pool_options() -> Dict[str, Any]:
+    """
+    Opções do pool de conexões: valores do perfil DB_POOL_PROFILE
+    sobrescritos pelos DB_POOL_* definidos explicitamente.
+    """
+    if settings.DB_POOL_PROFILE not in POOL_PROFILES:
+        raise ValueError(
+            f"DB_POOL_PROFILE inválido: '{settings.DB_POOL_PROFILE}'. "
+            f"Use um de: {', '.join(POOL_PROFILES)}"
+        )
+    options = dict(POOL_PROFILES[settings.DB_POOL_PROFILE])
+    overrides = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+    options.update({key: value for key, value in overrides.items() if value is not None})
+    options["pool_pre_ping"] = settings.DB_POOL_PRE_PING
+    return options
+
+
+def _unique_prepared_statement_name() -> str:
+    """Nome único de prepared statement (evita colisões atrás do PgBouncer)."""
+    return f"__asyncpg_{uuid4()}__"
+
+
+def get_engine_options(pool_mode: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Argumentos de ``create_async_engine`` para PostgreSQL conforme o modo:
+
+    - ``direct``: pool próprio por worker (perfil DB_POOL_*), statement timeout
+      definido uma vez por conexão.
+    - ``pgbouncer``: o PgBouncer (transaction pooling) faz o pool, então cada
+      worker usa NullPool (ou um pool pequeno se DB_PGBOUNCER_POOL_SIZE > 0),
+      sem cache de prepared statements do asyncpg e com nomes únicos.
+    """
+    pool_mode = pool_mode or settings.DB_POOL_MODE
+    timeout_ms = settings.DB_STATEMENT_TIMEOUT_MS
+
+    if pool_mode == "direct":
+        options: Dict[str, Any] = {"poolclass": InstrumentedAsyncQueuePool, **get_pool_options()}
+        if timeout_ms:
+            options["connect_args"] = {"server_settings": {"statement_timeout": str(timeout_ms)}}
+        return options
+
+    if pool_mode == "pgbouncer":
+        options = {
+            "connect_args": {
+                "statement_cache_size": 0,  # cache do asyncpg
+                "prepared_statement_cache_size": 0,  # cache do dialeto SQLAlchemy
+                "prepared_statement_name_func": _unique_prepared_statement_name,
+            },
+        }
+        if settings.DB_PGBOUNCER_POOL_SIZE > 0:
+            pool_options = get_pool_options()
+            options.update({
+                "poolclass": InstrumentedAsyncQueuePool,
+                "pool_size": settings.DB_PGBOUNCER_POOL_SIZE,
+                "max_overflow": 0,
+                "pool_timeout": pool_options["pool_timeout"],
+                "pool_recycle": pool_options["pool_recycle"],
+                "pool_pre_ping": pool_options["pool_pre_ping"],
+            })
+        else:
+            options["poolclass"] = InstrumentedNullPool
+        return options
+
+    raise ValueError(f"DB_POOL_MODE inválido: '{pool_mode}'. Use 'direct' ou 'pgbouncer'")
+
+
+def install_transaction_statement_timeout(engine: AsyncEngine, timeout_ms: int) -> None:
+    """
+    Define ``statement_timeout`` no início de cada transação (``SET LOCAL``).
+    Necessário com transaction pooling, em que parâmetros de sessão não
+    sobrevivem entre transações.
+    """
+    @event.listens_for(engine.sync_engine, "begin")
+    def _set_statement_timeout(conn):
+        conn.exec_driver_sql(f"SET LOCAL statement_timeout = {int(timeout_ms)}")
+
+
+def get_sqlite_pragmas() -> Dict[str, Any]:
+    """PRAGMAs do perfil de produção do SQLite (WAL, mmap, cache, busy timeout)."""
+    return {
+        "journal_mode": settings.SQLITE_JOURNAL_MODE,
+        "synchronous": settings.SQLITE_SYNCHRONOUS,
+        "mmap_size": settings.SQLITE_MMAP_SIZE,
+        "cache_size": settings.SQLITE_CACHE_SIZE,
+        "temp_store": settings.SQLITE_TEMP_STORE,
+        "busy_timeout": settings.SQLITE_BUSY_TIMEOUT_MS,
+    }
+
+
+def apply_sqlite_profile(engine: AsyncEngine, pragmas: Optional[Dict[str, Any]] = None) -> None:
+    """Aplica os PRAGMAs do perfil em cada nova conexão SQLite."""
+    pragmas = pragmas if pragmas is not None else get_sqlite_pragmas()
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+
+# Fila de escrita do SQLite: o SQLite aceita um único escritor por vez, então
+# as sessões de escrita do processo são serializadas (asyncio.Lock é FIFO)
+# enquanto as leituras seguem concorrentes sob WAL.
+sqlite_write_lock = asyncio.Lock()
+
 # Configuração do engine baseado no tipo de banco
 if is_sqlite:
     # SQLite não suporta pool_size e max_overflow
@@ -18,15 +142,18 @@ if is_sqlite:
         echo=False,
         connect_args={"check_same_thread": False} if "aiosqlite" in settings.DATABASE_URL else {}
     )
+    if settings.SQLITE_TUNED_PROFILE:
+        apply_sqlite_profile(engine)
 else:
-    # PostgreSQL com pool de conexões
+    # PostgreSQL com pool de conexões instrumentado
     engine = create_async_engine(
         settings.DATABASE_URL,
         echo=False,
-        pool_pre_ping=True,
-        pool_size=10,
-        max_overflow=20,
+        **get_engine_options(),
     )
+    instrument_pool(engine.sync_engine.pool)
+    if settings.DB_POOL_MODE == "pgbouncer" and settings.DB_STATEMENT_TIMEOUT_MS:
+        install_transaction_statement_timeout(engine, settings.DB_STATEMENT_TIMEOUT_MS)
 
 # Session factory
 AsyncSessionLocal = async_sessionmaker(
@@ -40,15 +167,29 @@ class Base(DeclarativeBase):
     """Base class para todos os modelos SQLAlchemy."""
     pass
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Dependency para obter sessão do banco de dados."""
-    async with AsyncSessionLocal() as session:
-        try:
-            yield session
-            await session.commit()
-        except Exception as e:
-            await session.rollback()
-            logger.error(f"Database error: {e}")
-            raise
-        finally:
-            await session.close()
\ No newline at end of file
+async def get_db(write: bool = False) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency para obter sessão do banco de dados.
+
+    Args:
+        write: Se True e o banco for SQLite, a sessão entra na fila de escrita
+            e só é liberada após o commit/rollback.
+    """
+    lock = sqlite_write_lock if (write and is_sqlite) else None
+    if lock is not None:
+        await lock.acquire()
+
+    try:
+        async with AsyncSessionLocal() as session:
+            try:
+                yield session
+                await session.commit()
+            except Exception as e:
+                await session.rollback()
+                logger.error(f"Database error: {e}")
+                raise
+            finally:
+                await session.close()
+    finally:
+        if lock is not None:
+            lock.release()
@@ -1,12 +1,21 @@
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any, Optional
-from jose import jwt, JWTError
-from passlib.context import CryptContext
+from jose import JWTError
 
 from app.core.config import settings
+from app.utils.lazy import lazy_import
 
-# Contexto de criptografia de senha
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# jose.jwt (que carrega os backends de criptografia) e passlib/bcrypt são
+# importados no primeiro uso, e não no boot do worker
+jwt = lazy_import("jose.jwt")
+passlib_context = lazy_import("passlib.context")
+
+
+@lru_cache(maxsize=1)
+def get_pwd_context():
+    """Contexto de criptografia de senha (criado no primeiro uso)."""
+    return passlib_context.CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -61,7 +70,7 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True se a senha corresponde, False caso contrário
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return get_pwd_context().verify(plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
@@ -74,4 +83,4 @@ def get_password_hash(password: str) -> str:
     Returns:
         Hash da senha
     """
-    return pwd_context.hash(password)
+    return get_pwd_context().hash(password)
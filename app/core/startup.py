@@ -0,0 +1,70 @@
+"""
+Rotinas de aquecimento executadas no startup de cada worker.
+
+Evitam que as primeiras requisições após um deploy (ou reciclagem de worker
+do gunicorn) paguem a abertura de conexões, a configuração dos mappers do
+SQLAlchemy e a geração dos schemas Pydantic/OpenAPI.
+"""
+import logging
+import time
+from contextlib import AsyncExitStack
+
+from fastapi import FastAPI
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import configure_mappers
+
+logger = logging.getLogger(__name__)
+
+
+async def prewarm_pool(engine: AsyncEngine, connections: int) -> int:
+    """
+    Abre ``connections`` conexões ao mesmo tempo e as devolve ao pool.
+
+    Sem efeito em pools que não mantêm conexões (NullPool, StaticPool) e
+    limitado ao ``pool_size``.
+
+    Returns:
+        Número de conexões abertas com sucesso
+    """
+    pool = engine.sync_engine.pool
+    if not hasattr(pool, "size"):
+        return 0
+    connections = min(connections, pool.size())
+
+    opened = 0
+    async with AsyncExitStack() as stack:
+        for _ in range(connections):
+            try:
+                conn = await stack.enter_async_context(engine.connect())
+                await conn.execute(text("SELECT 1"))
+                opened += 1
+            except Exception as e:
+                # Banco indisponível não impede o worker de subir
+                logger.warning(f"Pool pre-warm failed after {opened} connections: {e}")
+                break
+    return opened
+
+
+def configure_orm() -> None:
+    """Resolve todos os relacionamentos dos modelos (configure_mappers)."""
+    import app.models  # noqa: F401  (registra todos os modelos)
+
+    configure_mappers()
+
+
+def warm_openapi(app: FastAPI) -> None:
+    """Gera (e deixa em cache) o schema OpenAPI e os JSON schemas Pydantic."""
+    app.openapi()
+
+
+async def warm_up(app: FastAPI, engine: AsyncEngine, pool_connections: int) -> None:
+    """Executa todo o aquecimento do worker e loga o tempo gasto."""
+    start = time.perf_counter()
+    configure_orm()
+    warm_openapi(app)
+    opened = await prewarm_pool(engine, pool_connections) if pool_connections > 0 else 0
+    logger.info(
+        f"Worker warm-up finished in {(time.perf_counter() - start) * 1000:.0f} ms "
+        f"({opened} pool connections opened)"
+    )
@@ -8,7 +8,6 @@ import hmac
 import hashlib
 import time
 import re
-import aiofiles
 from pathlib import Path
 from typing import Optional
 from urllib.parse import urlencode, parse_qs
@@ -16,6 +15,10 @@ from fastapi import UploadFile
 from abc import ABC, abstractmethod
 
 from app.core.config import settings
+from app.utils.lazy import lazy_import
+
+# Carregado apenas no primeiro upload
+aiofiles = lazy_import("aiofiles")
 
 # Tempo de expiração padrão: 1 hora (em segundos)
 URL_EXPIRATION_TIME = 3600
@@ -49,10 +52,12 @@ class LocalStorage(StorageBackend):
     def __init__(self, base_path: Optional[str] = None, base_url: str = "/api/v1/files"):
         self.base_path = Path(base_path or settings.UPLOADS_PATH)
         self.base_url = base_url
-        self._ensure_directories()
 
-    def _ensure_directories(self):
-        """Cria diretórios necessários se não existirem."""
+    def ensure_directories(self):
+        """
+        Cria diretórios necessários se não existirem.
+        Chamado no startup da aplicação (não no import do módulo).
+        """
         folders = ["subgrupos/icons", "subgrupos/backgrounds",
                    "membros/photos", "membros/backgrounds",
                    "publicacoes/images"]
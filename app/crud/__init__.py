@@ -10,4 +10,9 @@ from .publicacao import publicacao
 from .subgrupo import subgrupo
 
 # Importa o objeto 'user' do arquivo user.py
-from .user import user
\ No newline at end of file
+from .user import user
+
+# Importa o objeto 'search' (busca global) do arquivo search.py
+from .search import search
+# Importa o objeto 'changes' (feed de alterações) do arquivo changes.py
+from .changes import changes
@@ -1,7 +1,7 @@
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from typing import Any, AsyncIterator, Dict, Generic, List, Mapping, Optional, Sequence, Type, TypeVar, Union
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update, delete, func
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import load_only, raiseload, selectinload
 from pydantic import BaseModel
 from fastapi import HTTPException, status
 import enum  # Necessário para a checagem de filtro
@@ -24,17 +24,52 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
         self.model = model
 
+    def load_options(
+            self,
+            *,
+            columns: Optional[Sequence[str]] = None,
+            relations: Optional[Mapping[str, Optional[Sequence[str]]]] = None
+    ) -> List[Any]:
+        """
+        Plano de carregamento explícito para as consultas de leitura.
+
+        Args:
+            columns: Colunas do modelo a carregar (None = todas). As demais
+                ficam adiadas e não podem ser lidas depois.
+            relations: Relações a carregar (selectinload), cada uma com as
+                colunas do modelo relacionado (None = todas). Relações fora
+                do plano, inclusive as aninhadas, não são carregadas.
+
+        Returns:
+            Opções para o parâmetro ``options`` dos métodos de leitura
+        """
+        options: List[Any] = []
+        if columns is not None:
+            options.append(load_only(*(getattr(self.model, c) for c in columns), raiseload=True))
+        for name, related_columns in (relations or {}).items():
+            attr = getattr(self.model, name)
+            loader = selectinload(attr)
+            if related_columns is not None:
+                target = attr.property.mapper.class_
+                loader = loader.load_only(*(getattr(target, c) for c in related_columns), raiseload=True)
+            options.append(loader.raiseload("*"))
+        options.append(raiseload("*"))
+        return options
+
     async def get(
             self,
             db: AsyncSession,
             id: Any,
             *,
-            load_relations: Optional[List[str]] = None
+            load_relations: Optional[List[str]] = None,
+            options: Optional[Sequence[Any]] = None
     ) -> Optional[ModelType]:
         """Buscar um registro por ID."""
         query = select(self.model).where(self.model.id == id)
 
-        if load_relations:
+        if options is not None:
+            query = query.options(*options)
+        elif load_relations:
             # Agora carrega apenas os relacionamentos pedidos
             for relation_name in load_relations:
                 if hasattr(self.model, relation_name):
@@ -70,6 +105,20 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         total = count_result.scalar_one()
         return total
 
+    async def get_many(
+            self,
+            db: AsyncSession,
+            *,
+            ids: Sequence[Any],
+            options: Optional[Sequence[Any]] = None
+    ) -> List[ModelType]:
+        """Buscar vários registros por ID em uma única consulta (ordem não garantida)."""
+        query = select(self.model).where(self.model.id.in_(ids))
+        if options is not None:
+            query = query.options(*options)
+        result = await db.execute(query)
+        return list(result.scalars().all())
+
     async def get_multi(
             self,
             db: AsyncSession,
@@ -78,7 +127,8 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             limit: int = 100,
             filters: Optional[Dict[str, Any]] = None,
             # --- CORREÇÃO DA ASSINATURA AQUI ---
-            load_relations: Optional[List[str]] = None
+            load_relations: Optional[List[str]] = None,
+            options: Optional[Sequence[Any]] = None
     ) -> tuple[List[ModelType], int]:
         """
         Buscar múltiplos registros com paginação e filtros.
@@ -101,7 +151,9 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
                         query = query.where(getattr(self.model, field) == value)
                         count_query = count_query.where(getattr(self.model, field) == value)
 
-        if load_relations:
+        if options is not None:
+            query = query.options(*options)
+        elif load_relations:
             for relation_name in load_relations:
                 if hasattr(self.model, relation_name):
                     query = query.options(selectinload(getattr(self.model, relation_name)))
@@ -116,6 +168,29 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
 
         return list(items), total
 
+    async def stream(
+            self,
+            db: AsyncSession,
+            *,
+            where: Sequence[Any] = (),
+            skip: int = 0,
+            limit: Optional[int] = None,
+            options: Optional[Sequence[Any]] = None,
+            batch_size: int = 500
+    ) -> AsyncIterator[ModelType]:
+        """
+        Iterar registros direto do cursor do banco, em lotes de ``batch_size``
+        (relações em ``selectinload`` são carregadas lote a lote). Os objetos
+        já entregues não ficam retidos pela sessão.
+        """
+        query = select(self.model).where(*where).order_by(self.model.id).offset(skip).limit(limit)
+        if options is not None:
+            query = query.options(*options)
+
+        result = await db.stream_scalars(query.execution_options(yield_per=batch_size))
+        async for obj in result:
+            yield obj
+
     async def create(
             self,
             db: AsyncSession,
@@ -0,0 +1,133 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import and_, literal_column, select, tuple_, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.membro import Membro
+from app.models.publicacao import Publicacao
+from app.models.subgrupo import Subgrupo
+from app.models.tombstone import Tombstone
+from app.schemas.changes import ChangeKey, as_utc
+
+TOMBSTONE = "tombstone"
+
+
+class ChangeFeedCRUD:
+    """
+    Feed de alterações de membros, publicações e subgrupos.
+
+    Uma consulta: ``UNION ALL`` de uma subconsulta por origem (cada tabela de
+    entidade e a de tombstones), cada uma lida pelo índice ``(updated_at,
+    id)`` a partir do cursor e limitada a ``limit + 1`` linhas. A ordem do
+    feed é (instante, origem, id); alterações de associações aparecem como
+    alteração das entidades dos dois lados (ver ``app.models.tombstone``).
+    """
+
+    # origem -> modelo (o nome da origem é o tipo da entidade)
+    SOURCES: Dict[str, Any] = {
+        "membro": Membro,
+        "publicacao": Publicacao,
+        "subgrupo": Subgrupo,
+    }
+
+    def _after(self, source: str, changed_at, id_col, since: Optional[ChangeKey]):
+        """Condição "depois do cursor" para uma origem (usa o índice da tabela)."""
+        if since is None:
+            return None
+        since_at, since_source, since_id = since
+        if source > since_source:
+            return changed_at >= since_at
+        if source < since_source:
+            return changed_at > since_at
+        return tuple_(changed_at, id_col) > tuple_(since_at, since_id)
+
+    def _source(self, source: str, model, changed_at, entity_type, entity_id,
+                since: Optional[ChangeKey], until: datetime, limit: int):
+        conditions = [changed_at <= until]
+        after = self._after(source, changed_at, model.id, since)
+        if after is not None:
+            conditions.append(after)
+        return (
+            select(
+                # Constante do código; literal_column evita parâmetro sem tipo no UNION (asyncpg)
+                literal_column(f"'{source}'").label("source"),
+                model.id.label("id"),
+                changed_at.label("changed_at"),
+                entity_type.label("entity_type"),
+                entity_id.label("entity_id"),
+            )
+            .where(and_(*conditions))
+            .order_by(changed_at, model.id)
+            .limit(limit)
+            .subquery(f"changes_{source}")
+        )
+
+    async def changes(
+            self,
+            db: AsyncSession,
+            *,
+            since: Optional[ChangeKey],
+            until: datetime,
+            limit: int = 200
+    ) -> Tuple[List[Dict[str, Any]], Optional[ChangeKey], bool]:
+        """
+        Alterações depois de ``since`` e até ``until``, em ordem.
+
+        Retorna (alterações, posição da última entregue, há mais).
+        """
+        subqueries = [
+            self._source(
+                source, model, model.updated_at, literal_column(f"'{source}'"), model.id,
+                since, until, limit + 1
+            )
+            for source, model in self.SOURCES.items()
+        ]
+        subqueries.append(self._source(
+            TOMBSTONE, Tombstone, Tombstone.deleted_at, Tombstone.entity_type, Tombstone.entity_id,
+            since, until, limit + 1
+        ))
+        combined = union_all(*(select(subquery) for subquery in subqueries)).subquery("changes")
+        query = (
+            select(combined)
+            .order_by(combined.c.changed_at, combined.c.source, combined.c.id)
+            .limit(limit + 1)
+        )
+        rows = (await db.execute(query)).all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        # Estado atual das entidades alteradas: uma consulta por tipo
+        entities: Dict[Tuple[str, int], Any] = {}
+        for source, model in self.SOURCES.items():
+            ids = [row.id for row in rows if row.source == source]
+            if ids:
+                result = await db.execute(select(model).where(model.id.in_(ids)))
+                entities.update(((source, obj.id), obj) for obj in result.scalars())
+
+        since_at = as_utc(since[0]) if since is not None else None
+        changes = []
+        for row in rows:
+            changed_at = as_utc(row.changed_at)
+            if row.source == TOMBSTONE:
+                changes.append({
+                    "type": row.entity_type, "id": row.entity_id,
+                    "action": "deleted", "changed_at": changed_at, "data": None,
+                })
+                continue
+            obj = entities.get((row.source, row.id))
+            if obj is None:
+                # Excluída depois da leitura do feed: o tombstone vem adiante
+                continue
+            created = since_at is None or as_utc(obj.created_at) > since_at
+            changes.append({
+                "type": row.source, "id": row.id,
+                "action": "created" if created else "updated",
+                "changed_at": changed_at, "data": obj,
+            })
+
+        last = (rows[-1].changed_at, rows[-1].source, rows[-1].id) if rows else since
+        return changes, last, has_more
+
+
+changes = ChangeFeedCRUD()
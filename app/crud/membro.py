@@ -1,4 +1,4 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Sequence
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_, or_
 from sqlalchemy.orm import selectinload
@@ -13,12 +13,24 @@ class CRUDMembro(CRUDBase[Membro, MembroCreate, MembroUpdate]):
     """CRUD para Membros com operações específicas."""
 
     # 👇 MÉTODO GET SOBRESCRITO - CARREGA SUBGRUPOS COM ÍCONE E BG
-    async def get(self, db: AsyncSession, *, id: int) -> Optional[Membro]:
+    async def get(
+            self,
+            db: AsyncSession,
+            *,
+            id: int,
+            load_relations: Optional[List[str]] = None,
+            options: Optional[Sequence[Any]] = None
+    ) -> Optional[Membro]:
         """Buscar membro por ID com subgrupos carregados."""
+        if options is None:
+            options = [
+                selectinload(getattr(self.model, relation))
+                for relation in (load_relations or ["subgrupos"])  # 👈 Carrega subgrupos
+            ]
         query = (
             select(self.model)
             .where(self.model.id == id)
-            .options(selectinload(self.model.subgrupos))  # 👈 Carrega subgrupos
+            .options(*options)
         )
         result = await db.execute(query)
         return result.scalar_one_or_none()
@@ -39,7 +51,8 @@ class CRUDMembro(CRUDBase[Membro, MembroCreate, MembroUpdate]):
             *,
             nome_partial: str,
             skip: int = 0,
-            limit: int = 100
+            limit: int = 100,
+            options: Optional[Sequence[Any]] = None
     ) -> tuple[List[Membro], int]:
         """Buscar membros por nome parcial."""
         filters = {"nome": nome_partial}
@@ -48,7 +61,8 @@ class CRUDMembro(CRUDBase[Membro, MembroCreate, MembroUpdate]):
             skip=skip,
             limit=limit,
             filters=filters,
-            load_relations=["subgrupos", "publicacoes"]
+            load_relations=["subgrupos", "publicacoes"],
+            options=options
         )
 
     async def get_subgrupos(
@@ -85,14 +99,15 @@ class CRUDMembro(CRUDBase[Membro, MembroCreate, MembroUpdate]):
             *,
             subgrupo_id: int,
             skip: int = 0,
-            limit: int = 100
+            limit: int = 100,
+            options: Optional[Sequence[Any]] = None
     ) -> tuple[List[Membro], int]:
         """Obter membros de um subgrupo específico."""
         query = (
             select(self.model)
             .join(membros_subgrupos)
             .where(membros_subgrupos.c.subgrupo_id == subgrupo_id)
-            .options(selectinload(self.model.subgrupos))  # 👈 Carrega subgrupos
+            .options(*(options if options is not None else [selectinload(self.model.subgrupos)]))
             .offset(skip)
             .limit(limit)
         )
@@ -117,7 +132,8 @@ class CRUDMembro(CRUDBase[Membro, MembroCreate, MembroUpdate]):
             *,
             query_text: str,
             skip: int = 0,
-            limit: int = 100
+            limit: int = 100,
+            options: Optional[Sequence[Any]] = None
     ) -> tuple[List[Membro], int]:
         """Busca textual em membros (nome, descrição, experiência)."""
         query = (
@@ -129,7 +145,7 @@ class CRUDMembro(CRUDBase[Membro, MembroCreate, MembroUpdate]):
                     self.model.experiencia.ilike(f"%{query_text}%")
                 )
             )
-            .options(selectinload(self.model.subgrupos))  # 👈 Carrega subgrupos
+            .options(*(options if options is not None else [selectinload(self.model.subgrupos)]))
             .offset(skip)
             .limit(limit)
         )
@@ -1,8 +1,11 @@
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterator, List, Optional, Dict, Any, Sequence
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_, extract, func
+from sqlalchemy import select, and_, or_, extract, func, case, distinct, literal_column, union_all
+from sqlalchemy import inspect as sa_inspect
 from app.crud.base import CRUDBase
+from app.models.membro import Membro
 from app.models.publicacao import Publicacao, TipoPublicacaoEnum
+from app.models.subgrupo import Subgrupo
 from app.models.associations import publicacao_autores, publicacao_subgrupos
 from app.schemas.publicacao import PublicacaoCreate, PublicacaoUpdate
 
@@ -10,6 +13,29 @@ from app.schemas.publicacao import PublicacaoCreate, PublicacaoUpdate
 class CRUDPublicacao(CRUDBase[Publicacao, PublicacaoCreate, PublicacaoUpdate]):
     """CRUD para Publicações com operações específicas."""
 
+    async def _set_related(
+            self,
+            db: AsyncSession,
+            db_obj: Publicacao,
+            relation: str,
+            model: Any,
+            ids: Sequence[int]
+    ) -> None:
+        """
+        Substitui uma coleção da publicação pelos registros de ``ids``.
+
+        A associação é gravada pelo ORM (não por INSERT/DELETE diretos na
+        tabela de associação), para que os eventos de sessão (feed de
+        alterações, grafo de coautoria) vejam a mudança.
+        """
+        if db_obj.id is not None and relation in sa_inspect(db_obj).unloaded:
+            await db.refresh(db_obj, attribute_names=[relation])
+        related = []
+        if ids:
+            result = await db.execute(select(model).where(model.id.in_(ids)))
+            related = list(result.scalars().all())
+        setattr(db_obj, relation, related)
+
     async def create_with_relations(
             self,
             db: AsyncSession,
@@ -17,30 +43,13 @@ class CRUDPublicacao(CRUDBase[Publicacao, PublicacaoCreate, PublicacaoUpdate]):
             obj_in: PublicacaoCreate
     ) -> Publicacao:
         """Criar publicação com autores e subgrupos."""
-        autor_ids = obj_in.autor_ids
-        subgrupo_ids = obj_in.subgrupo_ids
         obj_data = obj_in.model_dump(exclude={'autor_ids', 'subgrupo_ids'})
         db_obj = self.model(**obj_data)
 
-        db.add(db_obj)
-        await db.flush()
-
-        if autor_ids:
-            for autor_id in autor_ids:
-                stmt = publicacao_autores.insert().values(
-                    publicacao_id=db_obj.id,
-                    membro_id=autor_id
-                )
-                await db.execute(stmt)
-
-        if subgrupo_ids:
-            for subgrupo_id in subgrupo_ids:
-                stmt = publicacao_subgrupos.insert().values(
-                    publicacao_id=db_obj.id,
-                    subgrupo_id=subgrupo_id
-                )
-                await db.execute(stmt)
+        await self._set_related(db, db_obj, "autores", Membro, obj_in.autor_ids)
+        await self._set_related(db, db_obj, "subgrupos", Subgrupo, obj_in.subgrupo_ids)
 
+        db.add(db_obj)
         await db.flush()
         await db.refresh(db_obj)
         return db_obj
@@ -61,28 +70,10 @@ class CRUDPublicacao(CRUDBase[Publicacao, PublicacaoCreate, PublicacaoUpdate]):
             setattr(db_obj, field, value)
 
         if 'autor_ids' in update_data:
-            delete_stmt = publicacao_autores.delete().where(
-                publicacao_autores.c.publicacao_id == db_obj.id
-            )
-            await db.execute(delete_stmt)
-            for autor_id in update_data['autor_ids']:
-                stmt = publicacao_autores.insert().values(
-                    publicacao_id=db_obj.id,
-                    membro_id=autor_id
-                )
-                await db.execute(stmt)
+            await self._set_related(db, db_obj, "autores", Membro, update_data['autor_ids'] or [])
 
         if 'subgrupo_ids' in update_data:
-            delete_stmt = publicacao_subgrupos.delete().where(
-                publicacao_subgrupos.c.publicacao_id == db_obj.id
-            )
-            await db.execute(delete_stmt)
-            for subgrupo_id in update_data['subgrupo_ids']:
-                stmt = publicacao_subgrupos.insert().values(
-                    publicacao_id=db_obj.id,
-                    subgrupo_id=subgrupo_id
-                )
-                await db.execute(stmt)
+            await self._set_related(db, db_obj, "subgrupos", Subgrupo, update_data['subgrupo_ids'] or [])
 
         await db.flush()
         await db.refresh(db_obj)
@@ -94,7 +85,8 @@ class CRUDPublicacao(CRUDBase[Publicacao, PublicacaoCreate, PublicacaoUpdate]):
             *,
             tipo: TipoPublicacaoEnum,
             skip: int = 0,
-            limit: int = 100
+            limit: int = 100,
+            options: Optional[Sequence[Any]] = None
     ) -> tuple[List[Publicacao], int]:
         """Obter publicações por tipo."""
         # Filtrar diretamente pelo valor do enum (string armazenada no banco)
@@ -111,10 +103,12 @@ class CRUDPublicacao(CRUDBase[Publicacao, PublicacaoCreate, PublicacaoUpdate]):
 
         # Carregar relacionamentos
         from sqlalchemy.orm import selectinload
-        query = query.options(
-            selectinload(self.model.autores),
-            selectinload(self.model.subgrupos)
-        )
+        if options is None:
+            options = [
+                selectinload(self.model.autores),
+                selectinload(self.model.subgrupos)
+            ]
+        query = query.options(*options)
 
         result = await db.execute(query)
         total = (await db.execute(count_query)).scalar_one()
@@ -127,12 +121,14 @@ class CRUDPublicacao(CRUDBase[Publicacao, PublicacaoCreate, PublicacaoUpdate]):
             *,
             year: int,
             skip: int = 0,
-            limit: int = 100
+            limit: int = 100,
+            options: Optional[Sequence[Any]] = None
     ) -> tuple[List[Publicacao], int]:
         """Obter publicações por ano."""
         query = (
             select(self.model)
             .where(extract('year', self.model.year) == year)
+            .options(*(options or []))
             .offset(skip)
             .limit(limit)
         )
@@ -151,13 +147,15 @@ class CRUDPublicacao(CRUDBase[Publicacao, PublicacaoCreate, PublicacaoUpdate]):
             *,
             autor_id: int,
             skip: int = 0,
-            limit: int = 100
+            limit: int = 100,
+            options: Optional[Sequence[Any]] = None
     ) -> tuple[List[Publicacao], int]:
         """Obter publicações de um autor específico."""
         query = (
             select(self.model)
             .join(publicacao_autores)
             .where(publicacao_autores.c.membro_id == autor_id)
+            .options(*(options or []))
             .offset(skip)
             .limit(limit)
         )
@@ -179,7 +177,8 @@ class CRUDPublicacao(CRUDBase[Publicacao, PublicacaoCreate, PublicacaoUpdate]):
             tipo: Optional[TipoPublicacaoEnum] = None,
             year: Optional[int] = None,
             skip: int = 0,
-            limit: int = 100
+            limit: int = 100,
+            options: Optional[Sequence[Any]] = None
     ) -> tuple[List[Publicacao], int]:
         """Busca avançada em publicações."""
         query = select(self.model).where(
@@ -204,7 +203,7 @@ class CRUDPublicacao(CRUDBase[Publicacao, PublicacaoCreate, PublicacaoUpdate]):
             query = query.where(extract('year', self.model.year) == year)
             count_query = count_query.where(extract('year', self.model.year) == year)
 
-        query = query.offset(skip).limit(limit)
+        query = query.options(*(options or [])).offset(skip).limit(limit)
 
         result = await db.execute(query)
         total = (await db.execute(count_query)).scalar_one()
@@ -212,4 +211,130 @@ class CRUDPublicacao(CRUDBase[Publicacao, PublicacaoCreate, PublicacaoUpdate]):
         return list(items), total
 
 
+    def filter_clauses(
+            self,
+            *,
+            autor_id: Optional[int] = None,
+            tipo: Optional[TipoPublicacaoEnum] = None,
+            year: Optional[int] = None,
+            query_text: Optional[str] = None
+    ) -> List[Any]:
+        """Condições WHERE para os filtros informados (combinados com AND)."""
+        where = []
+        if autor_id:
+            where.append(self.model.id.in_(
+                select(publicacao_autores.c.publicacao_id).where(publicacao_autores.c.membro_id == autor_id)
+            ))
+        if tipo:
+            where.append(self.model.type == tipo)
+        if year:
+            where.append(extract('year', self.model.year) == year)
+        if query_text:
+            where.append(or_(
+                self.model.title.ilike(f"%{query_text}%"),
+                self.model.description.ilike(f"%{query_text}%")
+            ))
+        return where
+
+    def stream_filtered(
+            self,
+            db: AsyncSession,
+            *,
+            autor_id: Optional[int] = None,
+            tipo: Optional[TipoPublicacaoEnum] = None,
+            year: Optional[int] = None,
+            query_text: Optional[str] = None,
+            skip: int = 0,
+            limit: Optional[int] = None,
+            options: Optional[Sequence[Any]] = None,
+            batch_size: int = 500
+    ) -> AsyncIterator[Publicacao]:
+        """Publicações que atendem a todos os filtros informados, em streaming."""
+        return self.stream(
+            db,
+            where=self.filter_clauses(autor_id=autor_id, tipo=tipo, year=year, query_text=query_text),
+            skip=skip,
+            limit=limit,
+            options=options,
+            batch_size=batch_size
+        )
+
+    async def facet_counts(
+            self,
+            db: AsyncSession,
+            *,
+            autor_id: Optional[int] = None,
+            tipo: Optional[TipoPublicacaoEnum] = None,
+            year: Optional[int] = None,
+            query_text: Optional[str] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Contagem de publicações por tipo, ano e subgrupo (facetas) dentro dos
+        filtros informados, em uma única consulta agregada: GROUPING SETS no
+        PostgreSQL, UNION ALL de três GROUP BY nos demais bancos.
+        """
+        year_col = extract('year', self.model.year)
+        base = (
+            self.model.__table__
+            .outerjoin(publicacao_subgrupos, publicacao_subgrupos.c.publicacao_id == self.model.id)
+            .outerjoin(Subgrupo, Subgrupo.id == publicacao_subgrupos.c.subgrupo_id)
+        )
+        where = self.filter_clauses(autor_id=autor_id, tipo=tipo, year=year, query_text=query_text)
+        count = func.count(distinct(self.model.id)).label("count")
+        subgrupo_label = func.max(Subgrupo.nome_grupo).label("subgrupo_label")
+
+        if db.bind.dialect.name == "postgresql":
+            facet = case(
+                (func.grouping(self.model.type) == 0, literal_column("'tipo'")),
+                (func.grouping(year_col) == 0, literal_column("'year'")),
+                else_=literal_column("'subgrupo'"),
+            ).label("facet")
+            query = (
+                select(
+                    facet,
+                    self.model.type.label("tipo"),
+                    year_col.label("year"),
+                    publicacao_subgrupos.c.subgrupo_id.label("subgrupo_id"),
+                    subgrupo_label,
+                    count,
+                )
+                .select_from(base)
+                .where(*where)
+                .group_by(func.grouping_sets(self.model.type, year_col, publicacao_subgrupos.c.subgrupo_id))
+            )
+        else:
+            null = literal_column("NULL")
+            query = union_all(
+                select(
+                    literal_column("'tipo'").label("facet"), self.model.type.label("tipo"),
+                    null.label("year"), null.label("subgrupo_id"), null.label("subgrupo_label"), count,
+                ).select_from(base).where(*where).group_by(self.model.type),
+                select(
+                    literal_column("'year'").label("facet"), null.label("tipo"),
+                    year_col.label("year"), null.label("subgrupo_id"), null.label("subgrupo_label"), count,
+                ).select_from(base).where(*where).group_by(year_col),
+                select(
+                    literal_column("'subgrupo'").label("facet"), null.label("tipo"), null.label("year"),
+                    publicacao_subgrupos.c.subgrupo_id.label("subgrupo_id"), subgrupo_label, count,
+                ).select_from(base).where(*where).group_by(publicacao_subgrupos.c.subgrupo_id),
+            )
+
+        facets: Dict[str, List[Dict[str, Any]]] = {"tipo": [], "year": [], "subgrupo": []}
+        for row in (await db.execute(query)).all():
+            if row.facet == "tipo" and row.tipo is not None:
+                tipo_value = row.tipo.value if isinstance(row.tipo, TipoPublicacaoEnum) else row.tipo
+                facets["tipo"].append({"value": tipo_value, "label": None, "count": row.count})
+            elif row.facet == "year" and row.year is not None:
+                facets["year"].append({"value": int(row.year), "label": None, "count": row.count})
+            elif row.facet == "subgrupo" and row.subgrupo_id is not None:
+                facets["subgrupo"].append(
+                    {"value": row.subgrupo_id, "label": row.subgrupo_label, "count": row.count}
+                )
+
+        facets["tipo"].sort(key=lambda bucket: (-bucket["count"], bucket["value"]))
+        facets["year"].sort(key=lambda bucket: bucket["value"], reverse=True)
+        facets["subgrupo"].sort(key=lambda bucket: (-bucket["count"], bucket["label"] or ""))
+        return facets
+
+
 publicacao = CRUDPublicacao(Publicacao)
\ No newline at end of file
@@ -0,0 +1,111 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import case, func, literal_column, or_, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.membro import Membro
+from app.models.publicacao import Publicacao
+from app.models.subgrupo import Subgrupo
+
+SNIPPET_RADIUS = 60
+
+# Caractere de escape do LIKE (sem barra invertida: mesmo literal em todos os dialetos)
+LIKE_ESCAPE = "!"
+
+
+def _like_pattern(text: str) -> str:
+    """Padrão ``%texto%`` com ``%``, ``_`` e ``!`` do usuário escapados."""
+    escaped = text.replace("!", "!!").replace("%", "!%").replace("_", "!_")
+    return f"%{escaped}%"
+
+
+def snippet(text: Optional[str], query_text: str, radius: int = SNIPPET_RADIUS) -> Optional[str]:
+    """Trecho de ``text`` em torno da primeira ocorrência de ``query_text``."""
+    if not text:
+        return None
+    position = text.lower().find(query_text.lower())
+    if position < 0:
+        return None
+    start = max(position - radius, 0)
+    end = min(position + len(query_text) + radius, len(text))
+    fragment = " ".join(text[start:end].split())
+    return ("…" if start > 0 else "") + fragment + ("…" if end < len(text) else "")
+
+
+class GlobalSearch:
+    """
+    Busca global em membros, subgrupos e publicações.
+
+    Uma única consulta: ``UNION ALL`` de uma subconsulta por tipo, cada uma
+    com relevância calculada no banco, limitada a ``per_type`` resultados e
+    com o total de ocorrências do tipo (``count(*) OVER ()``).
+    """
+
+    # tipo -> (modelo, coluna de título, colunas de texto)
+    SOURCES: Dict[str, Tuple[Any, Any, Tuple[Any, ...]]] = {
+        "membro": (Membro, Membro.nome, (Membro.descricao, Membro.experiencia)),
+        "subgrupo": (Subgrupo, Subgrupo.nome_grupo, (Subgrupo.descricao,)),
+        "publicacao": (Publicacao, Publicacao.title, (Publicacao.description,)),
+    }
+
+    def _ranked(self, type_: str, query_text: str, per_type: int):
+        model, title, texts = self.SOURCES[type_]
+        pattern = _like_pattern(query_text)
+        prefix = pattern[1:]  # "texto%"
+        rank = case(
+            (func.lower(title) == query_text.lower(), 4),
+            (title.ilike(prefix, escape=LIKE_ESCAPE), 3),
+            (title.ilike(pattern, escape=LIKE_ESCAPE), 2),
+            else_=1,
+        )
+        body = texts[0] if len(texts) == 1 else func.coalesce(texts[0], "") + " " + func.coalesce(texts[1], "")
+        return (
+            select(
+                # Constante do código (não vem do usuário); literal_column evita
+                # parâmetro sem tipo no select list do UNION (asyncpg)
+                literal_column(f"'{type_}'").label("type"),
+                model.id.label("id"),
+                title.label("title"),
+                body.label("body"),
+                rank.label("rank"),
+                func.count().over().label("total"),
+            )
+            .where(or_(
+                title.ilike(pattern, escape=LIKE_ESCAPE),
+                func.coalesce(body, "").ilike(pattern, escape=LIKE_ESCAPE),
+            ))
+            .order_by(rank.desc(), model.id)
+            .limit(per_type)
+            .subquery(f"search_{type_}")
+        )
+
+    async def search(
+            self,
+            db: AsyncSession,
+            *,
+            query_text: str,
+            per_type: int = 5
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+        """
+        Retorna (resultados ordenados por relevância, total por tipo).
+        """
+        subqueries = [self._ranked(type_, query_text, per_type) for type_ in self.SOURCES]
+        combined = union_all(*(select(subquery) for subquery in subqueries)).subquery("search")
+        query = select(combined).order_by(combined.c.rank.desc(), combined.c.type, combined.c.id)
+
+        rows = (await db.execute(query)).all()
+        totals = {type_: 0 for type_ in self.SOURCES}
+        hits = []
+        for row in rows:
+            totals[row.type] = row.total
+            hits.append({
+                "type": row.type,
+                "id": row.id,
+                "title": row.title,
+                "snippet": snippet(row.body, query_text),
+                "rank": row.rank,
+            })
+        return hits, totals
+
+
+search = GlobalSearch()
@@ -1,11 +1,11 @@
-from typing import List, Optional, Any
+from typing import List, Optional, Any, Sequence
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 
 from app.crud.base import CRUDBase
+from app.models.membro import Membro
 from app.models.subgrupo import Subgrupo
-from app.models.associations import membros_subgrupos
 from app.schemas.subgrupo import SubgrupoCreate, SubgrupoUpdate
 
 
@@ -18,6 +18,16 @@ class CRUDSubgrupo(CRUDBase[Subgrupo, SubgrupoCreate, SubgrupoUpdate]):
         result = await db.execute(query)
         return result.scalar_one_or_none()
 
+    async def _with_membros(self, db: AsyncSession, subgrupo_id: int) -> Optional[Subgrupo]:
+        """Subgrupo com a coleção de membros carregada."""
+        query = (
+            select(self.model)
+            .where(self.model.id == subgrupo_id)
+            .options(selectinload(self.model.membros))
+        )
+        result = await db.execute(query)
+        return result.scalar_one_or_none()
+
     async def add_membro(
             self,
             db: AsyncSession,
@@ -25,23 +35,20 @@ class CRUDSubgrupo(CRUDBase[Subgrupo, SubgrupoCreate, SubgrupoUpdate]):
             subgrupo_id: int,
             membro_id: int
     ) -> bool:
-        """Adicionar membro ao subgrupo."""
-        query = select(membros_subgrupos).where(
-            and_(
-                membros_subgrupos.c.subgrupo_id == subgrupo_id,
-                membros_subgrupos.c.membro_id == membro_id
-            )
-        )
-        result = await db.execute(query)
+        """
+        Adicionar membro ao subgrupo.
 
-        if result.first():
+        A associação é gravada pelo ORM, para que os eventos de sessão (feed
+        de alterações) vejam a mudança.
+        """
+        subgrupo = await self._with_membros(db, subgrupo_id)
+        membro = await db.get(Membro, membro_id)
+        if subgrupo is None or membro is None:
+            return False
+        if any(item.id == membro_id for item in subgrupo.membros):
             return False  # Associação já existe
 
-        stmt = membros_subgrupos.insert().values(
-            subgrupo_id=subgrupo_id,
-            membro_id=membro_id
-        )
-        await db.execute(stmt)
+        subgrupo.membros.append(membro)
         await db.flush()
         return True
 
@@ -53,15 +60,16 @@ class CRUDSubgrupo(CRUDBase[Subgrupo, SubgrupoCreate, SubgrupoUpdate]):
             membro_id: int
     ) -> bool:
         """Remover membro do subgrupo."""
-        stmt = membros_subgrupos.delete().where(
-            and_(
-                membros_subgrupos.c.subgrupo_id == subgrupo_id,
-                membros_subgrupos.c.membro_id == membro_id
-            )
-        )
-        result = await db.execute(stmt)
+        subgrupo = await self._with_membros(db, subgrupo_id)
+        if subgrupo is None:
+            return False
+        membro = next((item for item in subgrupo.membros if item.id == membro_id), None)
+        if membro is None:
+            return False
+
+        subgrupo.membros.remove(membro)
         await db.flush()
-        return result.rowcount > 0
+        return True
 
     async def get_membros(
             self,
@@ -83,7 +91,8 @@ class CRUDSubgrupo(CRUDBase[Subgrupo, SubgrupoCreate, SubgrupoUpdate]):
             *,
             query_text: str,
             skip: int = 0,
-            limit: int = 100
+            limit: int = 100,
+            options: Optional[Sequence[Any]] = None
     ) -> tuple[List[Subgrupo], int]:
         """Busca textual em subgrupos."""
         filters = {
@@ -94,7 +103,8 @@ class CRUDSubgrupo(CRUDBase[Subgrupo, SubgrupoCreate, SubgrupoUpdate]):
             db,
             skip=skip,
             limit=limit,
-            filters=filters
+            filters=filters,
+            options=options
         )
 
 
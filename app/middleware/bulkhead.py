@@ -0,0 +1,49 @@
+"""
+Middleware ASGI que aplica os bulkheads por grupo de rotas.
+
+A requisição ocupa uma vaga do seu grupo durante toda a execução da rota
+(inclusive o envio da resposta). Sem vaga e sem espaço ou tempo na fila, a
+resposta é 503 com ``Retry-After``. Requisições fora de qualquer grupo
+passam direto.
+"""
+import json
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.utils.bulkhead import BulkheadFull, BulkheadRegistry
+
+REJECTED_BODY = json.dumps({
+    "error": "Capacidade da rota esgotada",
+    "detail": "Muitas requisições simultâneas para este recurso; tente novamente em instantes",
+    "error_code": "BULKHEAD_FULL",
+}).encode()
+
+
+class BulkheadMiddleware:
+    """Limita a concorrência de cada grupo de rotas declarado."""
+
+    def __init__(self, app: ASGIApp, *, registry: BulkheadRegistry, retry_after: int = 1):
+        self.app = app
+        self.registry = registry
+        self.retry_after = str(retry_after).encode()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        bulkhead = self.registry.match(scope) if scope["type"] == "http" else None
+        if bulkhead is None:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            async with bulkhead.acquire():
+                await self.app(scope, receive, send)
+        except BulkheadFull:
+            await send({
+                "type": "http.response.start",
+                "status": 503,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(REJECTED_BODY)).encode()),
+                    (b"retry-after", self.retry_after),
+                ],
+            })
+            await send({"type": "http.response.body", "body": REJECTED_BODY})
@@ -0,0 +1,140 @@
+"""
+Middleware ASGI de compressão com negociação de conteúdo.
+
+Comprime (brotli ou gzip, conforme o ``Accept-Encoding``) respostas de tipos
+textuais a partir de ``minimum_size`` bytes. Corpos completos passam pelo
+``CompressedBodyCache``; respostas em streaming são comprimidas parte a
+parte, sem cache. Streams SSE (``text/event-stream``), respostas já
+codificadas e parciais (``Content-Range``) passam intactas.
+"""
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.utils.compression import (
+    AVAILABLE_ENCODINGS,
+    CompressedBodyCache,
+    StreamingCompressor,
+    compress,
+    negotiate,
+)
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+)
+
+
+def is_compressible(content_type: str) -> bool:
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    if media_type == "text/event-stream":
+        return False
+    return (
+        media_type.startswith("text/")
+        or media_type in COMPRESSIBLE_TYPES
+        or media_type.endswith("+json")
+    )
+
+
+class CompressionMiddleware:
+    """Comprime respostas elegíveis na codificação aceita pelo cliente."""
+
+    def __init__(
+            self,
+            app: ASGIApp,
+            *,
+            minimum_size: int = 1024,
+            gzip_level: int = 6,
+            brotli_quality: int = 4,
+            cache: Optional[CompressedBodyCache] = None,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.cache = cache
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding", ""), AVAILABLE_ENCODINGS)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Optional[Message] = None
+        compressor: Optional[StreamingCompressor] = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message, compressor, passthrough
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                if (
+                        message["status"] in (204, 304)
+                        or "content-encoding" in headers
+                        or "content-range" in headers
+                        or not is_compressible(headers.get("content-type", ""))
+                ):
+                    passthrough = True
+                    await send(message)
+                else:
+                    # Adia o início até saber o tamanho do corpo
+                    start_message = message
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if start_message is not None:
+                start, start_message = start_message, None
+                headers = MutableHeaders(raw=list(start["headers"]))
+                headers.add_vary_header("Accept-Encoding")
+
+                if not more_body:
+                    # Corpo completo em uma única mensagem
+                    if len(body) < self.minimum_size:
+                        passthrough = True
+                        await send({**start, "headers": headers.raw})
+                        await send(message)
+                        return
+                    compressed = self._compress_body(body, encoding)
+                    headers["content-encoding"] = encoding
+                    headers["content-length"] = str(len(compressed))
+                    await send({**start, "headers": headers.raw})
+                    await send({"type": "http.response.body", "body": compressed})
+                    return
+
+                # Streaming: tamanho final desconhecido
+                compressor = StreamingCompressor(
+                    encoding, gzip_level=self.gzip_level, brotli_quality=self.brotli_quality
+                )
+                headers["content-encoding"] = encoding
+                if "content-length" in headers:
+                    del headers["content-length"]
+                await send({**start, "headers": headers.raw})
+
+            await send({
+                "type": "http.response.body",
+                "body": compressor.compress(body, final=not more_body),
+                "more_body": more_body,
+            })
+
+        await self.app(scope, receive, send_wrapper)
+
+    def _compress_body(self, body: bytes, encoding: str) -> bytes:
+        if self.cache is None:
+            return compress(body, encoding, gzip_level=self.gzip_level, brotli_quality=self.brotli_quality)
+        digest = self.cache.digest(body)
+        compressed = self.cache.get(encoding, digest)
+        if compressed is None:
+            compressed = compress(body, encoding, gzip_level=self.gzip_level, brotli_quality=self.brotli_quality)
+            self.cache.put(encoding, digest, compressed)
+        return compressed
@@ -0,0 +1,84 @@
+"""
+Middleware ASGI de descarte adaptativo de carga.
+
+Conta as requisições em andamento no worker e, quando o ``LoadShedder``
+indica sobrecarga, responde 503 com ``Retry-After`` às rotas de baixa
+prioridade (busca, estatísticas, métricas) antes de tocarem no banco. Rotas
+de detalhe e de autenticação continuam sendo atendidas, de modo que parte
+das requisições falha rápido em vez de todas falharem lentamente.
+
+Conexões longas não ocupam vagas de ``in_flight``: os paths excluídos (SSE)
+não são contados, e respostas em stream (sem ``content-length``, como os
+exports com ``?stream=true``) liberam a vaga ao enviar os cabeçalhos, para
+que clientes parados não façam o worker descartar o tráfego da API.
+"""
+import json
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.middleware.request_metrics import UNMATCHED_ROUTE, resolve_route
+from app.utils.load_shedding import LoadShedder
+from app.utils.prometheus import SHED_REQUESTS
+
+SHED_BODY = json.dumps({
+    "error": "Servidor sobrecarregado",
+    "detail": "Tente novamente em instantes",
+    "error_code": "OVERLOADED",
+}).encode()
+
+
+class LoadSheddingMiddleware:
+    """Rejeita rotas de baixa prioridade com 503 enquanto o worker está sobrecarregado."""
+
+    def __init__(self, app: ASGIApp, *, shedder: LoadShedder, retry_after: int = 5):
+        self.app = app
+        self.shedder = shedder
+        self.retry_after = str(retry_after).encode()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        shedder = self.shedder
+        if shedder.is_low_priority(scope["path"]):
+            reasons = shedder.overload_reasons()
+            if reasons:
+                shedder.shed += 1
+                SHED_REQUESTS.labels(resolve_route(scope) or UNMATCHED_ROUTE, reasons[0]).inc()
+                await self._reject(send)
+                return
+
+        if shedder.is_excluded(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        counted = True
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal counted
+            if counted and message["type"] == "http.response.start" and not any(
+                    name.lower() == b"content-length" for name, _ in message.get("headers", ())
+            ):
+                counted = False
+                shedder.in_flight -= 1
+            await send(message)
+
+        shedder.in_flight += 1
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            if counted:
+                shedder.in_flight -= 1
+
+    async def _reject(self, send: Send) -> None:
+        await send({
+            "type": "http.response.start",
+            "status": 503,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(SHED_BODY)).encode()),
+                (b"retry-after", self.retry_after),
+            ],
+        })
+        await send({"type": "http.response.body", "body": SHED_BODY})
@@ -0,0 +1,76 @@
+"""
+Middleware ASGI de telemetria por requisição.
+
+Registra latência, requisições em andamento, contagem por status e tamanho
+das respostas, rotulados pela rota *templated* (ex: ``/api/v1/membros/{id}``)
+para manter a cardinalidade dos rótulos limitada.
+"""
+import time
+from typing import Optional
+
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.utils.prometheus import (
+    REQUEST_LATENCY,
+    REQUESTS_IN_PROGRESS,
+    REQUESTS_TOTAL,
+    RESPONSE_SIZE,
+)
+
+# Rótulo usado para requisições que não casam com nenhuma rota (404)
+UNMATCHED_ROUTE = "unmatched"
+
+
+def resolve_route(scope: Scope) -> Optional[str]:
+    """Retorna o path templated da rota que atende a requisição, se houver."""
+    router = getattr(scope.get("app"), "router", None)
+    if router is None:
+        return None
+
+    partial = None
+    for route in router.routes:
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return getattr(route, "path_format", None) or getattr(route, "path", None)
+        if match == Match.PARTIAL and partial is None:
+            partial = getattr(route, "path_format", None) or getattr(route, "path", None)
+    return partial
+
+
+class PrometheusMiddleware:
+    """Coleta métricas Prometheus de cada requisição HTTP."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        route = resolve_route(scope) or UNMATCHED_ROUTE
+
+        status_code = 500
+        response_size = 0
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, response_size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                response_size += len(message.get("body", b""))
+            await send(message)
+
+        in_progress = REQUESTS_IN_PROGRESS.labels(method, route)
+        in_progress.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            in_progress.dec()
+            REQUEST_LATENCY.labels(method, route).observe(elapsed)
+            REQUESTS_TOTAL.labels(method, route, str(status_code)).inc()
+            RESPONSE_SIZE.labels(method, route).observe(response_size)
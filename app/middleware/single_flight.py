@@ -0,0 +1,113 @@
+"""
+Middleware ASGI de coalescência (*single-flight*) de GETs idênticos.
+
+Quando várias requisições GET públicas idênticas (mesmo path e mesmos
+parâmetros, em qualquer ordem) chegam ao mesmo tempo em um worker, apenas a
+primeira executa a rota; as demais aguardam e recebem os mesmos bytes de
+resposta. Isso limita a carga no banco em picos de acesso a um mesmo recurso,
+independentemente de quantos clientes pedem ao mesmo tempo.
+
+Requisições com ``Authorization`` ou ``Cookie`` nunca são coalescidas, assim
+como os paths excluídos (streams SSE, ``/metrics``, arquivos). Respostas em
+streaming (sem ``Content-Length``) não são guardadas: os seguidores executam
+a rota por conta própria.
+"""
+import asyncio
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.middleware.request_metrics import UNMATCHED_ROUTE, resolve_route
+from app.utils.prometheus import COALESCED_REQUESTS
+
+# Cabeçalhos que tornam a resposta específica de um cliente
+PRIVATE_HEADERS = (b"authorization", b"cookie")
+
+# Resposta gravada pela requisição líder: (http.response.start, corpo)
+CapturedResponse = Tuple[Message, bytes]
+
+
+class SingleFlightMiddleware:
+    """Compartilha a resposta de GETs públicos idênticos concorrentes."""
+
+    def __init__(self, app: ASGIApp, *, excluded_paths: Iterable[str] = ()):
+        self.app = app
+        self.excluded_paths = tuple(excluded_paths)
+        self._inflight: Dict[Tuple[str, str], "asyncio.Future[Optional[CapturedResponse]]"] = {}
+
+    def request_key(self, scope: Scope) -> Optional[Tuple[str, str]]:
+        """Chave de coalescência (path, query normalizada) ou None se não elegível."""
+        if scope["type"] != "http" or scope["method"] != "GET":
+            return None
+        path = scope["path"]
+        if self.excluded_paths and path.startswith(self.excluded_paths):
+            return None
+        for name, _ in scope["headers"]:
+            if name in PRIVATE_HEADERS:
+                return None
+        params = parse_qsl(scope.get("query_string", b"").decode("latin-1"), keep_blank_values=True)
+        return path, urlencode(sorted(params))
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        key = self.request_key(scope)
+        if key is None:
+            await self.app(scope, receive, send)
+            return
+
+        leader = self._inflight.get(key)
+        if leader is not None:
+            await self._follow(leader, scope, receive, send)
+            return
+
+        future: "asyncio.Future[Optional[CapturedResponse]]" = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        start_message: Optional[Message] = None
+        chunks: List[bytes] = []
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message
+            if message["type"] == "http.response.start":
+                start_message = message
+                if not any(name == b"content-length" for name, _ in message.get("headers", [])):
+                    # Streaming: não acumula o corpo em memória
+                    future.set_result(None)
+                    self._inflight.pop(key, None)
+            elif message["type"] == "http.response.body" and not future.done():
+                chunks.append(message.get("body", b""))
+                # Libera quem aguarda antes de escrever a última parte no socket
+                if not message.get("more_body", False):
+                    future.set_result((start_message, b"".join(chunks)))
+                    self._inflight.pop(key, None)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # Resposta incompleta (erro ou cancelamento): cada seguidor executa a rota
+            if not future.done():
+                future.set_result(None)
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    async def _follow(
+            self,
+            leader: "asyncio.Future[Optional[CapturedResponse]]",
+            scope: Scope,
+            receive: Receive,
+            send: Send,
+    ) -> None:
+        # shield: o cancelamento de um seguidor não pode cancelar o futuro compartilhado
+        captured = await asyncio.shield(leader)
+        if captured is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message, body = captured
+        COALESCED_REQUESTS.labels(resolve_route(scope) or UNMATCHED_ROUTE).inc()
+        await send({
+            "type": "http.response.start",
+            "status": start_message["status"],
+            "headers": [*start_message.get("headers", []), (b"x-coalesced", b"1")],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,48 @@
+"""
+Middleware ASGI que ativa a coleta de estatísticas de SQL por requisição.
+
+Abre um ``QueryStats`` no ``ContextVar`` da requisição, adiciona o header
+``Server-Timing`` à resposta e, ao final, loga a contagem de queries e os
+possíveis N+1. Só é registrado quando ``SQL_INSTRUMENTATION=true``.
+"""
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.utils.sql_instrumentation import (
+    QueryStats,
+    query_stats,
+    report,
+    server_timing_header,
+)
+
+
+class SQLTimingMiddleware:
+    """Contabiliza queries e tempo de banco de cada requisição HTTP."""
+
+    def __init__(self, app: ASGIApp, *, n_plus_one_threshold: int = 5):
+        self.app = app
+        self.n_plus_one_threshold = n_plus_one_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = query_stats.set(stats)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append(server_timing_header(stats))
+                message["headers"] = headers
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            query_stats.reset(token)
+            report(
+                stats,
+                request_label=f"{scope['method']} {scope['path']}",
+                n_plus_one_threshold=self.n_plus_one_threshold,
+            )
@@ -4,6 +4,7 @@ from .membro import Membro
 from .publicacao import Publicacao
 from .subgrupo import Subgrupo
 from .user import User
+from .tombstone import Tombstone
 
 __all__ = [
     "Base",
@@ -15,4 +16,5 @@ __all__ = [
     "Publicacao",
     "Subgrupo",
     "User",
+    "Tombstone",
 ]
@@ -1,4 +1,4 @@
-from sqlalchemy import String, Text
+from sqlalchemy import Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import Optional, TYPE_CHECKING
 
@@ -13,6 +13,10 @@ class Membro(Base, TimestampMixin):
     """Modelo para membros/pesquisadores."""
 
     __tablename__ = "membros"
+    __table_args__ = (
+        Index("ix_membros_updated_at_id", "updated_at", "id"),
+    )
+    __change_type__ = "membro"  # tipo no feed de alterações (/changes)
 
     id: Mapped[int] = mapped_column(primary_key=True)
     nome: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import String, Text, Enum, Date
+from sqlalchemy import Index, String, Text, Enum, Date
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import Optional, TYPE_CHECKING
 from datetime import date
@@ -25,6 +25,10 @@ class Publicacao(Base, TimestampMixin):
     """Modelo para publicações acadêmicas."""
 
     __tablename__ = "publicacao"
+    __table_args__ = (
+        Index("ix_publicacao_updated_at_id", "updated_at", "id"),
+    )
+    __change_type__ = "publicacao"  # tipo no feed de alterações (/changes)
 
     id: Mapped[int] = mapped_column(primary_key=True)
     title: Mapped[str] = mapped_column(String(500), nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import String, Text
+from sqlalchemy import Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import Optional, TYPE_CHECKING
 
@@ -13,6 +13,10 @@ class Subgrupo(Base, TimestampMixin):
     """Modelo para subgrupos de pesquisa."""
 
     __tablename__ = "subgrupo"
+    __table_args__ = (
+        Index("ix_subgrupo_updated_at_id", "updated_at", "id"),
+    )
+    __change_type__ = "subgrupo"  # tipo no feed de alterações (/changes)
 
     id: Mapped[int] = mapped_column(primary_key=True)
     nome_grupo: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
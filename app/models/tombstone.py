@@ -0,0 +1,80 @@
+from sqlalchemy import Index, Integer, String, TIMESTAMP, event, func, inspect as sa_inspect
+from sqlalchemy.orm import Mapped, Session, mapped_column
+from datetime import datetime, timezone
+from typing import Optional
+
+from .base import Base
+
+
+class Tombstone(Base):
+    """Registro de exclusão de uma entidade, para o feed de alterações (/changes)."""
+
+    __tablename__ = "tombstones"
+    __table_args__ = (
+        Index("ix_tombstones_deleted_at_id", "deleted_at", "id"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    entity_type: Mapped[str] = mapped_column(String(32), nullable=False)
+    entity_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    deleted_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        server_default=func.now(),
+        nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return f"<Tombstone(entity_type='{self.entity_type}', entity_id={self.entity_id})>"
+
+
+def _change_type(obj) -> Optional[str]:
+    """Tipo no feed de alterações (``__change_type__`` do modelo) ou None."""
+    return getattr(type(obj), "__change_type__", None)
+
+
+@event.listens_for(Session, "before_flush")
+def _track_changes(session: Session, flush_context, instances) -> None:
+    """
+    Mantém o feed de alterações coerente a cada flush:
+
+    - ``updated_at`` recebe o horário do flush (UTC, com microssegundos) em
+      inserções e alterações, inclusive só de relacionamentos;
+    - entidades do outro lado de uma associação criada ou removida também
+      têm ``updated_at`` atualizado;
+    - exclusões geram um ``Tombstone``.
+    """
+    now = datetime.now(timezone.utc)
+    related = set()
+
+    def collect(obj, *, current: bool) -> None:
+        state = sa_inspect(obj)
+        for relationship in state.mapper.relationships:
+            attr = state.attrs[relationship.key]
+            if current:
+                # Exclusão: todas as associações carregadas deixam de existir
+                value = attr.loaded_value
+                related.update(value if isinstance(value, list) else ())
+            else:
+                history = attr.history
+                related.update(history.added or ())
+                related.update(history.deleted or ())
+
+    for obj in session.new:
+        if _change_type(obj):
+            if obj.created_at is None:
+                obj.created_at = now
+            obj.updated_at = now
+            collect(obj, current=False)
+    for obj in session.dirty:
+        if _change_type(obj) and session.is_modified(obj):
+            obj.updated_at = now
+            collect(obj, current=False)
+    for obj in session.deleted:
+        change_type = _change_type(obj)
+        if change_type:
+            session.add(Tombstone(entity_type=change_type, entity_id=obj.id, deleted_at=now))
+            collect(obj, current=True)
+
+    for obj in related:
+        if _change_type(obj) and obj not in session.deleted and obj not in session.new:
+            obj.updated_at = now
@@ -1,3 +1,4 @@
+from .pagination import Page, paginate
 from .membro import (
     MembroBase,
     MembroCreate,
@@ -16,6 +17,11 @@ from .publicacao import (
     Publicacao,
     PublicacaoSummary,
     PublicacaoWithRelations,
+    PublicacaoSearchFilters,
+    PublicacaoSearchPage,
+    FacetBucket,
+    PublicacaoFacets,
+    PublicacaoPage,
 )
 from .subgrupo import (
     SubgrupoBase,
@@ -26,6 +32,23 @@ from .subgrupo import (
     SubgrupoSummary,
     SubgrupoWithRelations,
 )
+from .search import (
+    AutocompleteItem,
+    SearchHit,
+    SearchResponse,
+    TipoAutocomplete,
+)
+from .coautoria import (
+    CoautoriaNode,
+    CoautoriaEdge,
+    CoautoriaGraph,
+    Colaborador,
+)
+from .changes import (
+    ChangeFeed,
+    ChangeItem,
+    TipoEntidade,
+)
 from .user import (
     UserBase,
     UserCreate,
@@ -40,6 +63,9 @@ from .auth import (
 )
 
 __all__ = [
+    # Paginação
+    "Page",
+    "paginate",
     # Membro
     "MembroBase",
     "MembroCreate",
@@ -57,6 +83,11 @@ __all__ = [
     "Publicacao",
     "PublicacaoSummary",
     "PublicacaoWithRelations",
+    "PublicacaoSearchFilters",
+    "PublicacaoSearchPage",
+    "FacetBucket",
+    "PublicacaoFacets",
+    "PublicacaoPage",
     # Subgrupo
     "SubgrupoBase",
     "SubgrupoCreate",
@@ -65,6 +96,20 @@ __all__ = [
     "Subgrupo",
     "SubgrupoSummary",
     "SubgrupoWithRelations",
+    # Busca global e autocomplete
+    "AutocompleteItem",
+    "SearchHit",
+    "SearchResponse",
+    "TipoAutocomplete",
+    # Grafo de coautoria
+    "CoautoriaNode",
+    "CoautoriaEdge",
+    "CoautoriaGraph",
+    "Colaborador",
+    # Feed de alterações
+    "ChangeFeed",
+    "ChangeItem",
+    "TipoEntidade",
     # User
     "UserBase",
     "UserCreate",
@@ -79,4 +124,8 @@ __all__ = [
 
 MembroWithRelations.model_rebuild()
 PublicacaoWithRelations.model_rebuild()
-SubgrupoWithRelations.model_rebuild()
\ No newline at end of file
+PublicacaoSearchPage.model_rebuild()
+PublicacaoPage.model_rebuild()
+SubgrupoWithRelations.model_rebuild()
+ChangeItem.model_rebuild()
+ChangeFeed.model_rebuild()
@@ -0,0 +1,72 @@
+"""
+Feed de alterações para sincronização incremental (``GET /changes``).
+
+O cursor é opaco e aponta para a última alteração entregue: a chave
+(instante, origem, id) pela qual o feed é ordenado.
+"""
+import base64
+import binascii
+from datetime import datetime, timezone
+from typing import Literal, Optional, Tuple, Union
+
+from pydantic import BaseModel, Field
+
+from app.schemas.membro import MembroWithRelations
+from app.schemas.publicacao import PublicacaoWithRelations
+from app.schemas.subgrupo import SubgrupoWithRelations
+
+TipoEntidade = Literal["membro", "publicacao", "subgrupo"]
+
+# Posição no feed: (instante da alteração, origem, id na origem)
+ChangeKey = Tuple[datetime, str, int]
+
+
+def as_utc(value: datetime) -> datetime:
+    """Datetime com fuso UTC (o SQLite devolve horários sem fuso, já em UTC)."""
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+def encode_change_cursor(key: ChangeKey) -> str:
+    changed_at, source, id_ = key
+    raw = f"c:{as_utc(changed_at).isoformat()}|{source}|{id_}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_change_cursor(cursor: str) -> ChangeKey:
+    """
+    Posição codificada em um cursor gerado por ``encode_change_cursor``.
+
+    Raises:
+        ValueError: cursor inválido
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+    except (binascii.Error, UnicodeDecodeError):
+        raise ValueError("Cursor inválido") from None
+    prefix, _, rest = raw.partition(":")
+    parts = rest.split("|")
+    if prefix != "c" or len(parts) != 3 or not parts[2].isdigit():
+        raise ValueError("Cursor inválido")
+    try:
+        changed_at = as_utc(datetime.fromisoformat(parts[0]))
+    except ValueError:
+        raise ValueError("Cursor inválido") from None
+    return changed_at, parts[1], int(parts[2])
+
+
+class ChangeItem(BaseModel):
+    """Entidade criada, alterada ou excluída."""
+    type: TipoEntidade
+    id: int
+    action: Literal["created", "updated", "deleted"]
+    changed_at: datetime
+    data: Optional[Union[MembroWithRelations, PublicacaoWithRelations, SubgrupoWithRelations]] = Field(
+        None, description="Estado atual da entidade (None em exclusões)"
+    )
+
+
+class ChangeFeed(BaseModel):
+    """Página do feed de alterações, em ordem de ocorrência."""
+    changes: list[ChangeItem]
+    cursor: Optional[str] = Field(..., description="Informe em ``since`` na próxima consulta")
+    has_more: bool
@@ -0,0 +1,26 @@
+from pydantic import BaseModel, Field
+
+
+class CoautoriaNode(BaseModel):
+    """Membro no grafo de coautoria."""
+    id: int
+    nome: str
+    publicacoes: int = Field(..., description="Total de publicações do membro")
+
+
+class CoautoriaEdge(BaseModel):
+    """Coautoria entre dois membros (source < target)."""
+    source: int
+    target: int
+    weight: int = Field(..., description="Publicações em comum")
+
+
+class CoautoriaGraph(BaseModel):
+    """Grafo (ou ego-network) de coautoria."""
+    nodes: list[CoautoriaNode]
+    edges: list[CoautoriaEdge]
+
+
+class Colaborador(CoautoriaNode):
+    """Coautor de um membro."""
+    publicacoes_em_comum: int
@@ -0,0 +1,201 @@
+"""
+Sparse fieldsets (``?fields=``) e expansão de relações (``?include=``).
+
+O cliente escolhe os campos do recurso que quer receber (ex:
+``?fields=id,title,autores``). A seleção vale em duas pontas:
+
+- **SQL**: ``load_plan`` diz quais colunas do modelo e quais relações (com as
+  colunas do schema resumido de cada uma) devem ser carregadas. Colunas e
+  relações fora da seleção não são lidas do banco;
+- **Resposta**: ``sparse_schema`` gera (e guarda em cache) um schema com
+  apenas os campos pedidos, usado para validar e serializar os objetos ORM.
+
+``id`` é sempre incluído. Campos calculados (``*_url``) carregam junto as
+colunas ocultas (``*_path``) de onde são derivados.
+
+``include`` escolhe as relações expandidas (ex: ``?include=autores``) sobre
+os campos simples do recurso; cada rota decide se, sem ``include``, expande
+todas as relações (detalhe) ou nenhuma (listagens).
+"""
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, Type, get_args
+
+from pydantic import BaseModel, ConfigDict, TypeAdapter, computed_field, create_model
+from sqlalchemy import inspect as sa_inspect
+
+ALWAYS_INCLUDED = frozenset({"id"})
+
+
+def _public_fields(schema: Type[BaseModel]) -> List[str]:
+    """Campos expostos pelo schema: os não ocultos e os calculados."""
+    names = [name for name, field in schema.model_fields.items() if not field.exclude]
+    return names + list(schema.model_computed_fields)
+
+
+def _relation_fields(schema: Type[BaseModel]) -> List[str]:
+    """Campos do schema que expandem relações (``list[Schema]``)."""
+    return [name for name in schema.model_fields if _nested_schema(schema, name) is not None]
+
+
+def _split(raw: str) -> set:
+    return {name.strip() for name in raw.split(",") if name.strip()}
+
+
+def _hidden_fields(schema: Type[BaseModel]) -> List[str]:
+    """Campos ocultos (``exclude=True``), fonte dos campos calculados."""
+    return [name for name, field in schema.model_fields.items() if field.exclude]
+
+
+def _nested_schema(schema: Type[BaseModel], name: str) -> Optional[Type[BaseModel]]:
+    """Schema dos itens de um campo de relação (``list[Schema]``), se houver."""
+    args = get_args(schema.model_fields[name].annotation)
+    if args and isinstance(args[0], type) and issubclass(args[0], BaseModel):
+        return args[0]
+    return None
+
+
+def _schema_columns(schema: Type[BaseModel], model: Any) -> List[str]:
+    """Campos do schema (inclusive ocultos) que são colunas do modelo."""
+    columns = sa_inspect(model).column_attrs.keys()
+    return [name for name in schema.model_fields if name in columns]
+
+
+@lru_cache(maxsize=256)
+def sparse_schema(schema: Type[BaseModel], fields: FrozenSet[str]) -> Type[BaseModel]:
+    """
+    Schema derivado de ``schema`` só com ``fields`` (e as fontes dos campos
+    calculados escolhidos). Gerado uma vez por combinação.
+    """
+    computed = {
+        name: computed_field(decorator.info.wrapped_property, return_type=decorator.info.return_type)
+        for name, decorator in schema.__pydantic_decorators__.computed_fields.items()
+        if name in fields
+    }
+    base = type(
+        f"{schema.__name__}Base",
+        (BaseModel,),
+        {"model_config": ConfigDict(from_attributes=True), "__module__": schema.__module__, **computed},
+    )
+
+    selected = set(fields) - set(computed)
+    if computed:
+        selected.update(_hidden_fields(schema))
+    definitions = {
+        name: (field.annotation, field)
+        for name, field in schema.model_fields.items()
+        if name in selected
+    }
+    suffix = "".join(sorted(fields)).title().replace("_", "")
+    return create_model(f"{schema.__name__}Fields{suffix}", __base__=base, **definitions)
+
+
+@lru_cache(maxsize=256)
+def _adapter(schema: Type[BaseModel], many: bool) -> TypeAdapter:
+    return TypeAdapter(list[schema] if many else schema)
+
+
+class Fieldset:
+    """Seleção de campos de um schema de resposta."""
+
+    def __init__(self, schema: Type[BaseModel], fields: FrozenSet[str], *, default: bool = False):
+        self.schema = schema
+        self.fields = fields
+        # Seleção padrão da listagem (sem fields/include): a rota responde
+        # com o response_model, e a seleção só define o carregamento SQL
+        self.default = default
+
+    @classmethod
+    def parse(cls, schema: Type[BaseModel], raw: str) -> "Fieldset":
+        """
+        Interpreta ``raw`` (nomes separados por vírgula).
+
+        Raises:
+            ValueError: campo inexistente no schema ou seleção vazia
+        """
+        requested = _split(raw)
+        if not requested:
+            raise ValueError("Informe ao menos um campo em 'fields'")
+        public = _public_fields(schema)
+        unknown = sorted(requested - set(public))
+        if unknown:
+            raise ValueError(
+                f"Campos inválidos em 'fields': {', '.join(unknown)}. "
+                f"Disponíveis: {', '.join(public)}"
+            )
+        return cls(schema, frozenset(requested | ALWAYS_INCLUDED))
+
+    @classmethod
+    def from_query(
+            cls,
+            schema: Type[BaseModel],
+            fields: Optional[str] = None,
+            include: Optional[str] = None,
+            *,
+            expand: bool = True
+    ) -> Optional["Fieldset"]:
+        """
+        Seleção pedida por ``?fields=`` e ``?include=``.
+
+        Sem ``fields``, a resposta traz os campos simples do schema mais as
+        relações de ``include`` (ou todas, se ``expand``, ou nenhuma). Com
+        ``fields``, as relações de ``include`` se somam aos campos pedidos.
+        Retorna None quando a resposta é a completa (schema original) e uma
+        seleção ``default`` (campos simples) nas listagens sem parâmetros.
+
+        Raises:
+            ValueError: campo ou relação inexistente no schema
+        """
+        relations = _relation_fields(schema)
+        included = _split(include) if include is not None else set()
+        unknown = sorted(included - set(relations))
+        if unknown:
+            raise ValueError(
+                f"Relações inválidas em 'include': {', '.join(unknown)}. "
+                f"Disponíveis: {', '.join(relations)}"
+            )
+
+        if fields is not None:
+            return cls(schema, cls.parse(schema, fields).fields | included)
+        simple = [name for name in _public_fields(schema) if name not in relations]
+        if include is None:
+            if expand:
+                return None
+            return cls(schema, frozenset(simple), default=True)
+        return cls(schema, frozenset(simple) | included)
+
+    @property
+    def response_schema(self) -> Type[BaseModel]:
+        return sparse_schema(self.schema, self.fields)
+
+    def load_plan(self, model: Any) -> Tuple[List[str], Dict[str, List[str]]]:
+        """
+        Colunas de ``model`` e relações (com as colunas de cada uma) que a
+        seleção precisa, no formato de ``CRUDBase.load_options``.
+        """
+        mapper = sa_inspect(model)
+        response_fields = self.response_schema.model_fields
+        columns = [name for name in response_fields if name in mapper.column_attrs]
+        relations = {}
+        for name in response_fields:
+            if name in mapper.relationships:
+                nested = _nested_schema(self.schema, name)
+                target = mapper.relationships[name].mapper.class_
+                relations[name] = _schema_columns(nested, target) if nested else None
+        return columns, relations
+
+    def dump(self, content: Any) -> Any:
+        """
+        Valida e serializa (modo JSON) um objeto ORM ou o conteúdo de uma
+        página (``paginate``), trocando os itens pela forma reduzida.
+        """
+        if isinstance(content, dict) and "items" in content:
+            adapter = _adapter(self.response_schema, True)
+            items = adapter.validate_python(content["items"], from_attributes=True)
+            return {**content, "items": adapter.dump_python(items, mode="json")}
+        adapter = _adapter(self.response_schema, False)
+        return adapter.dump_python(adapter.validate_python(content, from_attributes=True), mode="json")
+
+    def encode(self, obj: Any) -> bytes:
+        """JSON (bytes) de um único objeto ORM, para respostas em streaming."""
+        adapter = _adapter(self.response_schema, False)
+        return adapter.dump_json(adapter.validate_python(obj, from_attributes=True))
@@ -0,0 +1,69 @@
+"""
+Resposta paginada genérica.
+
+As rotas de listagem declaram ``response_model=Page[Schema]`` e retornam os
+objetos ORM diretamente (via ``paginate``). O FastAPI valida a página uma
+única vez, lendo os atributos dos objetos (``from_attributes``), e o
+pydantic-core a serializa, sem o ``model_validate`` item a item seguido da
+revalidação e do ``jsonable_encoder`` que o ``response_model=dict`` exigia.
+"""
+import base64
+import binascii
+from typing import Any, Generic, Optional, Sequence, TypeVar
+
+from pydantic import BaseModel, ConfigDict, Field
+
+T = TypeVar("T")
+
+
+def encode_cursor(offset: int) -> str:
+    """Cursor opaco que aponta para o registro de posição ``offset``."""
+    return base64.urlsafe_b64encode(f"o:{offset}".encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    """
+    Posição codificada em um cursor gerado por ``encode_cursor``.
+
+    Raises:
+        ValueError: cursor inválido
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+    except (binascii.Error, UnicodeDecodeError):
+        raise ValueError("Cursor inválido") from None
+    prefix, _, offset = raw.partition(":")
+    if prefix != "o" or not offset.isdigit():
+        raise ValueError("Cursor inválido")
+    return int(offset)
+
+
+class Page(BaseModel, Generic[T]):
+    """Página de resultados."""
+    model_config = ConfigDict(from_attributes=True)
+
+    items: list[T]
+    total: int = Field(..., description="Total de registros que atendem aos filtros")
+    skip: int
+    limit: int
+    has_next: bool
+    cursor: Optional[str] = Field(None, description="Cursor da próxima página (None na última)")
+
+
+def paginate(items: Sequence[Any], total: int, skip: int, limit: int, **extra: Any) -> dict:
+    """
+    Monta o conteúdo de uma ``Page`` a partir dos objetos ORM da página.
+
+    Os itens não são convertidos aqui: a validação acontece uma única vez,
+    contra o ``response_model`` da rota.
+    """
+    has_next = skip + limit < total
+    return {
+        "items": items,
+        "total": total,
+        "skip": skip,
+        "limit": limit,
+        "has_next": has_next,
+        "cursor": encode_cursor(skip + limit) if has_next else None,
+        **extra,
+    }
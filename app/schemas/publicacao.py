@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, ConfigDict, computed_field
-from typing import Optional, TYPE_CHECKING
+from typing import Generic, Optional, Union, TYPE_CHECKING
 from datetime import datetime, date
 from enum import Enum
 
 from app.core.storage import get_file_url
+from app.schemas.pagination import Page, T
 
 if TYPE_CHECKING:
     from .membro import MembroSummary
@@ -93,4 +94,34 @@ class PublicacaoSummary(BaseModel):
 class PublicacaoWithRelations(Publicacao):
     """Schema para Publicação com relacionamentos."""
     autores: list[MembroSummary] = Field(default_factory=list)
-    subgrupos: list[SubgrupoSummary] = Field(default_factory=list)
\ No newline at end of file
+    subgrupos: list[SubgrupoSummary] = Field(default_factory=list)
+
+class PublicacaoSearchFilters(BaseModel):
+    """Filtros aplicados na busca avançada."""
+    query: str
+    tipo: Optional[TipoPublicacaoEnum] = None
+    year: Optional[int] = None
+
+
+class PublicacaoSearchPage(Page[T], Generic[T]):
+    """Página de resultados da busca avançada, com os filtros aplicados."""
+    filters: PublicacaoSearchFilters
+
+
+class FacetBucket(BaseModel):
+    """Contagem de publicações para um valor de faceta."""
+    value: Union[int, str]
+    label: Optional[str] = Field(None, description="Nome do subgrupo (faceta subgrupo)")
+    count: int
+
+
+class PublicacaoFacets(BaseModel):
+    """Contagens por tipo, ano e subgrupo dentro dos filtros da listagem."""
+    tipo: list[FacetBucket]
+    year: list[FacetBucket]
+    subgrupo: list[FacetBucket]
+
+
+class PublicacaoPage(Page[T], Generic[T]):
+    """Página de publicações, com as facetas quando pedidas (``facets=true``)."""
+    facets: Optional[PublicacaoFacets] = None
@@ -0,0 +1,28 @@
+from typing import Literal, Optional
+
+from pydantic import BaseModel, Field
+
+TipoResultado = Literal["membro", "subgrupo", "publicacao"]
+TipoAutocomplete = Literal["membro", "publicacao"]
+
+
+class SearchHit(BaseModel):
+    """Resultado da busca global."""
+    type: TipoResultado = Field(..., description="Tipo do recurso encontrado")
+    id: int
+    title: str = Field(..., description="Nome/título do recurso")
+    snippet: Optional[str] = Field(None, description="Trecho do texto em torno do termo buscado")
+    rank: int = Field(..., description="Relevância (maior = melhor)")
+
+
+class AutocompleteItem(BaseModel):
+    """Sugestão do autocomplete."""
+    id: int
+    label: str = Field(..., description="Nome do membro ou título da publicação")
+
+
+class SearchResponse(BaseModel):
+    """Resposta da busca global, ordenada por relevância."""
+    query: str
+    hits: list[SearchHit]
+    totals: dict[str, int] = Field(..., description="Total de ocorrências por tipo (antes do limite)")
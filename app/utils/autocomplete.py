@@ -0,0 +1,270 @@
+"""
+Índice em memória para autocomplete de nomes de membros e títulos de
+publicações.
+
+Cada worker mantém um ``PrefixIndex`` por tipo: arrays ordenados de textos
+e de palavras normalizados, consultados por busca binária. A normalização
+remove acentos e ignora maiúsculas ("saude" encontra "Saúde"); a consulta
+casa prefixos de palavras em qualquer posição ("sil ana" encontra "Ana
+Silva"). Uma consulta não acessa o banco e leva microssegundos.
+
+O índice é montado no startup e atualizado incrementalmente pelas escritas
+do próprio worker (eventos da sessão: alterações vistas no flush são
+aplicadas no commit e descartadas no rollback). Escritas feitas por outros
+workers entram na recarga periódica (``AUTOCOMPLETE_REFRESH_INTERVAL``).
+"""
+import asyncio
+import logging
+import re
+import time
+import unicodedata
+from bisect import bisect_left, insort
+from heapq import nsmallest
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import event, inspect as sa_inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.membro import Membro
+from app.models.publicacao import Publicacao
+
+logger = logging.getLogger(__name__)
+
+_WORD = re.compile(r"\w+")
+
+# Chave em ``Session.info`` das alterações pendentes até o commit
+_PENDING_KEY = "autocomplete_changes"
+
+
+def fold(text: str) -> str:
+    """Normaliza para comparação: sem acentos e em caixa baixa."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(char for char in decomposed if not unicodedata.combining(char)).casefold()
+
+
+class PrefixIndex:
+    """
+    Índice de prefixos sobre dois arrays ordenados: (texto normalizado, id),
+    para os que começam pela consulta, e (palavra, id), para prefixos de
+    palavras em qualquer posição.
+    """
+
+    def __init__(self):
+        self._sorted: List[Tuple[str, int]] = []  # (texto normalizado, id), ordenado
+        self._entries: List[Tuple[str, int]] = []  # (palavra, id), ordenado
+        self._labels: Dict[int, str] = {}
+        self._folded: Dict[int, str] = {}
+        self._words: Dict[int, Tuple[str, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def build(self, items: Iterable[Tuple[int, Optional[str]]]) -> None:
+        """Recria o índice com os pares (id, texto)."""
+        entries, labels, folded_labels, words = [], {}, {}, {}
+        for id_, label in items:
+            if not label:
+                continue
+            folded = fold(label)
+            labels[id_] = label
+            folded_labels[id_] = folded
+            words[id_] = tuple(sorted(set(_WORD.findall(folded))))
+            entries.extend((word, id_) for word in words[id_])
+        entries.sort()
+        self._sorted = sorted((folded, id_) for id_, folded in folded_labels.items())
+        self._entries, self._labels, self._folded, self._words = entries, labels, folded_labels, words
+
+    def add(self, id_: int, label: Optional[str]) -> None:
+        """Insere ou atualiza um registro."""
+        self.remove(id_)
+        if not label:
+            return
+        folded = fold(label)
+        self._labels[id_] = label
+        self._folded[id_] = folded
+        self._words[id_] = tuple(sorted(set(_WORD.findall(folded))))
+        insort(self._sorted, (folded, id_))
+        for word in self._words[id_]:
+            insort(self._entries, (word, id_))
+
+    def remove(self, id_: int) -> None:
+        """Remove um registro (sem efeito se não existir)."""
+        for word in self._words.pop(id_, ()):
+            _discard(self._entries, (word, id_))
+        folded = self._folded.pop(id_, None)
+        if folded is not None:
+            _discard(self._sorted, (folded, id_))
+        self._labels.pop(id_, None)
+
+    def _range(self, array: List[Tuple[str, int]], prefix: str) -> Tuple[int, int]:
+        """Intervalo de ``array`` cujas chaves começam com ``prefix``."""
+        return bisect_left(array, (prefix,)), bisect_left(array, (prefix + "\U0010ffff",))
+
+    def search(self, query: str, limit: int = 10) -> List[Tuple[int, str]]:
+        """
+        Registros em que cada termo de ``query`` é prefixo de alguma palavra.
+
+        Os que começam pela consulta inteira vêm primeiro; depois, ordem
+        alfabética.
+        """
+        terms = _WORD.findall(fold(query))
+        if not terms:
+            return []
+
+        # 1) Começam pela consulta: intervalo contíguo, já em ordem alfabética
+        start, end = self._range(self._sorted, " ".join(terms))
+        found = [id_ for _, id_ in self._sorted[start:min(end, start + limit)]]
+        if len(found) < limit:
+            # 2) Prefixo de palavra em qualquer posição: interseção dos IDs de
+            # cada termo, começando pelo mais seletivo
+            ranges = sorted(
+                (self._range(self._entries, term) for term in set(terms)),
+                key=lambda bounds: bounds[1] - bounds[0],
+            )
+            matches = None
+            for start, end in ranges:
+                ids = {id_ for _, id_ in self._entries[start:end]}
+                matches = ids if matches is None else matches & ids
+                if not matches:
+                    break
+            matches.difference_update(found)
+            found += [id_ for _, id_ in nsmallest(limit - len(found), ((self._folded[id_], id_) for id_ in matches))]
+        return [(id_, self._labels[id_]) for id_ in found]
+
+
+def _discard(array: List[Tuple[str, int]], item: Tuple[str, int]) -> None:
+    """Remove ``item`` de um array ordenado, se presente."""
+    position = bisect_left(array, item)
+    if position < len(array) and array[position] == item:
+        del array[position]
+
+
+class AutocompleteIndex:
+    """Índices de autocomplete do worker, por tipo de recurso."""
+
+    # tipo -> (modelo, atributo indexado)
+    SOURCES: Dict[str, Tuple[Any, str]] = {
+        "membro": (Membro, "nome"),
+        "publicacao": (Publicacao, "title"),
+    }
+
+    def __init__(self):
+        self.indexes: Dict[str, PrefixIndex] = {type_: PrefixIndex() for type_ in self.SOURCES}
+        self.loaded = False
+        self.built_at: Optional[float] = None
+        self._by_model = {model: (type_, attr) for type_, (model, attr) in self.SOURCES.items()}
+        self._installed = False
+        self._task: Optional[asyncio.Task] = None
+
+    # --- Carga ---
+
+    async def rebuild(self, db: AsyncSession) -> None:
+        """Recria todos os índices (só as colunas indexadas são lidas)."""
+        for type_, (model, attr) in self.SOURCES.items():
+            rows = (await db.execute(select(model.id, getattr(model, attr)))).all()
+            self.indexes[type_].build(rows)
+        self.loaded = True
+        self.built_at = time.time()
+
+    async def ensure_loaded(self, db: AsyncSession) -> None:
+        """Monta os índices na primeira consulta, se o startup não o fez."""
+        self.install()
+        if not self.loaded:
+            await self.rebuild(db)
+
+    def search(self, type_: str, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        return [{"id": id_, "label": label} for id_, label in self.indexes[type_].search(query, limit)]
+
+    # --- Atualização incremental (eventos da sessão) ---
+
+    def install(self) -> None:
+        """Registra os eventos de sessão que mantêm os índices atualizados."""
+        if self._installed:
+            return
+        event.listen(Session, "after_flush", self._after_flush)
+        event.listen(Session, "after_commit", self._after_commit)
+        event.listen(Session, "after_rollback", self._after_rollback)
+        self._installed = True
+
+    def _after_flush(self, session: Session, flush_context: Any) -> None:
+        pending = None
+        for obj in (*session.new, *session.dirty, *session.deleted):
+            source = self._by_model.get(type(obj))
+            if source is None:
+                continue
+            type_, attr = source
+            if obj in session.deleted:
+                change = (type_, obj.id, None, True)
+            elif obj in session.new or sa_inspect(obj).attrs[attr].history.has_changes():
+                change = (type_, obj.id, getattr(obj, attr), False)
+            else:
+                continue
+            if pending is None:
+                pending = session.info.setdefault(_PENDING_KEY, [])
+            pending.append(change)
+
+    def _after_commit(self, session: Session) -> None:
+        for type_, id_, label, deleted in session.info.pop(_PENDING_KEY, ()):
+            if deleted:
+                self.indexes[type_].remove(id_)
+            else:
+                self.indexes[type_].add(id_, label)
+
+    def _after_rollback(self, session: Session) -> None:
+        session.info.pop(_PENDING_KEY, None)
+
+    # --- Recarga periódica ---
+
+    async def _refresh(self) -> None:
+        from app.core.database import AsyncSessionLocal
+
+        async with AsyncSessionLocal() as db:
+            await self.rebuild(db)
+
+    async def _run(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self._refresh()
+            except Exception as e:
+                logger.warning(f"Autocomplete index refresh failed: {e}")
+
+    async def start(self, refresh_interval: float = 0) -> None:
+        """Monta os índices e agenda a recarga periódica (0 = sem recarga)."""
+        self.install()
+        start = time.perf_counter()
+        try:
+            await self._refresh()
+            logger.info(
+                f"Autocomplete index built in {(time.perf_counter() - start) * 1000:.0f} ms "
+                f"({', '.join(f'{len(index)} {type_}' for type_, index in self.indexes.items())})"
+            )
+        except Exception as e:
+            # Banco indisponível não impede o worker de subir: monta na primeira consulta
+            logger.warning(f"Autocomplete index build failed: {e}")
+        if refresh_interval > 0 and self._task is None:
+            self._task = asyncio.create_task(self._run(refresh_interval))
+
+    async def stop(self) -> None:
+        """Interrompe a recarga periódica."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def snapshot(self) -> dict:
+        """Estado atual (usado no /health detalhado)."""
+        return {
+            "loaded": self.loaded,
+            "built_at": self.built_at,
+            "entries": {type_: len(index) for type_, index in self.indexes.items()},
+        }
+
+
+# Instância global (por worker)
+autocomplete_index = AutocompleteIndex()
@@ -0,0 +1,172 @@
+"""
+Bulkheads por grupo de rotas.
+
+Cada grupo (busca, uploads, health detalhado...) tem um limite próprio de
+execuções simultâneas por worker e uma fila de espera com tamanho e timeout
+limitados. Assim, uma rajada em uma rota cara ocupa no máximo a sua fatia do
+event loop e do pool de conexões, em vez de esgotar os recursos das demais.
+
+Os grupos são declarados em ``settings.BULKHEADS``::
+
+    {"search": {"paths": ["*/search*"], "max_concurrent": 4,
+                "max_queue": 16, "queue_timeout": 2.0}}
+
+Chaves opcionais: ``methods`` (ex: ``["POST"]``) e ``query`` (pares
+``nome=valor`` dos quais pelo menos um deve estar na query string).
+"""
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from fnmatch import fnmatchcase
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional
+from urllib.parse import parse_qsl
+
+from starlette.types import Scope
+
+from app.core.config import settings
+from app.utils.prometheus import (
+    BULKHEAD_ACTIVE,
+    BULKHEAD_QUEUED,
+    BULKHEAD_REJECTED,
+    BULKHEAD_WAIT,
+)
+
+
+class BulkheadFull(Exception):
+    """Lançada quando não há vaga no grupo nem espaço/tempo na fila."""
+
+    def __init__(self, group: str, reason: str):
+        super().__init__(f"Bulkhead '{group}' full ({reason})")
+        self.group = group
+        self.reason = reason
+
+
+class Bulkhead:
+    """Limite de concorrência com fila limitada, baseado em ``asyncio.Semaphore``."""
+
+    def __init__(
+            self,
+            name: str,
+            max_concurrent: int,
+            max_queue: int = 0,
+            queue_timeout: Optional[float] = None,
+    ):
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.active = 0
+        self.queued = 0
+        self.rejected = 0
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+
+    def _reject(self, reason: str) -> BulkheadFull:
+        self.rejected += 1
+        BULKHEAD_REJECTED.labels(self.name, reason).inc()
+        return BulkheadFull(self.name, reason)
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[None]:
+        """
+        Ocupa uma vaga do grupo durante o bloco, aguardando na fila se preciso.
+
+        Raises:
+            BulkheadFull: fila cheia ou tempo de espera esgotado
+        """
+        start = time.perf_counter()
+        if self._semaphore.locked():
+            if self.queued >= self.max_queue:
+                raise self._reject("queue_full")
+            self.queued += 1
+            BULKHEAD_QUEUED.labels(self.name).inc()
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), self.queue_timeout)
+            except asyncio.TimeoutError:
+                raise self._reject("timeout") from None
+            finally:
+                self.queued -= 1
+                BULKHEAD_QUEUED.labels(self.name).dec()
+        else:
+            await self._semaphore.acquire()
+        BULKHEAD_WAIT.labels(self.name).observe(time.perf_counter() - start)
+
+        self.active += 1
+        BULKHEAD_ACTIVE.labels(self.name).inc()
+        try:
+            yield
+        finally:
+            self.active -= 1
+            BULKHEAD_ACTIVE.labels(self.name).dec()
+            self._semaphore.release()
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "active": self.active,
+            "queued": self.queued,
+            "max_concurrent": self.max_concurrent,
+            "max_queue": self.max_queue,
+            "rejected": self.rejected,
+        }
+
+
+class _RouteGroup:
+    """Critérios de um grupo de rotas: métodos, padrões de path e de query."""
+
+    __slots__ = ("methods", "paths", "query")
+
+    def __init__(self, paths: Iterable[str], methods: Iterable[str] = (), query: Iterable[str] = ()):
+        self.paths = tuple(paths)
+        self.methods = frozenset(m.upper() for m in methods)
+        self.query = frozenset(q.lower() for q in query)
+
+    def matches(self, scope: Scope) -> bool:
+        if self.methods and scope["method"] not in self.methods:
+            return False
+        if not any(fnmatchcase(scope["path"], pattern) for pattern in self.paths):
+            return False
+        if self.query:
+            pairs = parse_qsl(scope.get("query_string", b"").decode("latin-1"))
+            return any(f"{name}={value}".lower() in self.query for name, value in pairs)
+        return True
+
+
+class BulkheadRegistry:
+    """Associa cada requisição ao bulkhead do seu grupo (o primeiro que casar)."""
+
+    def __init__(self) -> None:
+        self._groups: List[tuple] = []
+
+    def add(self, bulkhead: Bulkhead, **criteria: Any) -> Bulkhead:
+        self._groups.append((_RouteGroup(**criteria), bulkhead))
+        return bulkhead
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Dict[str, Any]]) -> "BulkheadRegistry":
+        """Cria os bulkheads a partir da declaração em ``settings.BULKHEADS``."""
+        registry = cls()
+        for name, spec in config.items():
+            registry.add(
+                Bulkhead(
+                    name,
+                    max_concurrent=spec["max_concurrent"],
+                    max_queue=spec.get("max_queue", 0),
+                    queue_timeout=spec.get("queue_timeout"),
+                ),
+                paths=spec["paths"],
+                methods=spec.get("methods", ()),
+                query=spec.get("query", ()),
+            )
+        return registry
+
+    def match(self, scope: Scope) -> Optional[Bulkhead]:
+        for group, bulkhead in self._groups:
+            if group.matches(scope):
+                return bulkhead
+        return None
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {bulkhead.name: bulkhead.snapshot() for _, bulkhead in self._groups}
+
+
+# Bulkheads globais (por worker)
+bulkheads = BulkheadRegistry.from_config(settings.BULKHEADS)
@@ -0,0 +1,324 @@
+"""
+Grafo de coautoria entre membros, em memória.
+
+Dois membros são vizinhos quando assinam alguma publicação juntos; o peso da
+aresta é o número de publicações em comum. Cada worker mantém, por membro,
+dois arrays paralelos (vizinhos ordenados por ID e pesos), montados a partir
+de uma única leitura de ``publicacao_autores``: ego-networks, principais
+colaboradores e a exportação do grafo inteiro saem sem consultar o banco,
+sem o self-join da tabela de autoria a cada requisição.
+
+As escritas do próprio worker atualizam o grafo incrementalmente (eventos
+da sessão, como no autocomplete: alterações vistas no flush são aplicadas
+no commit e descartadas no rollback). Escritas feitas por outros workers
+entram na recarga periódica (``COAUTHORSHIP_REFRESH_INTERVAL``).
+"""
+import asyncio
+import logging
+import time
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from heapq import nlargest
+from itertools import combinations, groupby
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import event, inspect as sa_inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.associations import publicacao_autores
+from app.models.membro import Membro
+from app.models.publicacao import Publicacao
+
+logger = logging.getLogger(__name__)
+
+# Chave em ``Session.info`` das alterações pendentes até o commit
+_PENDING_KEY = "coauthorship_changes"
+
+
+class CoauthorshipGraph:
+    """Grafo de coautoria ponderado, com listas de adjacência em arrays."""
+
+    def __init__(self):
+        self._neighbors: Dict[int, array] = {}  # membro -> vizinhos (ordenados)
+        self._weights: Dict[int, array] = {}  # membro -> pesos (alinhados a _neighbors)
+        self._authors: Dict[int, Tuple[int, ...]] = {}  # publicação -> autores
+        self._publications: Dict[int, Set[int]] = {}  # membro -> publicações
+        self._names: Dict[int, str] = {}
+        self.loaded = False
+        self.built_at: Optional[float] = None
+        self._installed = False
+        self._task: Optional[asyncio.Task] = None
+
+    # --- Estrutura ---
+
+    def build(self, names: Iterable[Tuple[int, str]], authorship: Iterable[Tuple[int, int]]) -> None:
+        """
+        Recria o grafo a partir dos pares (id, nome) dos membros e dos pares
+        (publicação, membro) da autoria, ordenados por publicação.
+        """
+        authors: Dict[int, Tuple[int, ...]] = {}
+        publications: Dict[int, Set[int]] = {}
+        pairs: Counter = Counter()
+        for publicacao_id, rows in groupby(authorship, key=lambda row: row[0]):
+            members = tuple(sorted({membro_id for _, membro_id in rows}))
+            authors[publicacao_id] = members
+            for membro_id in members:
+                publications.setdefault(membro_id, set()).add(publicacao_id)
+            pairs.update(combinations(members, 2))
+
+        adjacency: Dict[int, List[Tuple[int, int]]] = {}
+        for (a, b), weight in pairs.items():
+            adjacency.setdefault(a, []).append((b, weight))
+            adjacency.setdefault(b, []).append((a, weight))
+        neighbors, weights = {}, {}
+        for membro_id, edges in adjacency.items():
+            edges.sort()
+            neighbors[membro_id] = array("l", (b for b, _ in edges))
+            weights[membro_id] = array("l", (weight for _, weight in edges))
+
+        self._neighbors, self._weights = neighbors, weights
+        self._authors, self._publications = authors, publications
+        self._names = dict(names)
+
+    def _bump(self, a: int, b: int, delta: int) -> None:
+        """Soma ``delta`` ao peso da aresta a -> b (removida ao chegar a zero)."""
+        neighbors = self._neighbors.setdefault(a, array("l"))
+        weights = self._weights.setdefault(a, array("l"))
+        position = bisect_left(neighbors, b)
+        if position < len(neighbors) and neighbors[position] == b:
+            weights[position] += delta
+            if weights[position] <= 0:
+                del neighbors[position]
+                del weights[position]
+        elif delta > 0:
+            neighbors.insert(position, b)
+            weights.insert(position, delta)
+        if not neighbors:
+            del self._neighbors[a], self._weights[a]
+
+    def set_authors(self, publicacao_id: int, membro_ids: Iterable[int]) -> None:
+        """Define os autores de uma publicação (vazio = publicação removida)."""
+        new = tuple(sorted(set(membro_ids)))
+        old = self._authors.get(publicacao_id, ())
+        if new == old:
+            return
+        for a, b in combinations(old, 2):
+            self._bump(a, b, -1)
+            self._bump(b, a, -1)
+        for a, b in combinations(new, 2):
+            self._bump(a, b, 1)
+            self._bump(b, a, 1)
+        for membro_id in set(old) - set(new):
+            members_pubs = self._publications.get(membro_id)
+            if members_pubs is not None:
+                members_pubs.discard(publicacao_id)
+                if not members_pubs:
+                    del self._publications[membro_id]
+        for membro_id in new:
+            self._publications.setdefault(membro_id, set()).add(publicacao_id)
+        if new:
+            self._authors[publicacao_id] = new
+        else:
+            self._authors.pop(publicacao_id, None)
+
+    def add_author(self, publicacao_id: int, membro_id: int) -> None:
+        self.set_authors(publicacao_id, (*self._authors.get(publicacao_id, ()), membro_id))
+
+    def remove_author(self, publicacao_id: int, membro_id: int) -> None:
+        self.set_authors(publicacao_id, (id_ for id_ in self._authors.get(publicacao_id, ()) if id_ != membro_id))
+
+    def remove_member(self, membro_id: int) -> None:
+        """Remove um membro e todas as suas autorias."""
+        for publicacao_id in list(self._publications.get(membro_id, ())):
+            self.remove_author(publicacao_id, membro_id)
+        self._names.pop(membro_id, None)
+
+    def set_name(self, membro_id: int, nome: str) -> None:
+        self._names[membro_id] = nome
+
+    # --- Consultas ---
+
+    def __contains__(self, membro_id: int) -> bool:
+        return membro_id in self._names
+
+    def _node(self, membro_id: int) -> Dict[str, Any]:
+        return {
+            "id": membro_id,
+            "nome": self._names.get(membro_id, ""),
+            "publicacoes": len(self._publications.get(membro_id, ())),
+        }
+
+    def _top(self, membro_id: int, limit: int) -> List[Tuple[int, int]]:
+        """(coautor, peso) com mais publicações em comum (empates: menor ID primeiro)."""
+        edges = zip(self._neighbors.get(membro_id, ()), self._weights.get(membro_id, ()))
+        return nlargest(limit, edges, key=lambda edge: (edge[1], -edge[0]))
+
+    def top_collaborators(self, membro_id: int, limit: int = 10) -> List[Dict[str, Any]]:
+        """Coautores com mais publicações em comum."""
+        return [
+            {**self._node(neighbor), "publicacoes_em_comum": weight}
+            for neighbor, weight in self._top(membro_id, limit)
+        ]
+
+    def ego_network(self, membro_id: int, limit: int = 50) -> Dict[str, Any]:
+        """
+        Membro, seus ``limit`` principais coautores e as arestas entre todos
+        eles (inclusive entre coautores).
+        """
+        members = sorted({membro_id, *(neighbor for neighbor, _ in self._top(membro_id, limit))})
+        return {"nodes": [self._node(id_) for id_ in members], "edges": self._edges_among(members)}
+
+    def _edges_among(self, members: Sequence[int], min_weight: int = 1) -> List[Dict[str, int]]:
+        """Arestas (a < b) entre os membros de ``members`` (ordenado)."""
+        member_set = set(members)
+        edges = []
+        for a in members:
+            neighbors = self._neighbors.get(a)
+            if neighbors is None:
+                continue
+            weights = self._weights[a]
+            # Só vizinhos de ID maior: cada aresta aparece uma vez
+            for position in range(bisect_left(neighbors, a + 1), len(neighbors)):
+                b = neighbors[position]
+                if b in member_set and weights[position] >= min_weight:
+                    edges.append({"source": a, "target": b, "weight": weights[position]})
+        return edges
+
+    def export(self, min_weight: int = 1) -> Dict[str, Any]:
+        """Grafo inteiro: membros com ao menos uma aresta de peso ``min_weight``."""
+        members = sorted(self._neighbors)
+        edges = self._edges_among(members, min_weight)
+        connected = sorted({id_ for edge in edges for id_ in (edge["source"], edge["target"])})
+        return {"nodes": [self._node(id_) for id_ in connected], "edges": edges}
+
+    # --- Carga ---
+
+    async def rebuild(self, db: AsyncSession) -> None:
+        """Recria o grafo (uma leitura de membros e uma da tabela de autoria)."""
+        names = (await db.execute(select(Membro.id, Membro.nome))).all()
+        authorship = (await db.execute(
+            select(publicacao_autores.c.publicacao_id, publicacao_autores.c.membro_id)
+            .order_by(publicacao_autores.c.publicacao_id)
+        )).all()
+        self.build(names, authorship)
+        self.loaded = True
+        self.built_at = time.time()
+
+    async def ensure_loaded(self, db: AsyncSession) -> None:
+        """Monta o grafo na primeira consulta, se o startup não o fez."""
+        self.install()
+        if not self.loaded:
+            await self.rebuild(db)
+
+    # --- Atualização incremental (eventos da sessão) ---
+
+    def install(self) -> None:
+        """Registra os eventos de sessão que mantêm o grafo atualizado."""
+        if self._installed:
+            return
+        event.listen(Session, "after_flush", self._after_flush)
+        event.listen(Session, "after_commit", self._after_commit)
+        event.listen(Session, "after_rollback", self._after_rollback)
+        self._installed = True
+
+    def _after_flush(self, session: Session, flush_context: Any) -> None:
+        changes = []
+        for obj in (*session.new, *session.dirty, *session.deleted):
+            if isinstance(obj, Publicacao):
+                if obj in session.deleted:
+                    changes.append(("authors", obj.id, ()))
+                    continue
+                attr = sa_inspect(obj).attrs.autores
+                if obj in session.new or attr.history.has_changes():
+                    changes.append(("authors", obj.id, tuple(autor.id for autor in obj.autores)))
+            elif isinstance(obj, Membro):
+                if obj in session.deleted:
+                    changes.append(("remove_member", obj.id, None))
+                    continue
+                state = sa_inspect(obj)
+                if obj in session.new or state.attrs.nome.history.has_changes():
+                    changes.append(("name", obj.id, obj.nome))
+                # Autoria alterada pelo lado do membro
+                history = state.attrs.publicacoes.history
+                changes.extend(("add_author", publicacao.id, obj.id) for publicacao in history.added or ())
+                changes.extend(("remove_author", publicacao.id, obj.id) for publicacao in history.deleted or ())
+        if changes:
+            session.info.setdefault(_PENDING_KEY, []).extend(changes)
+
+    def _after_commit(self, session: Session) -> None:
+        for kind, id_, value in session.info.pop(_PENDING_KEY, ()):
+            if kind == "authors":
+                self.set_authors(id_, value)
+            elif kind == "add_author":
+                self.add_author(id_, value)
+            elif kind == "remove_author":
+                self.remove_author(id_, value)
+            elif kind == "remove_member":
+                self.remove_member(id_)
+            else:
+                self.set_name(id_, value)
+
+    def _after_rollback(self, session: Session) -> None:
+        session.info.pop(_PENDING_KEY, None)
+
+    # --- Recarga periódica ---
+
+    async def _refresh(self) -> None:
+        from app.core.database import AsyncSessionLocal
+
+        async with AsyncSessionLocal() as db:
+            await self.rebuild(db)
+
+    async def _run(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self._refresh()
+            except Exception as e:
+                logger.warning(f"Coauthorship graph refresh failed: {e}")
+
+    async def start(self, refresh_interval: float = 0) -> None:
+        """Monta o grafo e agenda a recarga periódica (0 = sem recarga)."""
+        self.install()
+        start = time.perf_counter()
+        try:
+            await self._refresh()
+            logger.info(
+                f"Coauthorship graph built in {(time.perf_counter() - start) * 1000:.0f} ms "
+                f"({len(self._names)} members, {self.edge_count()} edges)"
+            )
+        except Exception as e:
+            # Banco indisponível não impede o worker de subir: monta na primeira consulta
+            logger.warning(f"Coauthorship graph build failed: {e}")
+        if refresh_interval > 0 and self._task is None:
+            self._task = asyncio.create_task(self._run(refresh_interval))
+
+    async def stop(self) -> None:
+        """Interrompe a recarga periódica."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def edge_count(self) -> int:
+        return sum(len(neighbors) for neighbors in self._neighbors.values()) // 2
+
+    def snapshot(self) -> dict:
+        """Estado atual (usado no /health detalhado)."""
+        return {
+            "loaded": self.loaded,
+            "built_at": self.built_at,
+            "members": len(self._names),
+            "publications": len(self._authors),
+            "edges": self.edge_count(),
+        }
+
+
+# Instância global (por worker)
+coauthorship_graph = CoauthorshipGraph()
@@ -0,0 +1,151 @@
+"""
+Compressão de respostas HTTP (gzip e, se instalado, brotli).
+
+- ``negotiate`` escolhe a codificação a partir do ``Accept-Encoding``;
+- ``compress`` / ``streaming_compressor`` comprimem corpos completos ou em
+  partes (respostas em streaming, com flush a cada parte);
+- ``CompressedBodyCache`` guarda os corpos já comprimidos, indexados pelo
+  digest do corpo original: payloads quentes (a mesma página servida várias
+  vezes) são comprimidos uma única vez por worker.
+"""
+import gzip
+import hashlib
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Dict, Optional, Sequence, Tuple
+
+from app.core.config import settings
+from app.utils.prometheus import COMPRESSION_CACHE
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli é opcional
+    brotli = None
+
+# Codificações suportadas, em ordem de preferência do servidor
+AVAILABLE_ENCODINGS: Tuple[str, ...] = ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def negotiate(accept_encoding: str, available: Sequence[str] = AVAILABLE_ENCODINGS) -> Optional[str]:
+    """
+    Codificação a usar segundo o ``Accept-Encoding`` do cliente.
+
+    Maior ``q`` vence; empates ficam com a ordem de ``available``. ``q=0``
+    recusa a codificação e ``*`` vale para as não citadas. None = sem
+    compressão.
+    """
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name.strip()] = q
+
+    best, best_q = None, 0.0
+    for encoding in available:
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def compress(data: bytes, encoding: str, *, gzip_level: int = 6, brotli_quality: int = 4) -> bytes:
+    """Comprime um corpo completo (gzip com ``mtime=0``: saída determinística)."""
+    if encoding == "br":
+        return brotli.compress(data, quality=brotli_quality)
+    return gzip.compress(data, compresslevel=gzip_level, mtime=0)
+
+
+class StreamingCompressor:
+    """Compressor incremental: cada parte sai comprimida e com flush."""
+
+    def __init__(self, encoding: str, *, gzip_level: int = 6, brotli_quality: int = 4):
+        self.encoding = encoding
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=brotli_quality)
+        else:
+            # wbits 16 + MAX_WBITS: formato gzip
+            self._zlib = zlib.compressobj(gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, chunk: bytes, *, final: bool = False) -> bytes:
+        if self.encoding == "br":
+            data = self._brotli.process(chunk)
+            return data + (self._brotli.finish() if final else self._brotli.flush())
+        data = self._zlib.compress(chunk)
+        return data + self._zlib.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+
+class CompressedBodyCache:
+    """
+    LRU de corpos comprimidos, limitado pelo total de bytes guardados.
+
+    A chave é (codificação, digest BLAKE2 do corpo original): calcular o
+    digest custa uma fração da compressão.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple[str, bytes], bytes]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def digest(body: bytes) -> bytes:
+        return hashlib.blake2b(body, digest_size=16).digest()
+
+    def get(self, encoding: str, digest: bytes) -> Optional[bytes]:
+        with self._lock:
+            compressed = self._entries.get((encoding, digest))
+            if compressed is None:
+                self.misses += 1
+                COMPRESSION_CACHE.labels("miss").inc()
+                return None
+            self._entries.move_to_end((encoding, digest))
+            self.hits += 1
+        COMPRESSION_CACHE.labels("hit").inc()
+        return compressed
+
+    def put(self, encoding: str, digest: bytes, compressed: bytes) -> None:
+        if len(compressed) > self.max_bytes:
+            return
+        with self._lock:
+            key = (encoding, digest)
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._entries[key] = compressed
+            self._size += len(compressed)
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def snapshot(self) -> dict:
+        """Estado atual (usado no /health detalhado)."""
+        with self._lock:
+            return {
+                "encodings": list(AVAILABLE_ENCODINGS),
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+# Instância global (por worker)
+compressed_cache = CompressedBodyCache(settings.COMPRESSION_CACHE_MAX_BYTES)
@@ -0,0 +1,34 @@
+"""
+Importação preguiçosa de módulos pesados e pouco usados.
+
+``lazy_import`` devolve o módulo registrado em ``sys.modules``, mas só executa
+o código dele no primeiro acesso a um atributo. Assim o boot do worker não
+paga, por exemplo, o psutil (usado apenas pelo amostrador de métricas) nem o
+passlib/bcrypt (usado apenas no login e no cadastro de usuários).
+"""
+import importlib.util
+import sys
+from types import ModuleType
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    Importa ``name`` de forma preguiçosa.
+
+    Se o módulo já foi importado, devolve a instância existente. Lança
+    ModuleNotFoundError imediatamente se o módulo não estiver instalado.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
@@ -0,0 +1,142 @@
+"""
+Detecção de sobrecarga do worker para o descarte adaptativo de carga.
+
+Três sinais são combinados:
+
+- atraso do event loop, medido por uma task que dorme um intervalo fixo e
+  compara o tempo real decorrido com o esperado;
+- número de requisições em andamento no worker (sem as conexões longas:
+  paths excluídos e respostas em stream, depois de enviados os cabeçalhos);
+- espera por conexões do pool (média móvel da latência de checkout enquanto
+  há requisições aguardando conexão).
+
+Quando qualquer sinal passa do limite configurado, o worker é considerado
+sobrecarregado e o ``LoadSheddingMiddleware`` rejeita as rotas de baixa
+prioridade com 503, preservando capacidade para as demais.
+"""
+import asyncio
+import logging
+from fnmatch import fnmatchcase
+from typing import Any, Dict, Iterable, List, Optional
+
+from app.core.config import settings
+from app.utils.pool_metrics import pool_stats
+from app.utils.prometheus import EVENT_LOOP_LAG
+
+logger = logging.getLogger(__name__)
+
+
+class LoopLagMonitor:
+    """Mede continuamente o atraso do event loop do worker."""
+
+    def __init__(self, interval: float = 0.1, decay: float = 0.3):
+        self.interval = interval
+        self.decay = decay
+        self.lag = 0.0
+        self.max_lag = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def record(self, lag: float) -> None:
+        """Atualiza o atraso: sobe imediatamente e desce de forma suave."""
+        if lag >= self.lag:
+            self.lag = lag
+        else:
+            self.lag += self.decay * (lag - self.lag)
+        self.max_lag = max(self.max_lag, lag)
+        EVENT_LOOP_LAG.set(self.lag)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            self.record(max(0.0, loop.time() - start - self.interval))
+
+    def start(self) -> None:
+        """Inicia a medição no event loop atual."""
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Interrompe a medição."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+
+class LoadShedder:
+    """Decide se o worker está sobrecarregado e quais rotas podem ser descartadas."""
+
+    def __init__(
+            self,
+            monitor: LoopLagMonitor,
+            *,
+            max_loop_lag_ms: float,
+            max_in_flight: int,
+            max_pool_wait_ms: float,
+            low_priority_paths: Iterable[str] = (),
+            excluded_paths: Iterable[str] = (),
+    ):
+        self.monitor = monitor
+        self.max_loop_lag = max_loop_lag_ms / 1000
+        self.max_in_flight = max_in_flight
+        self.max_pool_wait = max_pool_wait_ms / 1000
+        self.low_priority_paths = tuple(low_priority_paths)
+        self.excluded_paths = tuple(excluded_paths)
+        self.in_flight = 0
+        self.shed = 0
+
+    def is_low_priority(self, path: str) -> bool:
+        """Indica se o path casa com algum padrão de baixa prioridade (glob)."""
+        return any(fnmatchcase(path, pattern) for pattern in self.low_priority_paths)
+
+    def is_excluded(self, path: str) -> bool:
+        """Indica se o path fica fora da contagem de requisições em andamento (glob)."""
+        return any(fnmatchcase(path, pattern) for pattern in self.excluded_paths)
+
+    def pool_wait(self) -> float:
+        """Espera atual por conexões (0 quando ninguém aguarda o pool)."""
+        return pool_stats.checkout_time_ewma if pool_stats.waiting > 0 else 0.0
+
+    def overload_reasons(self) -> List[str]:
+        """Sinais acima do limite neste momento (lista vazia = sem sobrecarga)."""
+        reasons = []
+        if self.max_loop_lag and self.monitor.lag > self.max_loop_lag:
+            reasons.append("loop_lag")
+        if self.max_in_flight and self.in_flight > self.max_in_flight:
+            reasons.append("in_flight")
+        if self.max_pool_wait and self.pool_wait() > self.max_pool_wait:
+            reasons.append("pool_wait")
+        return reasons
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Estado atual dos sinais, para o health check detalhado."""
+        return {
+            "overloaded": bool(self.overload_reasons()),
+            "loop_lag_ms": round(self.monitor.lag * 1000, 2),
+            "loop_lag_ms_max": round(self.monitor.max_lag * 1000, 2),
+            "in_flight": self.in_flight,
+            "pool_wait_ms": round(self.pool_wait() * 1000, 2),
+            "shed_requests": self.shed,
+        }
+
+
+# Instâncias globais (uma por worker)
+loop_lag_monitor = LoopLagMonitor()
+load_shedder = LoadShedder(
+    loop_lag_monitor,
+    max_loop_lag_ms=settings.LOAD_SHED_MAX_LOOP_LAG_MS,
+    max_in_flight=settings.LOAD_SHED_MAX_IN_FLIGHT,
+    max_pool_wait_ms=settings.LOAD_SHED_MAX_POOL_WAIT_MS,
+    low_priority_paths=settings.LOAD_SHED_LOW_PRIORITY_PATHS,
+    excluded_paths=settings.LOAD_SHED_EXCLUDED_PATHS,
+)
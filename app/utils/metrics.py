@@ -1,17 +1,50 @@
 """
 Módulo para coletar métricas de sistema e infraestrutura.
+
+As coletas são feitas por um amostrador em segundo plano (``MetricsSampler``),
+de forma que o endpoint de health check apenas lê a última amostra em memória
+em vez de bloquear o event loop medindo CPU.
 """
-import psutil
+import asyncio
+import json
+import logging
+import os
 import time
-from typing import Dict, Any
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, Any, Optional, Set
 from datetime import datetime
 
+from app.core.config import settings
+from app.utils.lazy import lazy_import
+from app.utils.timeseries import TimeSeriesStore
+
+# psutil só é carregado na primeira coleta (feita pelo amostrador em segundo plano)
+psutil = lazy_import("psutil")
+
+logger = logging.getLogger(__name__)
+
+# Processo atual reaproveitado entre coletas: cpu_percent(interval=None)
+# calcula o uso desde a chamada anterior no mesmo objeto Process.
+_process = None
+
+
+def _current_process():
+    """Objeto ``psutil.Process`` do processo atual, recriado após um fork."""
+    global _process
+    if _process is None or _process.pid != os.getpid():
+        _process = psutil.Process()
+    return _process
 
-def get_cpu_metrics() -> Dict[str, Any]:
+
+def get_cpu_metrics(interval: Optional[float] = None) -> Dict[str, Any]:
     """
     Coleta métricas de CPU.
+
+    Args:
+        interval: Janela de medição em segundos. None (padrão) não bloqueia e
+            retorna o uso desde a coleta anterior.
     """
-    cpu_percent = psutil.cpu_percent(interval=1)
+    cpu_percent = psutil.cpu_percent(interval=interval)
     cpu_count = psutil.cpu_count(logical=True)
     cpu_count_physical = psutil.cpu_count(logical=False)
     cpu_freq = psutil.cpu_freq()
@@ -126,15 +159,19 @@ def get_network_metrics() -> Dict[str, Any]:
     return metrics
 
 
-def get_process_metrics() -> Dict[str, Any]:
+def get_process_metrics(interval: Optional[float] = None) -> Dict[str, Any]:
     """
     Coleta métricas do processo atual da aplicação.
+
+    Args:
+        interval: Janela de medição de CPU em segundos. None (padrão) não
+            bloqueia e retorna o uso desde a coleta anterior.
     """
-    process = psutil.Process()
+    process = _current_process()
 
     with process.oneshot():
         memory_info = process.memory_info()
-        cpu_percent = process.cpu_percent(interval=0.1)
+        cpu_percent = process.cpu_percent(interval=interval)
 
         metrics = {
             "pid": process.pid,
@@ -180,3 +217,195 @@ def get_all_metrics() -> Dict[str, Any]:
         "network": get_network_metrics(),
         "process": get_process_metrics(),
     }
+
+
+class MetricsSampler:
+    """
+    Amostrador de métricas em segundo plano.
+
+    Coleta as métricas de sistema, processo, disco e rede a cada ``interval``
+    segundos (em uma thread, para não bloquear o event loop) e guarda as
+    últimas ``buffer_size`` amostras em um ring buffer.
+
+    Assinantes (ex: streams SSE do dashboard) recebem cada amostra já
+    serializada uma única vez, junto com o resultado dos health checks
+    registrados, que só são executados enquanto houver assinantes.
+
+    Se um ``TimeSeriesStore`` for informado, cada amostra também alimenta o
+    histórico, que é persistido a cada ``flush_interval`` segundos.
+    """
+
+    def __init__(
+            self,
+            interval: float = 2.0,
+            buffer_size: int = 150,
+            history: Optional[TimeSeriesStore] = None,
+            flush_interval: float = 60.0,
+    ):
+        self.interval = interval
+        self.buffer: Deque[Dict[str, Any]] = deque(maxlen=buffer_size)
+        self.history = history
+        self.flush_interval = flush_interval
+        self.check_results: Dict[str, str] = {}
+        self._checks: Dict[str, Callable[[], Awaitable[Any]]] = {}
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        """Indica se a task de amostragem está ativa."""
+        return self._task is not None and not self._task.done()
+
+    def sample(self) -> Dict[str, Any]:
+        """Coleta uma amostra (sem bloquear) e a adiciona ao buffer."""
+        snapshot = get_all_metrics()
+        self.buffer.append(snapshot)
+        if self.history is not None:
+            self.history.record_snapshot(snapshot)
+        return snapshot
+
+    def latest(self) -> Dict[str, Any]:
+        """
+        Retorna a amostra mais recente.
+        Se o amostrador ainda não coletou nada, coleta uma amostra na hora.
+        """
+        if self.buffer:
+            return self.buffer[-1]
+        return self.sample()
+
+    def samples(self, limit: Optional[int] = None) -> list[Dict[str, Any]]:
+        """Retorna as amostras do buffer, da mais antiga para a mais recente."""
+        samples = list(self.buffer)
+        if limit is not None:
+            samples = samples[-limit:]
+        return samples
+
+    def add_check(self, name: str, check: Callable[[], Awaitable[Any]]) -> None:
+        """
+        Registra um health check assíncrono (ex: ``SELECT 1`` no banco).
+        O check é considerado saudável se terminar sem exceção.
+        """
+        self._checks[name] = check
+
+    async def run_checks(self) -> Dict[str, str]:
+        """Executa os health checks registrados e guarda os resultados."""
+        for name, check in self._checks.items():
+            try:
+                await asyncio.wait_for(check(), timeout=self.interval)
+                self.check_results[name] = "healthy"
+            except Exception as e:
+                self.check_results[name] = "unhealthy"
+                logger.error(f"Health check '{name}' failed: {e}")
+        return self.check_results
+
+    def health_event(self) -> Dict[str, Any]:
+        """
+        Monta o payload no mesmo formato de ``/health?detailed=true`` a partir
+        da última amostra e do último resultado dos checks.
+        """
+        checks = {"api": "healthy"}
+        for name in self._checks:
+            checks[name] = self.check_results.get(name, "unknown")
+        healthy = all(result != "unhealthy" for result in checks.values())
+        return {
+            "status": "healthy" if healthy else "unhealthy",
+            "timestamp": datetime.utcnow().isoformat(),
+            "version": settings.VERSION,
+            "service": settings.PROJECT_NAME,
+            "checks": checks,
+            "metrics": self.latest(),
+        }
+
+    def subscribe(self) -> asyncio.Queue:
+        """
+        Registra um assinante. A fila guarda apenas o evento mais recente:
+        assinantes lentos perdem amostras intermediárias em vez de acumulá-las.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        """Remove um assinante."""
+        self._subscribers.discard(queue)
+
+    def publish(self, event: bytes) -> None:
+        """Entrega o mesmo evento serializado a todos os assinantes."""
+        for queue in self._subscribers:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(event)
+
+    async def _flush_history(self) -> None:
+        """Persiste o histórico (se configurado) sem bloquear o event loop."""
+        if self.history is None or not self.history.path:
+            return
+        try:
+            await asyncio.to_thread(self.history.flush)
+        except Exception as e:
+            logger.error(f"Error flushing metrics history: {e}")
+
+    async def _run(self) -> None:
+        """Loop de coleta periódica."""
+        if self.history is not None and self.history.path:
+            try:
+                await asyncio.to_thread(self.history.load)
+            except Exception as e:
+                logger.error(f"Error loading metrics history: {e}")
+
+        last_flush = time.monotonic()
+        while True:
+            try:
+                await asyncio.to_thread(self.sample)
+                if self._subscribers:
+                    await self.run_checks()
+                    self.publish(format_sse(self.health_event()))
+            except Exception as e:
+                logger.error(f"Error sampling metrics: {e}")
+
+            if time.monotonic() - last_flush >= self.flush_interval:
+                await self._flush_history()
+                last_flush = time.monotonic()
+
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        """Inicia a task de amostragem no event loop atual."""
+        if self.running:
+            return
+        # Primeira leitura apenas inicializa os contadores de CPU do psutil
+        psutil.cpu_percent(interval=None)
+        _current_process().cpu_percent(interval=None)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Interrompe a task de amostragem."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        await self._flush_history()
+
+
+def format_sse(data: Dict[str, Any], event: Optional[str] = None) -> bytes:
+    """Serializa um payload como evento Server-Sent Events."""
+    message = f"data: {json.dumps(data)}\n\n"
+    if event:
+        message = f"event: {event}\n{message}"
+    return message.encode()
+
+
+# Histórico de métricas (persistido em SQLite se METRICS_HISTORY_PATH definido)
+metrics_history = TimeSeriesStore(path=settings.METRICS_HISTORY_PATH)
+
+# Instância global do amostrador (iniciada no lifespan da aplicação)
+metrics_sampler = MetricsSampler(
+    interval=settings.METRICS_SAMPLE_INTERVAL,
+    buffer_size=settings.METRICS_BUFFER_SIZE,
+    history=metrics_history,
+    flush_interval=settings.METRICS_HISTORY_FLUSH_INTERVAL,
+)
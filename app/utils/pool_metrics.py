@@ -0,0 +1,144 @@
+"""
+Telemetria do pool de conexões do banco de dados.
+
+Mede a latência de checkout (inclui espera por conexão livre, abertura de
+conexões e pre-ping), quantas requisições estão aguardando conexão, o uso de
+overflow e o tempo de vida das conexões. Os valores ficam disponíveis em
+``/health?detailed=true`` e em ``/metrics``.
+"""
+import time
+from typing import Any, Dict
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, Pool
+
+from app.utils.prometheus import (
+    POOL_CHECKED_OUT,
+    POOL_CHECKOUT_LATENCY,
+    POOL_CHECKOUT_TIMEOUTS,
+    POOL_CONNECTION_LIFETIME,
+    POOL_OVERFLOW,
+    POOL_WAITING,
+)
+
+
+class PoolStats:
+    """Estatísticas acumuladas do pool no processo (worker) atual."""
+
+    def __init__(self) -> None:
+        self.checkouts = 0
+        self.checkout_time_total = 0.0
+        self.checkout_time_max = 0.0
+        self.checkout_time_ewma = 0.0
+        self.waiting = 0
+        self.waiting_max = 0
+        self.timeouts = 0
+        self.connections_opened = 0
+        self.connections_closed = 0
+        self.lifetime_total = 0.0
+        self.lifetime_max = 0.0
+
+    def checkout_started(self) -> None:
+        self.waiting += 1
+        self.waiting_max = max(self.waiting_max, self.waiting)
+        POOL_WAITING.inc()
+
+    def checkout_finished(self, elapsed: float) -> None:
+        self.waiting -= 1
+        self.checkouts += 1
+        self.checkout_time_total += elapsed
+        self.checkout_time_max = max(self.checkout_time_max, elapsed)
+        # Média móvel exponencial: reflete a espera recente, não a histórica
+        self.checkout_time_ewma += 0.2 * (elapsed - self.checkout_time_ewma)
+        POOL_WAITING.dec()
+        POOL_CHECKOUT_LATENCY.observe(elapsed)
+
+    def connection_closed(self, lifetime: float) -> None:
+        self.connections_closed += 1
+        self.lifetime_total += lifetime
+        self.lifetime_max = max(self.lifetime_max, lifetime)
+        POOL_CONNECTION_LIFETIME.observe(lifetime)
+
+    def snapshot(self, pool: Pool) -> Dict[str, Any]:
+        """Estado atual do pool mais as estatísticas acumuladas."""
+        data: Dict[str, Any] = {
+            "pool_class": type(pool).__name__,
+            "checkouts": self.checkouts,
+            "checkout_ms_avg": round(self.checkout_time_total / self.checkouts * 1000, 3)
+            if self.checkouts else 0.0,
+            "checkout_ms_max": round(self.checkout_time_max * 1000, 3),
+            "checkout_ms_recent": round(self.checkout_time_ewma * 1000, 3),
+            "waiting": self.waiting,
+            "waiting_max": self.waiting_max,
+            "timeouts": self.timeouts,
+            "connections_opened": self.connections_opened,
+            "connections_closed": self.connections_closed,
+            "connection_lifetime_s_avg": round(self.lifetime_total / self.connections_closed, 2)
+            if self.connections_closed else None,
+            "connection_lifetime_s_max": round(self.lifetime_max, 2),
+        }
+        # Apenas pools com fila (QueuePool) expõem tamanho e overflow
+        if hasattr(pool, "overflow"):
+            data.update({
+                "size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": pool.overflow(),
+            })
+        return data
+
+
+# Estatísticas globais do pool do engine da aplicação
+pool_stats = PoolStats()
+
+
+class CheckoutTimingMixin:
+    """Mixin de pool que mede a latência e a fila de checkout."""
+
+    def connect(self):
+        pool_stats.checkout_started()
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            pool_stats.timeouts += 1
+            POOL_CHECKOUT_TIMEOUTS.inc()
+            raise
+        finally:
+            pool_stats.checkout_finished(time.perf_counter() - start)
+
+
+class InstrumentedAsyncQueuePool(CheckoutTimingMixin, AsyncAdaptedQueuePool):
+    """``AsyncAdaptedQueuePool`` instrumentado (modo de conexão direta)."""
+
+
+class InstrumentedNullPool(CheckoutTimingMixin, NullPool):
+    """``NullPool`` instrumentado (modo PgBouncer: uma conexão por checkout)."""
+
+
+def instrument_pool(pool: Pool) -> None:
+    """Registra os listeners de ciclo de vida das conexões no pool."""
+
+    def _update_gauges() -> None:
+        if hasattr(pool, "overflow"):
+            POOL_CHECKED_OUT.set(pool.checkedout())
+            POOL_OVERFLOW.set(max(pool.overflow(), 0))
+
+    @event.listens_for(pool, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        connection_record.info["opened_at"] = time.monotonic()
+        pool_stats.connections_opened += 1
+
+    @event.listens_for(pool, "close")
+    def _on_close(dbapi_connection, connection_record):
+        opened_at = connection_record.info.pop("opened_at", None)
+        if opened_at is not None:
+            pool_stats.connection_closed(time.monotonic() - opened_at)
+
+    @event.listens_for(pool, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        _update_gauges()
+
+    @event.listens_for(pool, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        _update_gauges()
@@ -0,0 +1,166 @@
+"""
+Métricas Prometheus da aplicação (telemetria por requisição).
+
+Com vários workers do gunicorn, cada processo grava seus valores em arquivos
+mmap no diretório indicado por ``PROMETHEUS_MULTIPROC_DIR``; na exposição, o
+``MultiProcessCollector`` agrega os arquivos de todos os workers. Sem essa
+variável (desenvolvimento, testes), usa-se o registro padrão do processo.
+"""
+import os
+from typing import Tuple
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client import multiprocess
+
+# Buckets de latência (segundos)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Buckets de tamanho de resposta (bytes)
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Latência das requisições HTTP por rota",
+    ["method", "route"],
+    buckets=LATENCY_BUCKETS,
+)
+
+REQUESTS_TOTAL = Counter(
+    "http_requests_total",
+    "Total de requisições HTTP por rota e status",
+    ["method", "route", "status"],
+)
+
+REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "Requisições HTTP em andamento por rota",
+    ["method", "route"],
+    multiprocess_mode="livesum",
+)
+
+RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes",
+    "Tamanho do corpo das respostas HTTP por rota",
+    ["method", "route"],
+    buckets=SIZE_BUCKETS,
+)
+
+COALESCED_REQUESTS = Counter(
+    "http_requests_coalesced_total",
+    "GETs atendidos com a resposta de uma requisição idêntica em andamento",
+    ["route"],
+)
+
+SHED_REQUESTS = Counter(
+    "http_requests_shed_total",
+    "Requisições rejeitadas com 503 pelo descarte de carga",
+    ["route", "reason"],
+)
+
+EVENT_LOOP_LAG = Gauge(
+    "event_loop_lag_seconds",
+    "Atraso do event loop do worker (média móvel)",
+    multiprocess_mode="livemax",
+)
+
+COMPRESSION_CACHE = Counter(
+    "http_compression_cache_total",
+    "Consultas ao cache de corpos comprimidos (hit/miss)",
+    ["result"],
+)
+
+
+# --- Bulkheads por grupo de rotas ---
+
+BULKHEAD_ACTIVE = Gauge(
+    "bulkhead_active",
+    "Requisições em execução em cada bulkhead",
+    ["group"],
+    multiprocess_mode="livesum",
+)
+
+BULKHEAD_QUEUED = Gauge(
+    "bulkhead_queued",
+    "Requisições aguardando vaga em cada bulkhead",
+    ["group"],
+    multiprocess_mode="livesum",
+)
+
+BULKHEAD_WAIT = Histogram(
+    "bulkhead_wait_seconds",
+    "Tempo de espera por uma vaga no bulkhead",
+    ["group"],
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+
+BULKHEAD_REJECTED = Counter(
+    "bulkhead_rejected_total",
+    "Requisições rejeitadas pelo bulkhead (fila cheia ou timeout)",
+    ["group", "reason"],
+)
+
+
+def is_multiprocess() -> bool:
+    """Indica se o modo multiprocesso (gunicorn) está ativo."""
+    return bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """
+    Gera a exposição das métricas no formato texto do Prometheus.
+
+    Returns:
+        Tupla (conteúdo, content-type)
+    """
+    if is_multiprocess():
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+# --- Pool de conexões do banco ---
+
+POOL_CHECKOUT_LATENCY = Histogram(
+    "db_pool_checkout_duration_seconds",
+    "Tempo para obter uma conexão do pool (espera, abertura e pre-ping)",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0, 30.0),
+)
+
+POOL_CHECKOUT_TIMEOUTS = Counter(
+    "db_pool_checkout_timeouts_total",
+    "Checkouts que estouraram o pool_timeout",
+)
+
+POOL_WAITING = Gauge(
+    "db_pool_waiting",
+    "Checkouts de conexão em andamento (fila de espera do pool)",
+    multiprocess_mode="livesum",
+)
+
+POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out",
+    "Conexões do pool em uso",
+    multiprocess_mode="livesum",
+)
+
+POOL_OVERFLOW = Gauge(
+    "db_pool_overflow",
+    "Conexões abertas além de pool_size (overflow)",
+    multiprocess_mode="livesum",
+)
+
+POOL_CONNECTION_LIFETIME = Histogram(
+    "db_pool_connection_lifetime_seconds",
+    "Tempo de vida das conexões fechadas pelo pool",
+    buckets=(1, 10, 60, 300, 900, 1800, 3600, 7200, 86400),
+)
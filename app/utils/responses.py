@@ -0,0 +1,39 @@
+"""
+Classe de resposta JSON padrão da aplicação.
+
+Serializa com orjson (ou, na sua ausência, com o ``to_json`` do
+pydantic-core, escrito em Rust) em vez do encoder ``json`` da biblioteca
+padrão usado pelo ``JSONResponse`` do Starlette. Conteúdo que já está em
+``bytes`` (ex: respostas pré-serializadas guardadas em cache) é enviado como
+está, sem ser decodificado e codificado de novo.
+"""
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json, to_jsonable_python
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson é opcional
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    """Converte tipos que o orjson não conhece (Decimal, sets, modelos...)."""
+    return to_jsonable_python(value)
+
+
+def dumps(content: Any) -> bytes:
+    """Serializa ``content`` em JSON compacto (UTF-8)."""
+    if orjson is not None:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return to_json(content)
+
+
+class FastJSONResponse(JSONResponse):
+    """``JSONResponse`` com serialização rápida e passagem direta de ``bytes``."""
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return dumps(content)
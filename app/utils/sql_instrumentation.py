@@ -0,0 +1,111 @@
+"""
+Instrumentação de SQL por requisição.
+
+Hooks de eventos do SQLAlchemy contam os statements e o tempo gasto no banco
+dentro de cada requisição (via ``ContextVar``), registram queries lentas e
+sinalizam possíveis N+1 (o mesmo formato de statement repetido muitas vezes
+na mesma requisição). Os hooks só são instalados quando
+``SQL_INSTRUMENTATION=true``; desligado, não há custo algum.
+"""
+import logging
+import re
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PARAM_RE = re.compile(r"\$\d+|%\(\w+\)s|%s|(?<!:):\w+|\?")
+_IN_LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_sql(statement: str) -> str:
+    """
+    Normaliza um statement SQL para o seu "formato": literais e parâmetros
+    viram ``?`` e listas de IN são colapsadas, de forma que a mesma query com
+    valores diferentes produza o mesmo texto.
+    """
+    sql = _STRING_RE.sub("?", statement)
+    sql = _PARAM_RE.sub("?", sql)
+    sql = _NUMBER_RE.sub("?", sql)
+    sql = _IN_LIST_RE.sub("(?...)", sql)
+    return _WHITESPACE_RE.sub(" ", sql).strip()
+
+
+class QueryStats:
+    """Estatísticas de SQL acumuladas durante uma requisição."""
+
+    __slots__ = ("count", "duration", "shapes")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.duration = 0.0  # segundos
+        self.shapes: Dict[str, int] = {}
+
+    def record(self, shape: str, elapsed: float) -> None:
+        """Registra a execução de um statement."""
+        self.count += 1
+        self.duration += elapsed
+        self.shapes[shape] = self.shapes.get(shape, 0) + 1
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """Formatos executados pelo menos ``threshold`` vezes (suspeitos de N+1)."""
+        return [(shape, n) for shape, n in self.shapes.items() if n >= threshold]
+
+
+# Estatísticas da requisição corrente (None fora de uma requisição instrumentada)
+query_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def install(engine: AsyncEngine, *, slow_query_ms: float) -> None:
+    """
+    Instala os hooks de instrumentação no engine.
+
+    Args:
+        engine: Engine assíncrono da aplicação
+        slow_query_ms: Statements mais lentos que este limite são logados
+    """
+    sync_engine = engine.sync_engine
+    slow_query_seconds = slow_query_ms / 1000
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_start_time"].pop()
+        stats = query_stats.get()
+        shape = None
+
+        if stats is not None:
+            shape = normalize_sql(statement)
+            stats.record(shape, elapsed)
+
+        if elapsed >= slow_query_seconds:
+            logger.warning(
+                f"Slow query ({elapsed * 1000:.1f} ms): {shape or normalize_sql(statement)}"
+            )
+
+    logger.info(f"SQL instrumentation enabled (slow query threshold: {slow_query_ms} ms)")
+
+
+def report(stats: QueryStats, *, request_label: str, n_plus_one_threshold: int) -> None:
+    """Loga o resumo de SQL de uma requisição e os formatos suspeitos de N+1."""
+    logger.info(
+        f"{request_label} - {stats.count} queries, {stats.duration * 1000:.1f} ms in database"
+    )
+    for shape, n in stats.repeated(n_plus_one_threshold):
+        logger.warning(f"Possible N+1 in {request_label}: {n}x {shape}")
+
+
+def server_timing_header(stats: QueryStats) -> Tuple[bytes, bytes]:
+    """Monta o header ``Server-Timing`` com o tempo e a contagem de queries."""
+    value = f'db;dur={stats.duration * 1000:.2f};desc="{stats.count} queries"'
+    return b"server-timing", value.encode("latin-1")
@@ -0,0 +1,39 @@
+"""
+Serialização incremental de listas JSON.
+
+Em vez de montar todos os objetos e uma única string JSON em memória, cada
+item é serializado assim que chega (ex: do cursor do banco) e os bytes são
+enviados em partes de ~``chunk_size``. O tempo até o primeiro byte e a
+memória usada passam a depender do tamanho da parte, não do resultado.
+"""
+from typing import Any, AsyncIterable, AsyncIterator, Callable
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+async def iter_json_array(
+        items: AsyncIterable[Any],
+        encode: Callable[[Any], bytes],
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> AsyncIterator[bytes]:
+    """
+    Gera um array JSON (``[item,item,...]``) em partes.
+
+    Args:
+        items: Itens na ordem da resposta
+        encode: Serializa um item em JSON (bytes)
+        chunk_size: Tamanho aproximado de cada parte enviada
+    """
+    buffer = bytearray(b"[")
+    first = True
+    async for item in items:
+        if not first:
+            buffer += b","
+        first = False
+        buffer += encode(item)
+        if len(buffer) >= chunk_size:
+            yield bytes(buffer)
+            buffer.clear()
+    buffer += b"]"
+    yield bytes(buffer)
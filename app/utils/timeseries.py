@@ -0,0 +1,265 @@
+"""
+Armazenamento compacto de séries temporais das métricas de infraestrutura.
+
+Cada série guarda os pontos em ring buffers de ``array('d')`` em três
+resoluções (1 s, 1 min e 15 min). Os pontos de cada resolução são médias das
+amostras recebidas no intervalo, calculadas incrementalmente a cada registro.
+Opcionalmente os pontos são persistidos em um arquivo SQLite para sobreviver
+a reinícios. Cada worker do gunicorn grava as próprias linhas (a chave inclui
+o PID do processo no momento do flush, já que com ``preload_app`` o store é
+criado no master antes do fork); na carga, os pontos de um mesmo instante são
+combinados pela média entre os workers.
+"""
+import logging
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Resoluções disponíveis: nome -> (passo em segundos, capacidade em pontos)
+RESOLUTIONS: Dict[str, Tuple[int, int]] = {
+    "1s": (1, 3600),      # 1 hora
+    "1m": (60, 1440),     # 24 horas
+    "15m": (900, 672),    # 7 dias
+}
+
+# Séries extraídas de cada amostra do MetricsSampler
+SERIES: Dict[str, Callable[[Dict[str, Any]], Optional[float]]] = {
+    "cpu": lambda m: m["cpu"]["usage_percent"],
+    "memory": lambda m: m["memory"]["percent"],
+    "disk": lambda m: m["disk"]["partitions"][0]["percent"] if m["disk"]["partitions"] else None,
+    "network_sent_mb": lambda m: m["network"]["bytes_sent_mb"],
+    "network_recv_mb": lambda m: m["network"]["bytes_recv_mb"],
+    "process_cpu": lambda m: m["process"]["cpu_percent"],
+    "process_memory_mb": lambda m: m["process"]["memory_rss_mb"],
+}
+
+_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def parse_range(value: str) -> int:
+    """
+    Converte um intervalo como ``"90s"``, ``"15m"``, ``"1h"`` ou ``"7d"`` em
+    segundos. Lança ValueError se o formato for inválido.
+    """
+    value = value.strip().lower()
+    if value.isdigit():
+        return int(value)
+    number, unit = value[:-1], value[-1:]
+    if unit not in _UNITS or not number.isdigit() or int(number) <= 0:
+        raise ValueError(f"Intervalo inválido: '{value}'")
+    return int(number) * _UNITS[unit]
+
+
+class RingBuffer:
+    """Buffer circular de pontos (timestamp, valor) com capacidade fixa."""
+
+    __slots__ = ("capacity", "times", "values", "next", "size")
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.times = array("d", bytes(8 * capacity))
+        self.values = array("d", bytes(8 * capacity))
+        self.next = 0
+        self.size = 0
+
+    def append(self, ts: float, value: float) -> None:
+        """Adiciona um ponto, sobrescrevendo o mais antigo quando cheio."""
+        self.times[self.next] = ts
+        self.values[self.next] = value
+        self.next = (self.next + 1) % self.capacity
+        if self.size < self.capacity:
+            self.size += 1
+
+    def last_time(self) -> Optional[float]:
+        """Timestamp do ponto mais recente."""
+        if not self.size:
+            return None
+        return self.times[(self.next - 1) % self.capacity]
+
+    def points(self, since: float = 0.0) -> List[Tuple[float, float]]:
+        """Pontos com timestamp maior ou igual a ``since``, do mais antigo ao mais novo."""
+        start = (self.next - self.size) % self.capacity
+        result = []
+        for i in range(self.size):
+            idx = (start + i) % self.capacity
+            ts = self.times[idx]
+            if ts >= since:
+                result.append((ts, self.values[idx]))
+        return result
+
+
+class _Rollup:
+    """Ring buffer de uma resolução mais o acumulador do intervalo corrente."""
+
+    __slots__ = ("step", "ring", "bucket", "total", "count", "flushed_until")
+
+    def __init__(self, step: int, capacity: int):
+        self.step = step
+        self.ring = RingBuffer(capacity)
+        self.bucket: Optional[float] = None
+        self.total = 0.0
+        self.count = 0
+        self.flushed_until = 0.0
+
+    def add(self, ts: float, value: float) -> None:
+        bucket = ts - ts % self.step
+        if self.bucket is not None and bucket != self.bucket:
+            self.ring.append(self.bucket, self.total / self.count)
+            self.total, self.count = 0.0, 0
+        self.bucket = bucket
+        self.total += value
+        self.count += 1
+
+    def points(self, since: float) -> List[Tuple[float, float]]:
+        points = self.ring.points(since)
+        # Inclui o intervalo ainda aberto (média parcial) para não atrasar a série
+        if self.count and self.bucket is not None and self.bucket >= since:
+            points.append((self.bucket, self.total / self.count))
+        return points
+
+
+class TimeSeriesStore:
+    """
+    Armazena as séries de métricas em memória, com persistência opcional.
+
+    Alimentado pelo ``MetricsSampler`` a cada amostra; as consultas não tocam
+    no banco da aplicação nem no psutil.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._series: Dict[str, Dict[str, _Rollup]] = {
+            name: {res: _Rollup(step, capacity) for res, (step, capacity) in RESOLUTIONS.items()}
+            for name in SERIES
+        }
+        self._lock = threading.Lock()
+
+    def record(self, values: Dict[str, float], ts: Optional[float] = None) -> None:
+        """Registra um valor para cada série informada."""
+        ts = time.time() if ts is None else ts
+        with self._lock:
+            for name, value in values.items():
+                rollups = self._series.get(name)
+                if rollups is None or value is None:
+                    continue
+                for rollup in rollups.values():
+                    rollup.add(ts, float(value))
+
+    def record_snapshot(self, snapshot: Dict[str, Any], ts: Optional[float] = None) -> None:
+        """Extrai as séries de uma amostra do ``MetricsSampler`` e as registra."""
+        values = {}
+        for name, extract in SERIES.items():
+            try:
+                values[name] = extract(snapshot)
+            except (KeyError, IndexError, TypeError):
+                continue
+        self.record(values, ts)
+
+    @staticmethod
+    def choose_resolution(range_seconds: int) -> str:
+        """Resolução mais fina cuja capacidade cobre o intervalo pedido."""
+        for name, (step, capacity) in RESOLUTIONS.items():
+            if step * capacity >= range_seconds:
+                return name
+        return list(RESOLUTIONS)[-1]
+
+    def query(
+            self,
+            series: Iterable[str],
+            range_seconds: int,
+            resolution: Optional[str] = None,
+    ) -> Dict[str, List[Tuple[float, float]]]:
+        """
+        Retorna os pontos das séries pedidas nos últimos ``range_seconds``.
+
+        Raises:
+            ValueError: série ou resolução desconhecida
+        """
+        resolution = resolution or self.choose_resolution(range_seconds)
+        if resolution not in RESOLUTIONS:
+            raise ValueError(f"Resolução inválida: '{resolution}'")
+
+        since = time.time() - range_seconds
+        result = {}
+        with self._lock:
+            for name in series:
+                if name not in self._series:
+                    raise ValueError(f"Série desconhecida: '{name}'")
+                result[name] = self._series[name][resolution].points(since)
+        return result
+
+    # --- Persistência (SQLite) ---
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=5)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS metrics_history ("
+            " series TEXT NOT NULL, resolution TEXT NOT NULL,"
+            " ts REAL NOT NULL, worker INTEGER NOT NULL, value REAL NOT NULL,"
+            " PRIMARY KEY (series, resolution, ts, worker))"
+        )
+        return conn
+
+    def load(self) -> None:
+        """
+        Carrega os pontos persistidos (dentro da janela de cada resolução),
+        com a média entre os workers que gravaram o mesmo instante.
+        """
+        if not self.path:
+            return
+        now = time.time()
+        conn = self._connect()
+        try:
+            with self._lock:
+                for res, (step, capacity) in RESOLUTIONS.items():
+                    rows = conn.execute(
+                        "SELECT series, ts, AVG(value) FROM metrics_history"
+                        " WHERE resolution = ? AND ts >= ? GROUP BY series, ts ORDER BY ts",
+                        (res, now - step * capacity),
+                    )
+                    for name, ts, value in rows:
+                        rollup = self._series.get(name, {}).get(res)
+                        if rollup is not None:
+                            rollup.ring.append(ts, value)
+                            rollup.flushed_until = ts
+        finally:
+            conn.close()
+        logger.info(f"Metrics history loaded from {self.path}")
+
+    def flush(self) -> None:
+        """Persiste os pontos fechados desde o último flush e descarta os antigos."""
+        if not self.path:
+            return
+        now = time.time()
+        # Identifica as linhas deste worker no arquivo compartilhado
+        worker = os.getpid()
+        rows = []
+        with self._lock:
+            for name, rollups in self._series.items():
+                for res, rollup in rollups.items():
+                    for ts, value in rollup.ring.points(since=rollup.flushed_until + 1e-6):
+                        rows.append((name, res, ts, worker, value))
+                    last = rollup.ring.last_time()
+                    if last is not None:
+                        rollup.flushed_until = last
+
+        conn = self._connect()
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO metrics_history (series, resolution, ts, worker, value)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+                for res, (step, capacity) in RESOLUTIONS.items():
+                    conn.execute(
+                        "DELETE FROM metrics_history WHERE resolution = ? AND ts < ?",
+                        (res, now - step * capacity),
+                    )
+        finally:
+            conn.close()
@@ -0,0 +1,109 @@
+"""
+Cache em memória com expiração (TTL) e limite de entradas (LRU).
+
+Usado para resultados de agregações caras cuja chave é derivada dos
+parâmetros da consulta (``key_for``): cada worker guarda o resultado por
+``ttl`` segundos. Com ``clear_on_commit``, o cache do worker é esvaziado
+quando uma transação dele grava instâncias dos modelos indicados; escritas
+feitas por outros workers aparecem em até ``ttl`` segundos.
+"""
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+
+
+def key_for(namespace: str, params: dict) -> str:
+    """Chave estável para ``params`` (hash do JSON com chaves ordenadas)."""
+    raw = json.dumps(params, sort_keys=True, default=str, separators=(",", ":"))
+    return f"{namespace}:{hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()}"
+
+
+class TTLCache:
+    """LRU limitado a ``max_entries``, com entradas válidas por ``ttl`` segundos."""
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self._models: Tuple[type, ...] = ()
+        self._pending_key = f"ttl_cache_dirty:{id(self)}"
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        if self.ttl <= 0 or self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    async def get_or_compute(self, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """Valor em cache ou, na falta, o resultado de ``compute()`` (guardado)."""
+        value = self.get(key)
+        if value is None:
+            value = await compute()
+            self.put(key, value)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    # --- Invalidação (eventos da sessão) ---
+
+    def clear_on_commit(self, *models: type) -> None:
+        """Esvazia o cache após cada commit que grava instâncias de ``models``."""
+        if not self._models:
+            event.listen(Session, "after_flush", self._after_flush)
+            event.listen(Session, "after_commit", self._after_commit)
+            event.listen(Session, "after_rollback", self._after_rollback)
+        self._models = tuple(dict.fromkeys((*self._models, *models)))
+
+    def _after_flush(self, session: Session, flush_context: Any) -> None:
+        if any(isinstance(obj, self._models) for obj in (*session.new, *session.dirty, *session.deleted)):
+            session.info[self._pending_key] = True
+
+    def _after_commit(self, session: Session) -> None:
+        if session.info.pop(self._pending_key, False):
+            self.clear()
+
+    def _after_rollback(self, session: Session) -> None:
+        session.info.pop(self._pending_key, None)
+
+    def snapshot(self) -> dict:
+        """Estado atual (usado no /health detalhado)."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+# Facetas da listagem de publicações (por worker)
+facet_cache = TTLCache(settings.FACETS_CACHE_MAX_ENTRIES, settings.FACETS_CACHE_TTL)
@@ -0,0 +1,29 @@
+# Arquivo: gunicorn.conf.py
+# Carregado automaticamente pelo gunicorn a partir do diretório de trabalho.
+import os
+import shutil
+
+# Diretório compartilhado (arquivos mmap) para agregar as métricas Prometheus
+# de todos os workers. Precisa existir (e estar limpo de execuções
+# anteriores) antes de o master importar o app (preload_app), o que acontece
+# antes do hook on_starting: por isso é preparado aqui, ao carregar a config.
+os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", "/tmp/prometheus_multiproc")
+
+# A config é recarregada no SIGHUP (mesmo master): a limpeza só roda uma vez,
+# para não apagar os arquivos abertos pelos workers em execução.
+if os.environ.get("_PROMETHEUS_MULTIPROC_DIR_OWNER") != str(os.getpid()):
+    shutil.rmtree(os.environ["PROMETHEUS_MULTIPROC_DIR"], ignore_errors=True)
+    os.makedirs(os.environ["PROMETHEUS_MULTIPROC_DIR"], exist_ok=True)
+    os.environ["_PROMETHEUS_MULTIPROC_DIR_OWNER"] = str(os.getpid())
+
+# Importa a aplicação uma única vez no master: workers novos (inclusive os
+# reciclados por max_requests) nascem por fork, sem repetir as importações.
+# Nada abre conexões ou threads no import; o aquecimento roda no lifespan.
+preload_app = True
+
+
+def child_exit(server, worker):
+    """Descarta os gauges 'live' de workers encerrados."""
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
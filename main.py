@@ -1,21 +1,43 @@
-from fastapi import FastAPI, Request
+import asyncio
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Query, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, HTMLResponse
+from fastapi.responses import JSONResponse, HTMLResponse, Response, StreamingResponse
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy import text
 from datetime import datetime
 from pathlib import Path
+from typing import Optional, Type
 import logging
 
 from app.api.v1.api import api_router
 from app.core.config import settings
 from app.core.database import engine
+from app.core.startup import warm_up
+from app.core.storage import storage
 from app.utils.exceptions import (
     validation_exception_handler,
     integrity_error_handler,
     general_exception_handler
 )
-from app.utils.metrics import get_all_metrics
+from app.utils.metrics import metrics_sampler, metrics_history, format_sse
+from app.utils.timeseries import parse_range
+from app.utils.pool_metrics import pool_stats
+from app.utils.autocomplete import autocomplete_index
+from app.utils.coauthorship import coauthorship_graph
+from app.utils.bulkhead import bulkheads
+from app.utils.compression import compressed_cache
+from app.utils.load_shedding import load_shedder, loop_lag_monitor
+from app.utils.prometheus import render_metrics
+from app.utils.ttl_cache import facet_cache
+from app.utils.responses import FastJSONResponse
+from app.middleware.request_metrics import PrometheusMiddleware
+from app.middleware.bulkhead import BulkheadMiddleware
+from app.middleware.compression import CompressionMiddleware
+from app.middleware.load_shedding import LoadSheddingMiddleware
+from app.middleware.single_flight import SingleFlightMiddleware
+from app.middleware.sql_timing import SQLTimingMiddleware
+from app.utils import sql_instrumentation
 
 # Configurar logging
 logging.basicConfig(
@@ -26,9 +48,51 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Intervalo de keep-alive do stream SSE (segundos)
+SSE_KEEPALIVE_INTERVAL = 15
 
-def create_application() -> FastAPI:
-    """Factory para criar a aplicação FastAPI."""
+
+async def check_database() -> None:
+    """Verifica a conexão com o banco de dados (lança exceção se indisponível)."""
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Ciclo de vida da aplicação.
+
+    No startup: cria os diretórios de upload, aquece o worker (mappers,
+    OpenAPI, conexões do pool), monta o índice de autocomplete e o grafo de
+    coautoria e inicia as tarefas em segundo plano.
+    No shutdown: encerra as tarefas e fecha as conexões do pool.
+    """
+    storage.ensure_directories()
+    await warm_up(app, engine, settings.DB_POOL_PREWARM_CONNECTIONS)
+    await autocomplete_index.start(settings.AUTOCOMPLETE_REFRESH_INTERVAL)
+    await coauthorship_graph.start(settings.COAUTHORSHIP_REFRESH_INTERVAL)
+
+    metrics_sampler.add_check("database", check_database)
+    metrics_sampler.start()
+    loop_lag_monitor.start()
+
+    yield
+
+    await autocomplete_index.stop()
+    await coauthorship_graph.stop()
+    await loop_lag_monitor.stop()
+    await metrics_sampler.stop()
+    await engine.dispose()
+
+
+def create_application(response_class: Type[Response] = FastJSONResponse) -> FastAPI:
+    """
+    Factory para criar a aplicação FastAPI.
+
+    Args:
+        response_class: Classe de resposta padrão das rotas (orjson por padrão)
+    """
 
     app = FastAPI(
         title=settings.PROJECT_NAME,
@@ -37,8 +101,34 @@ def create_application() -> FastAPI:
         openapi_url=f"{settings.API_V1_STR}/openapi.json",
         docs_url=f"{settings.API_V1_STR}/docs",
         redoc_url=f"{settings.API_V1_STR}/redoc",
+        lifespan=lifespan,
+        default_response_class=response_class,
     )
 
+    # Bulkheads por grupo de rotas (mais interno: só execuções reais ocupam vagas)
+    if settings.BULKHEADS_ENABLED:
+        app.add_middleware(
+            BulkheadMiddleware,
+            registry=bulkheads,
+            retry_after=settings.BULKHEAD_RETRY_AFTER,
+        )
+
+    # Coalescência de GETs idênticos (interno ao CORS: os cabeçalhos de CORS
+    # dependem do Origin de cada cliente e não podem ser compartilhados)
+    if settings.COALESCE_GET_REQUESTS:
+        app.add_middleware(
+            SingleFlightMiddleware,
+            excluded_paths=settings.COALESCE_EXCLUDED_PATHS,
+        )
+
+    # Descarte de carga (interno ao CORS, para que os 503 cheguem ao navegador)
+    if settings.LOAD_SHEDDING:
+        app.add_middleware(
+            LoadSheddingMiddleware,
+            shedder=load_shedder,
+            retry_after=settings.LOAD_SHED_RETRY_AFTER,
+        )
+
     # Configurar CORS
     app.add_middleware(
         CORSMiddleware,
@@ -48,6 +138,28 @@ def create_application() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # Instrumentação de SQL (contagem de queries, N+1, queries lentas)
+    if settings.SQL_INSTRUMENTATION:
+        sql_instrumentation.install(engine, slow_query_ms=settings.SQL_SLOW_QUERY_MS)
+        app.add_middleware(
+            SQLTimingMiddleware,
+            n_plus_one_threshold=settings.SQL_N_PLUS_ONE_THRESHOLD,
+        )
+
+    # Compressão (externa à coalescência: cada cliente recebe a codificação
+    # que aceita, mesmo quando a resposta foi compartilhada)
+    if settings.COMPRESSION_ENABLED:
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+            gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+            brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+            cache=compressed_cache,
+        )
+
+    # Telemetria por requisição (mais externo, mede o tempo total)
+    app.add_middleware(PrometheusMiddleware)
+
     # Incluir routers
     app.include_router(api_router, prefix=settings.API_V1_STR)
 
@@ -87,8 +199,7 @@ def create_application() -> FastAPI:
 
         # Verificar conexão com o banco de dados
         try:
-            async with engine.connect() as conn:
-                await conn.execute(text("SELECT 1"))
+            await check_database()
             health_status["checks"]["database"] = "healthy"
         except Exception as e:
             health_status["status"] = "unhealthy"
@@ -96,16 +207,93 @@ def create_application() -> FastAPI:
             health_status["error"] = str(e)
             logger.error(f"Health check failed - Database error: {e}")
 
-        # Adicionar métricas detalhadas se solicitado
+        # Adicionar métricas detalhadas se solicitado (última amostra do sampler)
         if detailed:
             try:
-                health_status["metrics"] = get_all_metrics()
+                health_status["metrics"] = metrics_sampler.latest()
+                health_status["database_pool"] = pool_stats.snapshot(engine.pool)
+                health_status["load"] = load_shedder.snapshot()
+                health_status["bulkheads"] = bulkheads.snapshot()
+                health_status["compression"] = compressed_cache.snapshot()
+                health_status["autocomplete"] = autocomplete_index.snapshot()
+                health_status["coauthorship"] = coauthorship_graph.snapshot()
+                health_status["facets_cache"] = facet_cache.snapshot()
             except Exception as e:
                 logger.error(f"Error collecting metrics: {e}")
                 health_status["metrics_error"] = str(e)
 
         return health_status
 
+    @app.get("/health/stream")
+    async def health_stream(request: Request):
+        """
+        Stream Server-Sent Events com as métricas de saúde.
+
+        Todos os assinantes recebem o mesmo evento, produzido uma única vez pelo
+        amostrador compartilhado a cada intervalo de coleta.
+        """
+        queue = metrics_sampler.subscribe()
+
+        async def event_generator():
+            try:
+                # Evento inicial imediato com a última amostra disponível
+                yield format_sse(metrics_sampler.health_event())
+                while not await request.is_disconnected():
+                    try:
+                        yield await asyncio.wait_for(queue.get(), timeout=SSE_KEEPALIVE_INTERVAL)
+                    except asyncio.TimeoutError:
+                        yield b": keep-alive\n\n"
+            finally:
+                metrics_sampler.unsubscribe(queue)
+
+        return StreamingResponse(
+            event_generator(),
+            media_type="text/event-stream",
+            headers={
+                "Cache-Control": "no-cache",
+                "X-Accel-Buffering": "no",  # Desativa o buffering do nginx
+            },
+        )
+
+    @app.get("/health/history")
+    async def health_history(
+        series: str = Query("cpu,memory", description="Séries separadas por vírgula"),
+        time_range: str = Query("1h", alias="range", description="Intervalo (ex: 15m, 1h, 24h, 7d)"),
+        resolution: Optional[str] = Query(None, description="Resolução: 1s, 1m ou 15m (padrão: automática)"),
+    ):
+        """
+        Histórico das métricas de infraestrutura, servido da memória.
+
+        Args:
+            series: Nomes das séries (cpu, memory, disk, network_sent_mb, ...)
+            time_range: Janela de tempo a partir de agora (parâmetro ``range``)
+            resolution: Resolução dos pontos; por padrão a mais fina que cubra o intervalo
+        """
+        try:
+            range_seconds = parse_range(time_range)
+            names = [name.strip() for name in series.split(",") if name.strip()]
+            points = metrics_history.query(names, range_seconds, resolution)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+        return {
+            "range_seconds": range_seconds,
+            "resolution": resolution or metrics_history.choose_resolution(range_seconds),
+            "series": {
+                name: [[round(ts, 3), round(value, 2)] for ts, value in values]
+                for name, values in points.items()
+            },
+        }
+
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        """
+        Exposição das métricas no formato texto do Prometheus.
+        Agrega os valores de todos os workers quando em modo multiprocesso.
+        """
+        content, media_type = render_metrics()
+        return Response(content=content, media_type=media_type)
+
     @app.get("/health/ui", response_class=HTMLResponse)
     async def health_ui():
         """
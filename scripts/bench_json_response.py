@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+"""
+Benchmark de throughput de ``GET /api/v1/publicacoes/?limit=100`` com a
+classe de resposta padrão antiga (``JSONResponse``, encoder ``json`` da
+biblioteca padrão) e a atual (``FastJSONResponse``, orjson).
+
+A aplicação roda no próprio processo (httpx + ASGITransport) sobre um banco
+SQLite temporário com publicações, autores e subgrupos. A coalescência de
+GETs é desligada para que toda requisição execute a rota.
+
+Uso:
+    python scripts/bench_json_response.py --requests 300 --concurrency 10
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+
+_tmpdir = tempfile.mkdtemp(prefix="bench_json_")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_tmpdir}/bench.db"
+os.environ["UPLOADS_PATH"] = _tmpdir
+os.environ["COALESCE_GET_REQUESTS"] = "false"
+os.environ["LOAD_SHEDDING"] = "false"
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+
+from app.core.database import AsyncSessionLocal, Base, engine  # noqa: E402
+from app.models import Membro, Publicacao, Subgrupo  # noqa: E402
+from app.models.publicacao import TipoPublicacaoEnum  # noqa: E402
+from app.utils.responses import FastJSONResponse  # noqa: E402
+from main import create_application  # noqa: E402
+
+URL = "/api/v1/publicacoes/?limit=100"
+
+
+async def seed(count: int) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSessionLocal() as session:
+        subgrupos = [Subgrupo(nome_grupo=f"Grupo {i}") for i in range(5)]
+        autores = [Membro(nome=f"Pesquisador {i}", email=f"p{i}@example.org") for i in range(20)]
+        session.add_all(subgrupos + autores)
+        for i in range(count):
+            session.add(Publicacao(
+                title=f"Publicação {i} sobre políticas públicas",
+                description="Resumo da publicação " * 10,
+                type=TipoPublicacaoEnum.ARTIGO,
+                year=date(2000 + i % 25, 1, 1),
+                link_externo="https://example.org/pub",
+                autores=autores[i % 20:i % 20 + 3],
+                subgrupos=[subgrupos[i % 5]],
+            ))
+        await session.commit()
+
+
+async def run(response_class, total: int, concurrency: int) -> dict:
+    app = create_application(response_class=response_class)
+    transport = httpx.ASGITransport(app=app)
+    latencies = []
+    sizes = set()
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await client.get(URL)  # aquecimento
+        queue = asyncio.Queue()
+        for _ in range(total):
+            queue.put_nowait(None)
+
+        async def worker():
+            while not queue.empty():
+                queue.get_nowait()
+                start = time.perf_counter()
+                response = await client.get(URL)
+                latencies.append(time.perf_counter() - start)
+                response.raise_for_status()
+                sizes.add(len(response.json()["items"]))
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    return {
+        "response_class": response_class.__name__,
+        "requests_per_s": round(total / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies) * 1000, 2),
+        "items_per_page": sorted(sizes),
+    }
+
+
+def render_only(content, repeat: int = 500) -> None:
+    """Custo isolado de ``render`` da página (conteúdo já convertido pelo FastAPI)."""
+    for response_class in (JSONResponse, FastJSONResponse):
+        renderer = response_class.__new__(response_class)
+        start = time.perf_counter()
+        for _ in range(repeat):
+            renderer.render(content)
+        elapsed = (time.perf_counter() - start) / repeat
+        print(f"render {response_class.__name__}: {elapsed * 1000:.3f} ms/page")
+
+
+async def main_async(total: int, concurrency: int) -> None:
+    await seed(150)
+    try:
+        for response_class in (JSONResponse, FastJSONResponse, JSONResponse, FastJSONResponse):
+            print(await run(response_class, total, concurrency))
+
+        async with httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=create_application()), base_url="http://bench"
+        ) as client:
+            render_only((await client.get(URL)).json())
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=300, help="Requisições por cenário")
+    parser.add_argument("--concurrency", type=int, default=10, help="Clientes concorrentes")
+    args = parser.parse_args()
+    asyncio.run(main_async(args.requests, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
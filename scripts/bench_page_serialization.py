@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+"""
+Benchmark da serialização de páginas de listagem (100 itens por padrão).
+
+Compara, com objetos ORM em memória (sem banco), o caminho antigo
+(``model_validate`` item a item + ``response_model=dict``) com o atual
+(``paginate`` + ``response_model=Page[Schema]``), passando pelo mesmo
+``serialize_response`` e ``JSONResponse`` que o FastAPI usa nas rotas. Por
+padrão os itens não têm imagem, para isolar o custo de validação e
+serialização do custo de assinar as URLs.
+
+Uso:
+    python scripts/bench_page_serialization.py --items 100 --repeat 500
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from datetime import date, datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fastapi.responses import JSONResponse  # noqa: E402
+from fastapi.routing import serialize_response  # noqa: E402
+from fastapi.utils import create_model_field  # noqa: E402
+
+from app import schemas  # noqa: E402
+from app.models import Membro, Publicacao, Subgrupo  # noqa: E402
+from app.models.publicacao import TipoPublicacaoEnum  # noqa: E402
+
+
+def make_publicacoes(count: int, images: bool) -> list:
+    """Publicações transientes com autores e subgrupos já carregados."""
+    now = datetime.utcnow()
+    subgrupo = Subgrupo(
+        id=1,
+        nome_grupo="Grupo de Pesquisa",
+        icone_grupo_path="subgrupos/icons/a.png" if images else None,
+    )
+    autores = [Membro(id=i, nome=f"Pesquisador {i}") for i in range(1, 4)]
+    return [
+        Publicacao(
+            id=i,
+            title=f"Publicação {i} sobre políticas públicas",
+            description="Resumo da publicação " * 10,
+            type=TipoPublicacaoEnum.ARTIGO,
+            year=date(2024, 1, 1),
+            link_externo="https://example.org/pub",
+            image_path=f"publicacoes/images/{i}.png" if images else None,
+            created_at=now,
+            updated_at=now,
+            autores=autores,
+            subgrupos=[subgrupo],
+        )
+        for i in range(count)
+    ]
+
+
+async def old_path(field, publicacoes, total: int) -> bytes:
+    content = {
+        "items": [schemas.PublicacaoWithRelations.model_validate(pub) for pub in publicacoes],
+        "total": total,
+        "skip": 0,
+        "limit": len(publicacoes),
+        "has_next": len(publicacoes) < total,
+    }
+    return JSONResponse(await serialize_response(field=field, response_content=content)).body
+
+
+async def new_path(field, publicacoes, total: int) -> bytes:
+    content = schemas.paginate(publicacoes, total, 0, len(publicacoes))
+    return JSONResponse(await serialize_response(field=field, response_content=content)).body
+
+
+async def measure(fn, field, publicacoes, repeat: int) -> dict:
+    total = len(publicacoes) * 10
+    await fn(field, publicacoes, total)  # aquecimento
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await fn(field, publicacoes, total)
+        samples.append(time.perf_counter() - start)
+    return {
+        "median_ms": round(statistics.median(samples) * 1000, 3),
+        "p99_ms": round(sorted(samples)[int(len(samples) * 0.99) - 1] * 1000, 3),
+    }
+
+
+async def run(items: int, repeat: int, images: bool) -> None:
+    publicacoes = make_publicacoes(items, images)
+    dict_field = create_model_field(name="Response_dict", type_=dict, mode="serialization")
+    page_field = create_model_field(
+        name="Response_page",
+        type_=schemas.Page[schemas.PublicacaoWithRelations],
+        mode="serialization",
+    )
+
+    old = await measure(old_path, dict_field, publicacoes, repeat)
+    new = await measure(new_path, page_field, publicacoes, repeat)
+    print(f"model_validate + response_model=dict: {old}")
+    print(f"paginate + response_model=Page[...]:  {new}")
+    print(f"speedup (median): {old['median_ms'] / new['median_ms']:.2f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=100, help="Itens por página")
+    parser.add_argument("--repeat", type=int, default=500, help="Repetições de cada caminho")
+    parser.add_argument(
+        "--images", action="store_true",
+        help="Inclui paths de imagem (mede também a assinatura das URLs)",
+    )
+    args = parser.parse_args()
+    asyncio.run(run(args.items, args.repeat, args.images))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+"""
+Benchmark do perfil de produção do SQLite: throughput de leituras
+concorrentes enquanto um escritor insere continuamente, com e sem o perfil
+(WAL, synchronous=NORMAL, mmap, cache, temp_store e busy_timeout).
+
+Uso:
+    python scripts/bench_sqlite_profile.py --readers 20 --duration 10
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import text  # noqa: E402
+from sqlalchemy.ext.asyncio import create_async_engine  # noqa: E402
+
+from app.core.database import apply_sqlite_profile, get_sqlite_pragmas  # noqa: E402
+
+SEED_ROWS = 20_000
+
+
+async def _setup(engine) -> None:
+    async with engine.begin() as conn:
+        await conn.execute(text(
+            "CREATE TABLE items (id INTEGER PRIMARY KEY, title TEXT NOT NULL, year INTEGER)"
+        ))
+        await conn.execute(
+            text("INSERT INTO items (title, year) VALUES (:title, :year)"),
+            [{"title": f"Publicação {i}", "year": 2000 + i % 25} for i in range(SEED_ROWS)],
+        )
+
+
+async def _reader(engine, deadline: float, latencies: list, errors: list) -> None:
+    year = 2000
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            async with engine.connect() as conn:
+                await conn.execute(
+                    text("SELECT id, title FROM items WHERE year = :year ORDER BY id DESC LIMIT 50"),
+                    {"year": year},
+                )
+            latencies.append(time.perf_counter() - start)
+        except Exception as e:
+            errors.append(type(e).__name__)
+        year = 2000 + (year + 1) % 25
+
+
+async def _writer(engine, deadline: float, counter: list, errors: list) -> None:
+    while time.perf_counter() < deadline:
+        try:
+            async with engine.begin() as conn:
+                await conn.execute(
+                    text("INSERT INTO items (title, year) VALUES (:title, :year)"),
+                    [{"title": "nova", "year": 2024}] * 20,
+                )
+            counter.append(1)
+        except Exception as e:
+            errors.append(type(e).__name__)
+        await asyncio.sleep(0)
+
+
+async def run(tuned: bool, readers: int, duration: float) -> dict:
+    """Executa o cenário em um banco novo (com ou sem o perfil)."""
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{path}",
+        pool_size=readers + 1,
+        connect_args={"check_same_thread": False},
+    )
+    if tuned:
+        apply_sqlite_profile(engine, get_sqlite_pragmas())
+
+    try:
+        await _setup(engine)
+        latencies: list = []
+        writes: list = []
+        errors: list = []
+        deadline = time.perf_counter() + duration
+        await asyncio.gather(
+            _writer(engine, deadline, writes, errors),
+            *(_reader(engine, deadline, latencies, errors) for _ in range(readers)),
+        )
+    finally:
+        await engine.dispose()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+
+    latencies.sort()
+    return {
+        "profile": "tuned" if tuned else "default",
+        "reads_per_s": round(len(latencies) / duration, 1),
+        "read_p50_ms": round(statistics.median(latencies) * 1000, 2) if latencies else None,
+        "read_p99_ms": round(latencies[int(len(latencies) * 0.99) - 1] * 1000, 2) if latencies else None,
+        "write_tx_per_s": round(len(writes) / duration, 1),
+        "errors": len(errors),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--readers", type=int, default=20, help="Leitores concorrentes")
+    parser.add_argument("--duration", type=float, default=10, help="Duração de cada cenário (segundos)")
+    args = parser.parse_args()
+
+    for tuned in (False, True):
+        print(asyncio.run(run(tuned, args.readers, args.duration)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+"""
+Benchmark do boot de um worker: custo de importação por módulo (no formato
+do ``python -X importtime``) e tempo até a primeira resposta HTTP.
+
+O primeiro cenário importa o módulo da aplicação em um interpretador novo e
+agrupa o tempo próprio de cada módulo por pacote de topo. O segundo sobe o
+uvicorn em um processo novo e mede o tempo até a primeira resposta 200,
+incluindo o lifespan (aquecimento do pool, mappers e OpenAPI).
+
+Uso:
+    python scripts/bench_startup.py --runs 5 --top 20
+    python scripts/bench_startup.py --database-url postgresql+asyncpg://...
+"""
+import argparse
+import os
+import re
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def _env(database_url: str) -> Dict[str, str]:
+    env = dict(os.environ)
+    env["DATABASE_URL"] = database_url
+    env.pop("PROMETHEUS_MULTIPROC_DIR", None)
+    return env
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int]]:
+    """Linhas do ``-X importtime`` como (módulo, próprio µs, cumulativo µs)."""
+    rows = []
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            rows.append((match.group(4), int(match.group(1)), int(match.group(2))))
+    return rows
+
+
+def import_profile(module: str, env: Dict[str, str]) -> List[Tuple[str, int, int]]:
+    """Importa ``module`` em um interpretador novo e devolve o perfil."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True,
+    )
+    return parse_importtime(result.stderr)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def time_to_first_request(app: str, path: str, env: Dict[str, str], timeout: float = 30.0) -> float:
+    """Segundos entre o spawn do uvicorn e a primeira resposta 200 em ``path``."""
+    port = _free_port()
+    url = f"http://127.0.0.1:{port}{path}"
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", app, "--port", str(port), "--log-level", "warning"],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - start < timeout:
+            if proc.poll() is not None:
+                raise RuntimeError(f"uvicorn exited with code {proc.returncode}")
+            try:
+                with urllib.request.urlopen(url, timeout=1) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - start
+            except (urllib.error.URLError, ConnectionError):
+                time.sleep(0.01)
+        raise TimeoutError(f"No response from {url} after {timeout}s")
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+
+
+def _summarize(samples: List[float]) -> Dict[str, float]:
+    return {
+        "median_ms": round(statistics.median(samples) * 1000, 1),
+        "min_ms": round(min(samples) * 1000, 1),
+        "max_ms": round(max(samples) * 1000, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="main", help="Módulo importado no perfil de importação")
+    parser.add_argument("--app", default="main:app", help="Aplicação ASGI passada ao uvicorn")
+    parser.add_argument("--path", default="/", help="Rota usada como primeira requisição")
+    parser.add_argument("--runs", type=int, default=5, help="Repetições de cada cenário")
+    parser.add_argument("--top", type=int, default=15, help="Pacotes/módulos listados no relatório")
+    parser.add_argument(
+        "--database-url", default=None,
+        help="Banco usado pela aplicação (padrão: SQLite temporário)",
+    )
+    args = parser.parse_args()
+
+    tmpdir: Optional[tempfile.TemporaryDirectory] = None
+    database_url = args.database_url
+    if database_url is None:
+        tmpdir = tempfile.TemporaryDirectory()
+        database_url = f"sqlite+aiosqlite:///{tmpdir.name}/bench_startup.db"
+    env = _env(database_url)
+
+    try:
+        # --- Importação ---
+        totals: List[float] = []
+        by_package: Dict[str, List[int]] = defaultdict(list)
+        by_module: Dict[str, List[int]] = defaultdict(list)
+        for _ in range(args.runs):
+            rows = import_profile(args.module, env)
+            package_self: Dict[str, int] = defaultdict(int)
+            for name, self_us, cumulative_us in rows:
+                package_self[name.split(".")[0]] += self_us
+                if name == args.module:
+                    totals.append(cumulative_us / 1e6)
+                if name.startswith("app.") or name == args.module:
+                    by_module[name].append(cumulative_us)
+            for package, self_us in package_self.items():
+                by_package[package].append(self_us)
+
+        print(f"import {args.module}: {_summarize(totals)}")
+        print(f"\nTop {args.top} packages by self time (median of {args.runs} runs):")
+        ranking = sorted(by_package.items(), key=lambda item: statistics.median(item[1]), reverse=True)
+        for package, samples in ranking[:args.top]:
+            print(f"  {statistics.median(samples) / 1000:8.1f} ms  {package}")
+
+        print(f"\nTop {args.top} application modules by cumulative time:")
+        ranking = sorted(by_module.items(), key=lambda item: statistics.median(item[1]), reverse=True)
+        for name, samples in ranking[:args.top]:
+            print(f"  {statistics.median(samples) / 1000:8.1f} ms  {name}")
+
+        # --- Primeira requisição ---
+        first_request = [time_to_first_request(args.app, args.path, env) for _ in range(args.runs)]
+        print(f"\ntime to first request ({args.path}): {_summarize(first_request)}")
+    finally:
+        if tmpdir is not None:
+            tmpdir.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+import pytest
+from httpx import AsyncClient
+from fastapi import status
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import date
+
+from app.core.config import settings
+from app.models.membro import Membro
+from app.models.subgrupo import Subgrupo
+from app.models.publicacao import Publicacao, TipoPublicacaoEnum
+
+API_PREFIX = "/api/v1/changes"
+
+# Marca todos os testes neste arquivo para usar pytest-asyncio
+pytestmark = pytest.mark.asyncio
+
+
+def summary(feed: dict) -> list:
+    return [(change["type"], change["action"]) for change in feed["changes"]]
+
+
+async def test_change_feed(client: AsyncClient, db: AsyncSession, monkeypatch):
+    """Testa GET /changes?since= (criações, associações e exclusões em ordem)"""
+    monkeypatch.setattr(settings, "CHANGES_SAFETY_WINDOW", 0)
+    membro = Membro(nome="Autora")
+    subgrupo = Subgrupo(nome_grupo="Grupo")
+    db.add_all([membro, subgrupo])
+    await db.commit()
+    publicacao = Publicacao(
+        title="Artigo", type=TipoPublicacaoEnum.ARTIGO, year=date(2024, 1, 1), autores=[membro]
+    )
+    db.add(publicacao)
+    await db.commit()
+
+    feed = (await client.get(f"{API_PREFIX}/")).json()
+    # A nova autoria também conta como alteração da autora
+    assert summary(feed) == [("subgrupo", "created"), ("membro", "created"), ("publicacao", "created")]
+    assert feed["changes"][-1]["data"]["autores"][0]["nome"] == "Autora"
+    cursor = feed["cursor"]
+
+    feed = (await client.get(f"{API_PREFIX}/?since={cursor}")).json()
+    assert feed == {"changes": [], "cursor": cursor, "has_more": False}
+
+    # Associação publicação <-> subgrupo: os dois lados aparecem
+    publicacao.subgrupos.append(subgrupo)
+    await db.commit()
+    feed = (await client.get(f"{API_PREFIX}/?since={cursor}")).json()
+    assert sorted(summary(feed)) == [("publicacao", "updated"), ("subgrupo", "updated")]
+    cursor = feed["cursor"]
+
+    await db.delete(membro)
+    await db.commit()
+    first = (await client.get(f"{API_PREFIX}/?since={cursor}&limit=1")).json()
+    assert first["has_more"] is True
+    rest = (await client.get(f"{API_PREFIX}/?since={first['cursor']}")).json()
+    changes = first["changes"] + rest["changes"]
+    assert sorted(summary({"changes": changes})) == [("membro", "deleted"), ("publicacao", "updated")]
+    deleted = next(change for change in changes if change["action"] == "deleted")
+    assert deleted["id"] == membro.id and deleted["data"] is None
+
+    response = await client.get(f"{API_PREFIX}/?since=invalido")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+async def test_change_feed_api_writes(auth_client: AsyncClient, db: AsyncSession, monkeypatch):
+    """Associações gravadas pelos endpoints de escrita aparecem no feed"""
+    monkeypatch.setattr(settings, "CHANGES_SAFETY_WINDOW", 0)
+    ana, bia, caio = Membro(nome="Ana"), Membro(nome="Bia"), Membro(nome="Caio")
+    subgrupo = Subgrupo(nome_grupo="Grupo")
+    db.add_all([ana, bia, caio, subgrupo])
+    await db.commit()
+    cursor = (await auth_client.get(f"{API_PREFIX}/")).json()["cursor"]
+
+    async def changes_since() -> list:
+        nonlocal cursor
+        feed = (await auth_client.get(f"{API_PREFIX}/?since={cursor}")).json()
+        cursor = feed["cursor"]
+        return sorted((change["type"], change["id"], change["action"]) for change in feed["changes"])
+
+    response = await auth_client.post("/api/v1/publicacoes/", json={
+        "title": "Artigo", "type": "Artigo", "year": "2024-01-01", "autor_ids": [ana.id, bia.id],
+    })
+    assert response.status_code == status.HTTP_201_CREATED
+    publicacao_id = response.json()["id"]
+    assert await changes_since() == [
+        ("membro", ana.id, "updated"), ("membro", bia.id, "updated"), ("publicacao", publicacao_id, "created"),
+    ]
+
+    # Só a autoria muda: a publicação e os autores que entram e saem
+    response = await auth_client.put(f"/api/v1/publicacoes/{publicacao_id}", json={"autor_ids": [ana.id, caio.id]})
+    assert response.status_code == status.HTTP_200_OK
+    assert await changes_since() == [
+        ("membro", bia.id, "updated"), ("membro", caio.id, "updated"), ("publicacao", publicacao_id, "updated"),
+    ]
+
+    response = await auth_client.post(f"/api/v1/subgrupos/{subgrupo.id}/membros/{ana.id}")
+    assert response.status_code == status.HTTP_201_CREATED
+    assert await changes_since() == [("membro", ana.id, "updated"), ("subgrupo", subgrupo.id, "updated")]
+
+    response = await auth_client.delete(f"/api/v1/subgrupos/{subgrupo.id}/membros/{ana.id}")
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+    assert await changes_since() == [("membro", ana.id, "updated"), ("subgrupo", subgrupo.id, "updated")]
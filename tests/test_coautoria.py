@@ -0,0 +1,79 @@
+import pytest
+from httpx import AsyncClient
+from fastapi import status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.membro import Membro
+from app.utils.coauthorship import CoauthorshipGraph, coauthorship_graph
+
+API_PREFIX = "/api/v1/coautoria"
+
+# Marca todos os testes neste arquivo para usar pytest-asyncio
+pytestmark = pytest.mark.asyncio
+
+
+async def test_coauthorship_graph_incremental():
+    """Atualizações incrementais equivalem a remontar o grafo"""
+    graph = CoauthorshipGraph()
+    graph.build([(1, "A"), (2, "B"), (3, "C"), (4, "D")], [(10, 1), (10, 2), (11, 1), (11, 2), (11, 3)])
+    assert graph.top_collaborators(1) == [
+        {"id": 2, "nome": "B", "publicacoes": 2, "publicacoes_em_comum": 2},
+        {"id": 3, "nome": "C", "publicacoes": 1, "publicacoes_em_comum": 1},
+    ]
+
+    graph.set_authors(12, [3, 4])
+    graph.remove_author(11, 2)
+    graph.remove_member(1)
+    rebuilt = CoauthorshipGraph()
+    rebuilt.build([(2, "B"), (3, "C"), (4, "D")], [(10, 2), (11, 3), (12, 3), (12, 4)])
+    assert graph.export() == rebuilt.export() == {
+        "nodes": [{"id": 3, "nome": "C", "publicacoes": 2}, {"id": 4, "nome": "D", "publicacoes": 1}],
+        "edges": [{"source": 3, "target": 4, "weight": 1}],
+    }
+
+
+async def test_coautoria_endpoints(auth_client: AsyncClient, db: AsyncSession):
+    """Testa GET /coautoria (grafo, ego-network e colaboradores) após escritas pela API"""
+    ana, bia, caio, davi = (Membro(nome=nome) for nome in ("Ana", "Bia", "Caio", "Davi"))
+    db.add_all([ana, bia, caio, davi])
+    await db.commit()
+    await coauthorship_graph.rebuild(db)
+    coauthorship_graph.install()
+
+    async def create(title: str, autores: list) -> int:
+        response = await auth_client.post("/api/v1/publicacoes/", json={
+            "title": title, "type": "Artigo", "year": "2024-01-01", "autor_ids": [autor.id for autor in autores],
+        })
+        assert response.status_code == status.HTTP_201_CREATED
+        await db.commit()  # o override da sessão nos testes não faz o commit de get_db
+        return response.json()["id"]
+
+    async def colaboradores(membro: Membro) -> list:
+        response = await auth_client.get(f"{API_PREFIX}/{membro.id}/colaboradores")
+        assert response.status_code == status.HTTP_200_OK
+        return [(item["nome"], item["publicacoes_em_comum"]) for item in response.json()]
+
+    # Publicações criadas pela API entram no grafo no commit, sem recarga
+    await create("P1", [ana, bia])
+    p2 = await create("P2", [ana, bia, caio])
+    assert await colaboradores(ana) == [("Bia", 2), ("Caio", 1)]
+
+    # Troca de autores pelo PUT
+    response = await auth_client.put(f"/api/v1/publicacoes/{p2}", json={"autor_ids": [caio.id, davi.id]})
+    assert response.status_code == status.HTTP_200_OK
+    await db.commit()
+    assert await colaboradores(ana) == [("Bia", 1)]
+    ego = (await auth_client.get(f"{API_PREFIX}/{caio.id}")).json()
+    assert {node["nome"] for node in ego["nodes"]} == {"Caio", "Davi"}
+    assert ego["edges"] == [{"source": caio.id, "target": davi.id, "weight": 1}]
+
+    response = await auth_client.delete(f"/api/v1/publicacoes/{p2}")
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+    response = await auth_client.delete(f"/api/v1/membros/{bia.id}")
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+    await db.commit()
+    graph = (await auth_client.get(f"{API_PREFIX}/")).json()
+    assert graph == {"nodes": [], "edges": []}
+
+    response = await auth_client.get(f"{API_PREFIX}/{bia.id}")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,117 @@
+import pytest
+
+from app.core import database
+from app.core.config import settings
+from app.utils.pool_metrics import InstrumentedAsyncQueuePool, InstrumentedNullPool
+
+
+def test_pool_options_profile_and_overrides(monkeypatch):
+    """O perfil define os valores base e DB_POOL_* os sobrescreve."""
+    monkeypatch.setattr(settings, "DB_POOL_PROFILE", "small")
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 7)
+
+    options = database.get_pool_options()
+    assert options["pool_size"] == 7
+    assert options["max_overflow"] == database.POOL_PROFILES["small"]["max_overflow"]
+    assert options["pool_pre_ping"] is True
+
+    monkeypatch.setattr(settings, "DB_POOL_PROFILE", "inexistente")
+    with pytest.raises(ValueError):
+        database.get_pool_options()
+
+
+def test_engine_options_direct(monkeypatch):
+    """Modo direto: pool instrumentado e statement timeout por conexão."""
+    monkeypatch.setattr(settings, "DB_STATEMENT_TIMEOUT_MS", 5000)
+
+    options = database.get_engine_options("direct")
+    assert options["poolclass"] is InstrumentedAsyncQueuePool
+    assert options["connect_args"]["server_settings"]["statement_timeout"] == "5000"
+
+
+def test_engine_options_pgbouncer(monkeypatch):
+    """Modo PgBouncer: NullPool, sem cache de prepared statements e nomes únicos."""
+    options = database.get_engine_options("pgbouncer")
+    connect_args = options["connect_args"]
+
+    assert options["poolclass"] is InstrumentedNullPool
+    assert connect_args["statement_cache_size"] == 0
+    assert connect_args["prepared_statement_cache_size"] == 0
+    name_func = connect_args["prepared_statement_name_func"]
+    assert name_func() != name_func()
+
+    monkeypatch.setattr(settings, "DB_PGBOUNCER_POOL_SIZE", 2)
+    options = database.get_engine_options("pgbouncer")
+    assert options["poolclass"] is InstrumentedAsyncQueuePool
+    assert options["pool_size"] == 2
+    assert options["max_overflow"] == 0
+
+    with pytest.raises(ValueError):
+        database.get_engine_options("outro")
+
+
+@pytest.mark.asyncio
+async def test_sqlite_profile_pragmas(tmp_path):
+    """O perfil do SQLite é aplicado em cada nova conexão."""
+    from sqlalchemy import text
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'profile.db'}")
+    database.apply_sqlite_profile(engine)
+    try:
+        async with engine.connect() as conn:
+            journal_mode = (await conn.execute(text("PRAGMA journal_mode"))).scalar()
+            synchronous = (await conn.execute(text("PRAGMA synchronous"))).scalar()
+            busy_timeout = (await conn.execute(text("PRAGMA busy_timeout"))).scalar()
+            temp_store = (await conn.execute(text("PRAGMA temp_store"))).scalar()
+    finally:
+        await engine.dispose()
+
+    assert journal_mode == "wal"
+    assert synchronous == 1  # NORMAL
+    assert busy_timeout == settings.SQLITE_BUSY_TIMEOUT_MS
+    assert temp_store == 2  # MEMORY
+
+
+@pytest.mark.asyncio
+async def test_sqlite_write_sessions_are_serialized(monkeypatch):
+    """Sessões de escrita do SQLite passam uma por vez; leituras não esperam."""
+    import asyncio
+
+    monkeypatch.setattr(database, "is_sqlite", True)
+    writer = database.get_db(write=True)
+    await writer.__anext__()
+    assert database.sqlite_write_lock.locked()
+
+    # Uma leitura não entra na fila de escrita
+    reader = database.get_db()
+    await asyncio.wait_for(reader.__anext__(), timeout=1)
+    await reader.aclose()
+
+    # Uma segunda escrita aguarda a primeira terminar
+    second = database.get_db(write=True)
+    pending = asyncio.ensure_future(second.__anext__())
+    await asyncio.sleep(0.05)
+    assert not pending.done()
+
+    await writer.aclose()
+    await asyncio.wait_for(pending, timeout=1)
+    await second.aclose()
+    assert not database.sqlite_write_lock.locked()
+
+
+@pytest.mark.asyncio
+async def test_prewarm_pool_opens_connections(tmp_path):
+    """O aquecimento deixa conexões abertas e ociosas no pool."""
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from app.core.startup import prewarm_pool
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'warm.db'}", pool_size=3)
+    try:
+        opened = await prewarm_pool(engine, 5)
+        pool = engine.sync_engine.pool
+        assert opened == 3  # limitado ao pool_size
+        assert pool.checkedin() == 3
+        assert pool.checkedout() == 0
+    finally:
+        await engine.dispose()
@@ -98,6 +98,12 @@ async def test_health_check_detailed(client: AsyncClient):
     assert "memory_rss_mb" in process
     assert isinstance(process["pid"], int)
 
+    # Verificar telemetria do pool de conexões
+    pool = result["database_pool"]
+    assert "checkouts" in pool
+    assert "checkout_ms_avg" in pool
+    assert "waiting" in pool
+
 
 async def test_health_ui(client: AsyncClient):
     """Testa GET /health/ui (Interface HTML de health check)"""
@@ -113,3 +119,54 @@ async def test_health_ui(client: AsyncClient):
     assert "fetchHealthData" in content  # Verificar se tem a função JavaScript
     assert "Chart.js" in content  # Verificar se tem Chart.js
     assert "chart-card" in content  # Verificar se tem os cards de gráfico
+
+
+async def test_metrics_endpoint(client: AsyncClient):
+    """Testa GET /metrics (exposição Prometheus com rótulos por rota templated)"""
+    await client.get("/api/v1/publicacoes/999999")
+
+    response = await client.get("/metrics")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/plain")
+
+    content = response.text
+    assert "http_request_duration_seconds_bucket" in content
+    assert "http_requests_total" in content
+    assert "http_response_size_bytes" in content
+    # O rótulo usa o path templated, não o id concreto
+    assert 'route="/api/v1/publicacoes/{id}"' in content
+    assert "/api/v1/publicacoes/999999" not in content
+
+
+async def test_lazy_import_defers_module_execution(tmp_path, monkeypatch):
+    """lazy_import só executa o módulo no primeiro acesso a um atributo"""
+    from app.utils.lazy import lazy_import
+
+    marker = tmp_path / "loaded"
+    (tmp_path / "lazy_probe.py").write_text(f"open({str(marker)!r}, 'w').close()\nVALUE = 42\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(__import__("sys").modules, "lazy_probe", raising=False)
+
+    module = lazy_import("lazy_probe")
+    assert not marker.exists()
+    assert module.VALUE == 42
+    assert marker.exists()
+    assert lazy_import("lazy_probe") is module
+
+    with pytest.raises(ModuleNotFoundError):
+        lazy_import("modulo_inexistente_xyz")
+
+
+async def test_fast_json_response():
+    """FastJSONResponse serializa tipos comuns e repassa bytes sem recodificar"""
+    import json
+    from datetime import datetime
+    from decimal import Decimal
+    from app.utils.responses import FastJSONResponse
+
+    response = FastJSONResponse({"nome": "Ação", "valor": Decimal("1.5"), "quando": datetime(2024, 1, 2)})
+    assert response.headers["content-type"] == "application/json"
+    assert json.loads(response.body) == {"nome": "Ação", "valor": "1.5", "quando": "2024-01-02T00:00:00"}
+
+    cached = b'{"items":[],"total":0}'
+    assert FastJSONResponse(cached).body is cached
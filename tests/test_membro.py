@@ -305,3 +305,18 @@ async def test_read_membros_with_search_query(
 
     result = response.json()
     assert result["total"] >= 1
+
+
+async def test_read_membros_batch_ids(client: AsyncClient, membro_fix: Membro):
+    """Testa GET /?ids= (busca em lote indexada por ID)"""
+    response = await client.get(f"{API_PREFIX}/?ids={membro_fix.id},999999&include=subgrupos")
+    assert response.status_code == status.HTTP_200_OK
+
+    result = response.json()
+    assert result["items"][str(membro_fix.id)]["nome"] == membro_fix.nome
+    assert "subgrupos" in result["items"][str(membro_fix.id)]
+    assert result["items"]["999999"] is None
+    assert result["not_found"] == [999999]
+
+    response = await client.get(f"{API_PREFIX}/?ids=1,abc")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,220 @@
+import asyncio
+import pytest
+
+from app.utils.metrics import MetricsSampler
+
+# Marca todos os testes neste arquivo para usar pytest-asyncio
+pytestmark = pytest.mark.asyncio
+
+
+async def test_sampler_latest_without_task():
+    """Sem a task ativa, latest() coleta uma amostra na hora."""
+    sampler = MetricsSampler(interval=60, buffer_size=5)
+    snapshot = sampler.latest()
+
+    assert "cpu" in snapshot
+    assert "process" in snapshot
+    assert len(sampler.buffer) == 1
+    # Chamadas seguintes reaproveitam a amostra existente
+    assert sampler.latest() is snapshot
+
+
+async def test_sampler_ring_buffer():
+    """O buffer mantém apenas as últimas amostras."""
+    sampler = MetricsSampler(interval=60, buffer_size=3)
+    for _ in range(5):
+        sampler.sample()
+
+    assert len(sampler.buffer) == 3
+    assert len(sampler.samples(limit=2)) == 2
+    assert sampler.samples()[-1] is sampler.latest()
+
+
+async def test_sampler_background_task():
+    """A task em segundo plano preenche o buffer e é encerrada no stop()."""
+    sampler = MetricsSampler(interval=0.01, buffer_size=10)
+    sampler.start()
+    assert sampler.running
+
+    for _ in range(100):
+        if len(sampler.buffer) >= 2:
+            break
+        await asyncio.sleep(0.02)
+
+    await sampler.stop()
+    assert not sampler.running
+    assert len(sampler.buffer) >= 2
+
+
+async def test_sql_instrumentation_counts_queries():
+    """Os hooks contam statements por contexto e detectam formatos repetidos."""
+    from sqlalchemy import text
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from app.utils import sql_instrumentation
+    from app.utils.sql_instrumentation import QueryStats, query_stats
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    sql_instrumentation.install(engine, slow_query_ms=10_000)
+
+    stats = QueryStats()
+    token = query_stats.set(stats)
+    try:
+        async with engine.connect() as conn:
+            for i in range(6):
+                await conn.execute(text("SELECT :value"), {"value": i})
+    finally:
+        query_stats.reset(token)
+        await engine.dispose()
+
+    assert stats.count == 6
+    assert stats.duration > 0
+    assert stats.repeated(5) == [("SELECT ?", 6)]
+
+
+async def test_normalize_sql():
+    """Literais, parâmetros e listas de IN são normalizados."""
+    from app.utils.sql_instrumentation import normalize_sql
+
+    assert normalize_sql("SELECT * FROM membros WHERE id = 42") == "SELECT * FROM membros WHERE id = ?"
+    assert normalize_sql("SELECT 1 WHERE nome = 'Ana'  AND x IN ($1, $2, $3)") == (
+        "SELECT ? WHERE nome = ? AND x IN (?...)"
+    )
+
+
+async def test_sampler_fans_out_one_event():
+    """Todos os assinantes recebem o mesmo evento serializado uma única vez."""
+    sampler = MetricsSampler(interval=0.01, buffer_size=5)
+    calls = []
+
+    async def fake_check():
+        calls.append(1)
+
+    sampler.add_check("database", fake_check)
+    first, second = sampler.subscribe(), sampler.subscribe()
+    sampler.start()
+    try:
+        event_a = await asyncio.wait_for(first.get(), timeout=5)
+        event_b = await asyncio.wait_for(second.get(), timeout=5)
+    finally:
+        await sampler.stop()
+        sampler.unsubscribe(first)
+        sampler.unsubscribe(second)
+
+    assert event_a.startswith(b"data: ")
+    assert event_a.endswith(b"\n\n")
+    assert b'"database": "healthy"' in event_a
+    assert b'"metrics"' in event_a
+    assert calls
+    assert event_b.startswith(b"data: ")
+
+
+async def test_timeseries_rollups():
+    """Pontos são agregados (média) por resolução e filtrados pelo intervalo."""
+    import time
+    from app.utils.timeseries import TimeSeriesStore
+
+    store = TimeSeriesStore()
+    now = time.time()
+    base = now - now % 60 - 120  # início de um minuto, 2 minutos atrás
+    for i in range(120):
+        store.record({"cpu": 10.0 if i < 60 else 30.0}, ts=base + i)
+
+    per_second = store.query(["cpu"], 3600, "1s")["cpu"]
+    per_minute = store.query(["cpu"], 3600, "1m")["cpu"]
+
+    assert len(per_second) == 120
+    assert [value for _, value in per_minute] == [10.0, 30.0]
+    assert store.choose_resolution(3600) == "1s"
+    assert store.choose_resolution(86400) == "1m"
+
+
+async def test_timeseries_persistence(tmp_path):
+    """O histórico sobrevive a um novo store apontando para o mesmo arquivo."""
+    import time
+    from app.utils.timeseries import TimeSeriesStore
+
+    path = str(tmp_path / "history.db")
+    store = TimeSeriesStore(path=path)
+    now = time.time()
+    for i in range(5):
+        store.record({"memory": float(i)}, ts=now - 10 + i)
+    store.flush()
+
+    restored = TimeSeriesStore(path=path)
+    restored.load()
+    points = restored.query(["memory"], 60, "1s")["memory"]
+    assert [value for _, value in points] == [0.0, 1.0, 2.0, 3.0]
+
+
+async def test_timeseries_persistence_per_worker(tmp_path, monkeypatch):
+    """Workers forkados do mesmo master não sobrescrevem os pontos uns dos outros."""
+    import os
+    import sqlite3
+    import time
+    from app.utils.timeseries import TimeSeriesStore
+
+    path = str(tmp_path / "history.db")
+    # Com preload_app, os stores são criados no master, antes do fork
+    stores = {101: TimeSeriesStore(path=path), 102: TimeSeriesStore(path=path)}
+
+    now = time.time()
+    base = now - now % 1 - 10
+    for (pid, store), rss in zip(stores.items(), (100.0, 300.0)):
+        monkeypatch.setattr(os, "getpid", lambda pid=pid: pid)
+        for i in range(3):
+            store.record({"process_memory_mb": rss}, ts=base + i)
+        store.flush()
+
+    conn = sqlite3.connect(path)
+    assert conn.execute("SELECT DISTINCT worker FROM metrics_history ORDER BY worker").fetchall() == [(101,), (102,)]
+    conn.close()
+
+    restored = TimeSeriesStore(path=path)
+    restored.load()
+    points = restored.query(["process_memory_mb"], 60, "1s")["process_memory_mb"]
+    assert [value for _, value in points] == [200.0, 200.0]
+
+
+async def test_health_history_endpoint(client):
+    """GET /health/history valida séries e intervalo."""
+    response = await client.get("/health/history?series=cpu,memory&range=15m")
+    assert response.status_code == 200
+    result = response.json()
+    assert result["resolution"] == "1s"
+    assert set(result["series"]) == {"cpu", "memory"}
+
+    response = await client.get("/health/history?series=inexistente")
+    assert response.status_code == 400
+    response = await client.get("/health/history?range=abc")
+    assert response.status_code == 400
+
+
+async def test_instrumented_pool_records_checkouts(tmp_path):
+    """O pool instrumentado mede checkouts e tempo de vida das conexões."""
+    from sqlalchemy import text
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from app.utils.pool_metrics import InstrumentedAsyncQueuePool, instrument_pool, pool_stats
+
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=2,
+        max_overflow=0,
+    )
+    instrument_pool(engine.sync_engine.pool)
+    checkouts, opened = pool_stats.checkouts, pool_stats.connections_opened
+
+    for _ in range(3):
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    snapshot = pool_stats.snapshot(engine.sync_engine.pool)
+    assert pool_stats.checkouts - checkouts == 3
+    assert pool_stats.connections_opened - opened == 1
+    assert snapshot["waiting"] == 0
+    assert snapshot["checked_out"] == 0
+    assert snapshot["size"] == 2
+
+    closed = pool_stats.connections_closed
+    await engine.dispose()
+    assert pool_stats.connections_closed - closed == 1
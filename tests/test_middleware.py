@@ -0,0 +1,278 @@
+import asyncio
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.middleware.compression import CompressionMiddleware
+from app.middleware.load_shedding import LoadSheddingMiddleware
+from app.middleware.single_flight import SingleFlightMiddleware
+from app.utils.compression import CompressedBodyCache, negotiate
+from app.utils.load_shedding import LoadShedder, LoopLagMonitor
+
+# Marca todos os testes neste arquivo para usar pytest-asyncio
+pytestmark = pytest.mark.asyncio
+
+
+def make_counting_app(delay: float = 0.05):
+    """App ASGI mínimo que conta quantas vezes foi executado."""
+    calls = []
+
+    async def app(scope, receive, send):
+        calls.append(scope["query_string"])
+        await asyncio.sleep(delay)
+        body = f"call {len(calls)}".encode()
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"text/plain"), (b"content-length", str(len(body)).encode())],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    return app, calls
+
+
+async def test_single_flight_coalesces_identical_gets():
+    """GETs idênticos concorrentes executam a rota uma única vez"""
+    app, calls = make_counting_app()
+    transport = ASGITransport(app=SingleFlightMiddleware(app))
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        # A ordem dos parâmetros não importa
+        urls = ["/publicacoes/1?a=1&b=2", "/publicacoes/1?b=2&a=1"] * 5
+        responses = await asyncio.gather(*(client.get(url) for url in urls))
+
+    assert len(calls) == 1
+    assert {r.text for r in responses} == {"call 1"}
+    assert sum(r.headers.get("x-coalesced") == "1" for r in responses) == len(urls) - 1
+
+
+async def test_single_flight_skips_private_and_excluded_requests():
+    """Requisições autenticadas e paths excluídos nunca são coalescidos"""
+    app, calls = make_counting_app()
+    transport = ASGITransport(app=SingleFlightMiddleware(app, excluded_paths=["/metrics"]))
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        await asyncio.gather(
+            *(client.get("/publicacoes/1", headers={"Authorization": "Bearer x"}) for _ in range(3)),
+            *(client.get("/metrics") for _ in range(3)),
+        )
+        assert len(calls) == 6
+
+        # Requisições sequenciais não reaproveitam a resposta anterior
+        await client.get("/publicacoes/1")
+        await client.get("/publicacoes/1")
+        assert len(calls) == 8
+
+
+async def test_single_flight_does_not_buffer_streamed_responses():
+    """Respostas sem Content-Length (streaming) não são compartilhadas"""
+    calls = []
+
+    async def app(scope, receive, send):
+        calls.append(scope["path"])
+        await asyncio.sleep(0.05)
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"[1,", "more_body": True})
+        await send({"type": "http.response.body", "body": b"2]"})
+
+    transport = ASGITransport(app=SingleFlightMiddleware(app))
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        responses = await asyncio.gather(*(client.get("/publicacoes/?stream=true") for _ in range(3)))
+
+    assert len(calls) == 3
+    assert {r.text for r in responses} == {"[1,2]"}
+    assert not any(r.headers.get("x-coalesced") for r in responses)
+
+
+async def test_load_shedding_rejects_low_priority_routes_when_overloaded():
+    """Sob sobrecarga apenas as rotas de baixa prioridade recebem 503"""
+    app, calls = make_counting_app(delay=0)
+    monitor = LoopLagMonitor()
+    shedder = LoadShedder(
+        monitor,
+        max_loop_lag_ms=100,
+        max_in_flight=0,
+        max_pool_wait_ms=0,
+        low_priority_paths=["*/search*", "/metrics"],
+    )
+    transport = ASGITransport(app=LoadSheddingMiddleware(app, shedder=shedder, retry_after=7))
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        assert (await client.get("/api/v1/publicacoes/search/avancada")).status_code == 200
+
+        monitor.record(0.5)  # 500 ms de atraso no event loop
+        assert shedder.overload_reasons() == ["loop_lag"]
+
+        response = await client.get("/api/v1/publicacoes/search/avancada")
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "7"
+        assert response.json()["error_code"] == "OVERLOADED"
+        assert (await client.get("/metrics")).status_code == 503
+
+        # Detalhes e autenticação continuam sendo atendidos
+        assert (await client.get("/api/v1/publicacoes/1")).status_code == 200
+        assert (await client.post("/api/v1/auth/login")).status_code == 200
+
+    assert len(calls) == 3
+    assert shedder.shed == 2
+    assert shedder.in_flight == 0
+
+    # O atraso registrado decai quando o loop volta ao normal
+    for _ in range(20):
+        monitor.record(0.0)
+    assert shedder.overload_reasons() == []
+
+
+async def test_load_shedding_ignores_long_lived_responses():
+    """SSE e respostas em stream não prendem vagas de in_flight"""
+    shedder = LoadShedder(
+        LoopLagMonitor(),
+        max_loop_lag_ms=0,
+        max_in_flight=1,
+        max_pool_wait_ms=0,
+        excluded_paths=["/health/stream"],
+    )
+    seen = []
+
+    async def app(scope, receive, send):
+        seen.append(shedder.in_flight)
+        headers = [(b"content-type", b"application/json")]
+        if scope["query_string"] != b"stream=true":
+            headers.append((b"content-length", b"2"))
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        seen.append(shedder.in_flight)
+        await send({"type": "http.response.body", "body": b"[]"})
+
+    transport = ASGITransport(app=LoadSheddingMiddleware(app, shedder=shedder))
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        await client.get("/health/stream")
+        await client.get("/api/v1/publicacoes/?stream=true")
+        await client.get("/api/v1/publicacoes/")
+
+    # Excluído: nunca contado; stream: liberado nos cabeçalhos; normal: até o fim
+    assert seen == [0, 0, 1, 0, 1, 1]
+    assert shedder.in_flight == 0
+
+
+async def test_bulkhead_limits_concurrency_and_rejects_overflow():
+    """O grupo executa no máximo N requisições por vez e rejeita além da fila"""
+    from app.middleware.bulkhead import BulkheadMiddleware
+    from app.utils.bulkhead import BulkheadRegistry
+
+    running = 0
+    peak = 0
+
+    async def app(scope, receive, send):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.05)
+        running -= 1
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    registry = BulkheadRegistry.from_config({
+        "search": {"paths": ["*/search*"], "max_concurrent": 2, "max_queue": 2, "queue_timeout": 5},
+    })
+    transport = ASGITransport(app=BulkheadMiddleware(app, registry=registry))
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        responses = await asyncio.gather(*(client.get("/api/v1/search?q=x") for _ in range(6)))
+        statuses = sorted(r.status_code for r in responses)
+        assert statuses == [200, 200, 200, 200, 503, 503]
+        assert peak == 2
+        assert all(r.headers["retry-after"] == "1" for r in responses if r.status_code == 503)
+
+        # Rotas fora dos grupos não são limitadas
+        peak = 0
+        await asyncio.gather(*(client.get("/api/v1/publicacoes/1") for _ in range(6)))
+        assert peak == 6
+
+    snapshot = registry.snapshot()["search"]
+    assert snapshot["rejected"] == 2
+    assert snapshot["active"] == 0 and snapshot["queued"] == 0
+
+
+async def test_bulkhead_groups_match_method_and_query():
+    """Os grupos declarados casam por método, path e parâmetros de query"""
+    from app.core.config import settings
+    from app.utils.bulkhead import BulkheadRegistry
+    from main import app
+
+    registry = BulkheadRegistry.from_config(settings.BULKHEADS)
+
+    def group(method, path, query=b""):
+        bulkhead = registry.match({"method": method, "path": path, "query_string": query})
+        return bulkhead.name if bulkhead else None
+
+    assert group("GET", "/api/v1/publicacoes/search/avancada") == "search"
+    # Todas as rotas de upload registradas no app caem no grupo "uploads"
+    upload_paths = [
+        route.path.replace("{id}", "3")
+        for route in app.routes
+        if "/upload-" in getattr(route, "path", "")
+    ]
+    assert {path.rsplit("/", 1)[-1] for path in upload_paths} == {
+        "upload-image", "upload-foto", "upload-background", "upload-icone", "upload-infografico",
+    }
+    for path in upload_paths:
+        assert group("POST", path) == "uploads", path
+    assert group("GET", "/api/v1/publicacoes/3/upload-image") is None
+    assert group("GET", "/health", b"detailed=true") == "health_detailed"
+    assert group("GET", "/health") is None
+
+
+def make_body_app(body: bytes, content_type: bytes = b"application/json", chunks: int = 1):
+    """App ASGI que responde ``body`` em ``chunks`` partes (streaming se > 1)."""
+
+    async def app(scope, receive, send):
+        headers = [(b"content-type", content_type)]
+        if chunks == 1:
+            headers.append((b"content-length", str(len(body)).encode()))
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        size = -(-len(body) // chunks)
+        for i in range(chunks):
+            part = body[i * size:(i + 1) * size]
+            await send({"type": "http.response.body", "body": part, "more_body": i < chunks - 1})
+
+    return app
+
+
+async def test_compression_negotiates_and_caches_bodies():
+    """Corpos grandes saem comprimidos e são comprimidos uma única vez"""
+    assert negotiate("gzip;q=0.5, deflate", ["br", "gzip"]) == "gzip"
+    assert negotiate("br;q=0, *", ["br", "gzip"]) == "gzip"
+    assert negotiate("identity", ["gzip"]) is None
+
+    body = b'{"items": [' + b",".join(b'{"title": "Publicacao"}' for _ in range(200)) + b"]}"
+    cache = CompressedBodyCache(max_bytes=1024 * 1024)
+    app = CompressionMiddleware(make_body_app(body), minimum_size=100, cache=cache)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        for _ in range(3):
+            response = await client.get("/", headers={"Accept-Encoding": "gzip"})
+            assert response.headers["content-encoding"] == "gzip"
+            assert "Accept-Encoding" in response.headers["vary"]
+            assert int(response.headers["content-length"]) < len(body) / 5
+            assert response.content == body  # httpx descomprime
+
+        plain = await client.get("/", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in plain.headers
+        assert plain.content == body
+
+    assert (cache.misses, cache.hits) == (1, 2)
+
+
+async def test_compression_streams_and_skips_ineligible_responses():
+    """Streaming é comprimido em partes; SSE e corpos pequenos passam intactos"""
+    body = b"[" + b",".join(b'{"id": %d}' % i for i in range(500)) + b"]"
+    streamed = CompressionMiddleware(make_body_app(body, chunks=4), minimum_size=100)
+    async with AsyncClient(transport=ASGITransport(app=streamed), base_url="http://test") as client:
+        response = await client.get("/", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        assert response.content == body
+
+    for app in (
+            make_body_app(body, content_type=b"text/event-stream", chunks=4),
+            make_body_app(b'{"ok": true}'),
+    ):
+        transport = ASGITransport(app=CompressionMiddleware(app, minimum_size=100))
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get("/", headers={"Accept-Encoding": "gzip"})
+            assert "content-encoding" not in response.headers
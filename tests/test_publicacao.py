@@ -233,6 +233,7 @@ async def test_search_publicacoes_avancada(client: AsyncClient, publicacao_fix:
     assert response.status_code == status.HTTP_200_OK
     assert response.json()["total"] == 1
     assert response.json()["items"][0]["title"] == publicacao_fix.title
+    assert response.json()["filters"] == {"query": "Teste", "tipo": None, "year": None}
 
     # Busca sem resultado
     response_fail = await client.get(f"{API_PREFIX}/search/avancada?q=Zebra")
@@ -265,4 +266,167 @@ async def test_get_estatisticas_publicacoes(client: AsyncClient, publicacao_fix:
     result = response.json()
     assert result["total_publicacoes"] > 0
     assert "por_tipo" in result
-    assert "tipos_disponiveis" in result
\ No newline at end of file
+    assert "tipos_disponiveis" in result
+
+async def test_read_publicacoes_sparse_fields(client: AsyncClient, publicacao_fix: Publicacao):
+    """Testa GET /?fields= (só os campos pedidos, id sempre incluído)"""
+    response = await client.get(f"{API_PREFIX}/?fields=title,autores")
+    assert response.status_code == status.HTTP_200_OK
+
+    result = response.json()
+    assert result["total"] >= 1
+    item = result["items"][0]
+    assert set(item) == {"id", "title", "autores"}
+    assert item["autores"][0]["nome"] == "Autor de Teste"
+
+    response = await client.get(f"{API_PREFIX}/{publicacao_fix.id}?fields=image_url")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"id": publicacao_fix.id, "image_url": None}
+
+
+async def test_read_publicacoes_invalid_fields(client: AsyncClient):
+    """Testa GET /?fields= com campo inexistente"""
+    response = await client.get(f"{API_PREFIX}/?fields=title,image_path")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "image_path" in response.json()["detail"]
+
+
+async def test_read_publicacoes_include(client: AsyncClient, publicacao_fix: Publicacao):
+    """Testa GET /?include= (listagens não expandem relações por padrão)"""
+    response = await client.get(f"{API_PREFIX}/")
+    assert response.status_code == status.HTTP_200_OK
+    item = response.json()["items"][0]
+    assert item["title"] == publicacao_fix.title
+    assert "autores" not in item and "subgrupos" not in item
+
+    response = await client.get(f"{API_PREFIX}/?include=autores")
+    item = response.json()["items"][0]
+    assert item["autores"][0]["nome"] == "Autor de Teste"
+    assert "subgrupos" not in item
+
+    # Detalhe continua expandindo todas as relações por padrão
+    response = await client.get(f"{API_PREFIX}/{publicacao_fix.id}?include=subgrupos")
+    assert set(response.json()) >= {"title", "image_url", "subgrupos"}
+    assert "autores" not in response.json()
+
+    response = await client.get(f"{API_PREFIX}/?include=autores,editoras")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "editoras" in response.json()["detail"]
+
+
+async def test_read_publicacoes_batch_ids(client: AsyncClient, publicacao_fix: Publicacao):
+    """Testa GET /?ids= (busca em lote indexada por ID)"""
+    from app.core.config import settings
+
+    response = await client.get(f"{API_PREFIX}/?ids={publicacao_fix.id},999999&fields=title,autores")
+    assert response.status_code == status.HTTP_200_OK
+
+    result = response.json()
+    assert result["items"][str(publicacao_fix.id)] == {
+        "id": publicacao_fix.id,
+        "title": publicacao_fix.title,
+        "autores": [{"id": publicacao_fix.autores[0].id, "nome": "Autor de Teste"}],
+    }
+    assert result["items"]["999999"] is None
+    assert result["not_found"] == [999999]
+
+    # Sem fields/include, os itens trazem só os campos simples
+    response = await client.get(f"{API_PREFIX}/?ids={publicacao_fix.id}")
+    item = response.json()["items"][str(publicacao_fix.id)]
+    assert item["title"] == publicacao_fix.title
+    assert "autores" not in item and "subgrupos" not in item
+    assert response.json()["not_found"] == []
+
+    too_many = ",".join(str(i) for i in range(1, settings.BATCH_MAX_IDS + 2))
+    response = await client.get(f"{API_PREFIX}/?ids={too_many}")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    response = await client.get(f"{API_PREFIX}/?ids=")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+async def test_read_publicacoes_openapi(client: AsyncClient):
+    """Testa o OpenAPI da listagem: página padrão no schema, variantes na descrição"""
+    response = await client.get("/api/v1/openapi.json")
+    spec = response.json()
+    ok = spec["paths"][f"{API_PREFIX}/"]["get"]["responses"]["200"]
+    assert ok["content"]["application/json"]["schema"] == {"$ref": "#/components/schemas/PublicacaoPage_Publicacao_"}
+    assert "ids" in ok["description"] and "stream=true" in ok["description"]
+
+    page = spec["components"]["schemas"]["PublicacaoPage_Publicacao_"]
+    assert "facets" in page["properties"]
+    item = spec["components"]["schemas"]["Publicacao"]
+    assert "autores" not in item["properties"] and "image_url" in item["properties"]
+
+
+async def test_read_publicacoes_facets(
+        client: AsyncClient, db: AsyncSession, publicacao_fix: Publicacao, subgrupo_fix: Subgrupo
+):
+    """Testa GET /?facets=true (contagens por tipo, ano e subgrupo)"""
+    from app.utils.ttl_cache import facet_cache
+
+    facet_cache.clear()
+    db.add_all([
+        Publicacao(title="Livro A", type=TipoPublicacaoEnum.LIVRO, year=date(2024, 1, 1), subgrupos=[subgrupo_fix]),
+        Publicacao(title="Livro B", type=TipoPublicacaoEnum.LIVRO, year=date(2025, 6, 1)),
+    ])
+    await db.commit()
+
+    response = await client.get(f"{API_PREFIX}/?facets=true&limit=1")
+    assert response.status_code == status.HTTP_200_OK
+    facets = response.json()["facets"]
+    assert facets["tipo"] == [
+        {"value": "livro", "label": None, "count": 2},
+        {"value": "Artigo", "label": None, "count": 1},
+    ]
+    assert facets["year"] == [
+        {"value": 2025, "label": None, "count": 2},
+        {"value": 2024, "label": None, "count": 1},
+    ]
+    assert facets["subgrupo"] == [{"value": subgrupo_fix.id, "label": subgrupo_fix.nome_grupo, "count": 2}]
+
+    # Facetas seguem o filtro da página
+    response = await client.get(f"{API_PREFIX}/?facets=true&tipo=livro&fields=title")
+    facets = response.json()["facets"]
+    assert [bucket["value"] for bucket in facets["tipo"]] == ["livro"]
+    assert facets["subgrupo"][0]["count"] == 1
+
+    response = await client.get(f"{API_PREFIX}/")
+    assert response.json()["facets"] is None
+    response = await client.get(f"{API_PREFIX}/?fields=title")
+    assert response.json()["facets"] is None
+
+    # Escritas esvaziam o cache: facetas e página continuam coerentes
+    db.add(Publicacao(title="Livro C", type=TipoPublicacaoEnum.LIVRO, year=date(2024, 3, 1)))
+    await db.commit()
+    response = await client.get(f"{API_PREFIX}/?facets=true&limit=1")
+    result = response.json()
+    assert result["total"] == 4
+    assert result["facets"]["tipo"][0] == {"value": "livro", "label": None, "count": 3}
+
+    subgrupo_fix.nome_grupo = "Subgrupo Renomeado"
+    await db.commit()
+    response = await client.get(f"{API_PREFIX}/?facets=true")
+    assert response.json()["facets"]["subgrupo"][0]["label"] == "Subgrupo Renomeado"
+
+
+async def test_read_publicacoes_stream(client: AsyncClient, db: AsyncSession, publicacao_fix: Publicacao):
+    """Testa GET /?stream=true (array JSON em partes, sem paginação)"""
+    db.add_all([
+        Publicacao(title=f"Exportação {i}", type=TipoPublicacaoEnum.LIVRO, year=date(2024, 1, 1))
+        for i in range(3)
+    ])
+    await db.commit()
+
+    response = await client.get(f"{API_PREFIX}/?stream=true&fields=title&limit=2")
+    assert response.status_code == status.HTTP_200_OK
+    assert "content-length" not in response.headers
+    result = response.json()
+    assert isinstance(result, list)
+    assert len(result) == 4
+    assert set(result[0]) == {"id", "title"}
+
+    response = await client.get(f"{API_PREFIX}/?stream=true&tipo=livro&include=autores")
+    result = response.json()
+    assert [item["title"] for item in result] == ["Exportação 0", "Exportação 1", "Exportação 2"]
+    assert all(item["autores"] == [] for item in result)
@@ -0,0 +1,106 @@
+import pytest
+from httpx import AsyncClient
+from fastapi import status
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import date
+
+from app.models.membro import Membro
+from app.models.subgrupo import Subgrupo
+from app.models.publicacao import Publicacao, TipoPublicacaoEnum
+from app.utils.autocomplete import PrefixIndex, autocomplete_index
+
+API_PREFIX = "/api/v1/search"
+
+# Marca todos os testes neste arquivo para usar pytest-asyncio
+pytestmark = pytest.mark.asyncio
+
+
+async def test_global_search(client: AsyncClient, db: AsyncSession):
+    """Testa GET /search?q= (uma consulta, resultados tipados e ordenados)"""
+    db.add_all([
+        Membro(nome="Ana Saúde", descricao="Pesquisadora"),
+        Membro(nome="Bruno", descricao="Trabalha com políticas de saúde pública no SUS"),
+        Subgrupo(nome_grupo="Saúde Coletiva", descricao="Grupo de saúde"),
+        *[
+            Publicacao(
+                title=f"Saúde {i}",
+                type=TipoPublicacaoEnum.ARTIGO,
+                year=date(2024, 1, 1),
+            )
+            for i in range(4)
+        ],
+        Publicacao(title="Educação", description="Sem relação", type=TipoPublicacaoEnum.LIVRO),
+    ])
+    await db.commit()
+
+    response = await client.get(f"{API_PREFIX}/?q=saúde&limit=3")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["cache-control"].startswith("public")
+
+    result = response.json()
+    assert result["totals"] == {"membro": 2, "subgrupo": 1, "publicacao": 4}
+    hits = result["hits"]
+    assert sum(hit["type"] == "publicacao" for hit in hits) == 3
+    assert [hit["rank"] for hit in hits] == sorted((hit["rank"] for hit in hits), reverse=True)
+
+    bruno = next(hit for hit in hits if hit["title"] == "Bruno")
+    assert bruno["rank"] == 1
+    assert "saúde pública" in bruno["snippet"]
+
+
+async def test_global_search_escapes_wildcards(client: AsyncClient, db: AsyncSession):
+    """Curingas do LIKE no termo são tratados como texto"""
+    db.add(Membro(nome="Carla"))
+    await db.commit()
+
+    response = await client.get(f"{API_PREFIX}/?q=%25%25")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["hits"] == []
+
+
+async def test_prefix_index():
+    """Prefixos de palavras, sem acentos, com os que começam pela consulta primeiro"""
+    index = PrefixIndex()
+    index.build([(1, "Ana Silva"), (2, "Silvana Araújo"), (3, "João Silveira"), (4, None)])
+
+    assert index.search("sil") == [(2, "Silvana Araújo"), (1, "Ana Silva"), (3, "João Silveira")]
+    assert index.search("sil ana") == [(1, "Ana Silva")]
+    assert index.search("ARAUJO") == [(2, "Silvana Araújo")]
+    assert index.search("joao s", limit=1) == [(3, "João Silveira")]
+
+    index.add(1, "Ana Souza")
+    index.remove(3)
+    assert index.search("sil") == [(2, "Silvana Araújo")]
+    assert index.search("sou") == [(1, "Ana Souza")]
+    assert len(index) == 2
+
+
+async def test_autocomplete_follows_writes(client: AsyncClient, db: AsyncSession):
+    """Testa GET /autocomplete (índice atualizado pelos commits)"""
+    membro = Membro(nome="Márcia Ribeiro")
+    db.add(membro)
+    await db.commit()
+    await autocomplete_index.rebuild(db)
+
+    response = await client.get("/api/v1/autocomplete/?q=marc")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == [{"id": membro.id, "label": "Márcia Ribeiro"}]
+
+    autocomplete_index.install()
+    db.add(Publicacao(title="Marcos regulatórios", type=TipoPublicacaoEnum.ARTIGO))
+    membro.nome = "Márcia Ribeiro Costa"
+    await db.commit()
+    response = await client.get("/api/v1/autocomplete/?q=costa")
+    assert response.json() == [{"id": membro.id, "label": "Márcia Ribeiro Costa"}]
+    response = await client.get("/api/v1/autocomplete/?q=marc&type=publicacao")
+    assert [item["label"] for item in response.json()] == ["Marcos regulatórios"]
+
+    # Alterações desfeitas não entram no índice
+    membro.nome = "Outro Nome"
+    await db.flush()
+    await db.rollback()
+    assert autocomplete_index.search("membro", "outro") == []
+
+    await db.delete(membro)
+    await db.commit()
+    assert autocomplete_index.search("membro", "marc") == []
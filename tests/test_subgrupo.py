@@ -87,6 +87,45 @@ async def test_read_subgrupos_pagination(client: AsyncClient, db: AsyncSession):
     assert result["total"] == 5
     assert result["has_next"] is True
 
+    # O cursor retornado aponta para a página seguinte
+    response = await client.get(f"{API_PREFIX}/?limit=2&cursor={result['cursor']}")
+    next_page = response.json()
+    assert next_page["skip"] == 2
+    assert [s["id"] for s in next_page["items"]] != [s["id"] for s in result["items"]]
+
+    response = await client.get(f"{API_PREFIX}/?limit=2&cursor={next_page['cursor']}")
+    last_page = response.json()
+    assert len(last_page["items"]) == 1
+    assert last_page["has_next"] is False
+    assert last_page["cursor"] is None
+
+    response = await client.get(f"{API_PREFIX}/?cursor=invalido")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+async def test_read_subgrupos_batch_ids(client: AsyncClient, subgrupo_com_membros_fix: Subgrupo):
+    """Testa GET /?ids= (busca em lote indexada por ID)"""
+    from app.core.config import settings
+
+    subgrupo_id = subgrupo_com_membros_fix.id
+    response = await client.get(f"{API_PREFIX}/?ids=999999,{subgrupo_id},{subgrupo_id}&include=membros")
+    assert response.status_code == status.HTTP_200_OK
+
+    result = response.json()
+    assert list(result["items"]) == ["999999", str(subgrupo_id)]
+    assert result["items"][str(subgrupo_id)]["nome_grupo"] == subgrupo_com_membros_fix.nome_grupo
+    assert result["items"][str(subgrupo_id)]["membros"][0]["nome"] == "João Silva"
+    assert "publicacoes" not in result["items"][str(subgrupo_id)]
+    assert result["items"]["999999"] is None
+    assert result["not_found"] == [999999]
+
+    too_many = ",".join(str(i) for i in range(1, settings.BATCH_MAX_IDS + 2))
+    response = await client.get(f"{API_PREFIX}/?ids={too_many}")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    response = await client.get(f"{API_PREFIX}/?ids=1,abc")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
 
 async def test_create_subgrupo(auth_client: AsyncClient):
     """Testa POST / (Criar Subgrupo)"""